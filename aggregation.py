@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming aggregation of analysis results for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Summarizes a batch as it is analyzed: numbers per country, carrier, number type,
+country code and time zone, histograms of national number lengths and zone
+counts, and the invalid rate. Results are counted one at a time and dropped, so
+memory depends on the number of distinct values, not on the batch size. The
+number of distinct numbers can be estimated with a fixed-size HyperLogLog sketch.
+"""
+
+import math
+import hashlib
+from collections import Counter
+
+# HyperLogLog registers are 2**precision bytes; the relative error is about 1.04 / sqrt(2**precision)
+DEFAULT_HLL_PRECISION = 14
+
+# Counted dimensions and the basic_info key holding their value (lists count each item)
+DIMENSIONS = (
+    ('country', 'country'),
+    ('carrier', 'carrier'),
+    ('number_type', 'number_type'),
+    ('country_code', 'country_code'),
+    ('time_zone', 'time_zones'),
+)
+
+# Histograms of small integers computed from basic_info
+HISTOGRAMS = (
+    ('national_number_length', lambda info: len(str(info['national_number'])) if 'national_number' in info else None),
+    ('time_zone_count', lambda info: len(info['time_zones']) if isinstance(info.get('time_zones'), list) else None),
+)
+
+# Value counted when a dimension is missing or empty
+UNKNOWN = 'Unknown'
+
+
+class HyperLogLog:
+    """Approximate distinct counter of strings in 2**precision bytes"""
+
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value):
+        """Count a string"""
+        digest = int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+        index = digest >> (64 - self.precision)
+        rest = digest & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Add the values counted by another sketch of the same precision"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precisions")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self):
+        """Estimated number of distinct values counted"""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0 ** -rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return round(size * math.log(size / zeros))
+        return round(raw)
+
+
+class ResultAggregator:
+    """Incremental counters and histograms over (phone_number, results) pairs"""
+
+    def __init__(self, distinct=False, precision=DEFAULT_HLL_PRECISION):
+        """
+        Args:
+            distinct: Estimate the number of distinct numbers with a HyperLogLog sketch
+            precision: Precision of the sketch (see DEFAULT_HLL_PRECISION)
+        """
+        self.total = 0
+        self.valid = 0
+        self.counts = {name: Counter() for name, _ in DIMENSIONS}
+        self.histograms = {name: Counter() for name, _ in HISTOGRAMS}
+        self.distinct = HyperLogLog(precision) if distinct else None
+
+    @property
+    def invalid(self):
+        return self.total - self.valid
+
+    @property
+    def invalid_rate(self):
+        return self.invalid / self.total if self.total else 0.0
+
+    def add(self, phone_number, results):
+        """Count the results of one number (None if it is invalid)"""
+        self.total += 1
+        info = results.get('basic_info') if results is not None else None
+        if self.distinct is not None:
+            # Valid numbers are identified by country code and national number, so
+            # different spellings of one number are counted once
+            if info and 'country_code' in info and 'national_number' in info:
+                self.distinct.add(f"+{info['country_code']}{info['national_number']}")
+            else:
+                self.distinct.add(phone_number)
+        if results is None:
+            return
+        self.valid += 1
+        if not info:
+            return
+        for name, key in DIMENSIONS:
+            value = info.get(key)
+            values = value if isinstance(value, list) else [value]
+            for item in values or [None]:
+                self.counts[name][UNKNOWN if item is None or item == '' else str(item)] += 1
+        for name, function in HISTOGRAMS:
+            value = function(info)
+            if value is not None:
+                self.histograms[name][value] += 1
+
+    def extend(self, pairs):
+        """Count every (phone_number, results) pair of an iterable"""
+        for phone_number, results in pairs:
+            self.add(phone_number, results)
+        return self
+
+    def merge(self, other):
+        """Add the counts of another aggregator (e.g. of another part of the batch)"""
+        self.total += other.total
+        self.valid += other.valid
+        for name, counts in other.counts.items():
+            self.counts[name].update(counts)
+        for name, counts in other.histograms.items():
+            self.histograms[name].update(counts)
+        if self.distinct is not None and other.distinct is not None:
+            self.distinct.merge(other.distinct)
+        return self
+
+    def summary(self):
+        """Return the aggregates as a JSON-serializable dictionary
+
+        Counts are ordered from the most to the least common value, histograms
+        by bucket.
+        """
+        summary = {
+            'total': self.total,
+            'valid': self.valid,
+            'invalid': self.invalid,
+            'invalid_rate': round(self.invalid_rate, 6),
+        }
+        if self.distinct is not None:
+            summary['distinct_numbers_estimate'] = self.distinct.estimate()
+        summary['counts'] = {name: dict(counts.most_common()) for name, counts in self.counts.items()}
+        summary['histograms'] = {name: {str(bucket): counts[bucket] for bucket in sorted(counts)}
+                                 for name, counts in self.histograms.items()}
+        return summary
+
+    def rows(self):
+        """Yield the aggregates as (metric, value, count, share) rows for a CSV summary
+
+        Shares are relative to all numbers for the totals and to valid numbers
+        for the counts and histograms.
+        """
+        yield 'total', '', self.total, 1.0 if self.total else 0.0
+        yield 'valid', '', self.valid, round(self.valid / self.total, 6) if self.total else 0.0
+        yield 'invalid', '', self.invalid, round(self.invalid_rate, 6)
+        if self.distinct is not None:
+            yield 'distinct_numbers_estimate', '', self.distinct.estimate(), ''
+        summary = self.summary()
+        for group in ('counts', 'histograms'):
+            for name, counts in summary[group].items():
+                for value, count in counts.items():
+                    yield name, value, count, round(count / self.valid, 6) if self.valid else 0.0
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asynchronous analysis engine for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Runs the network-bound stages (online geocoding and online database searches)
+of many analyses concurrently, while the CPU-only stages stay synchronous.
+"""
+
+import time
+import asyncio
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from rate_limit import TokenBucket
+from zone_clock import ZoneClock
+
+# Default maximum number of network stages in flight at once
+DEFAULT_CONCURRENCY = 32
+
+
+@contextmanager
+def host_rate_limits(tool, rate_limits):
+    """Limit the tool's requests to each host of ``rate_limits`` until the block exits
+
+    Each host gets one TokenBucket, shared by the geocoder and every online
+    provider whose endpoint is on that host. The tool's own limiters are
+    restored afterwards, so the limits only apply to one run.
+    """
+    limiters = {host: TokenBucket(rate) for host, rate in (rate_limits or {}).items()}
+    if not limiters:
+        yield
+        return
+    search = tool.online_search
+    geocode_limiter = tool.geocode_limiter
+    provider_limiters = dict(search.limiters) if search is not None else None
+    try:
+        if tool.geolocator is not None and tool.geolocator.domain in limiters:
+            tool.geocode_limiter = limiters[tool.geolocator.domain]
+        if search is not None:
+            for provider in search.providers:
+                if provider.host in limiters:
+                    search.limiters[provider.name] = limiters[provider.host]
+        yield
+    finally:
+        tool.geocode_limiter = geocode_limiter
+        if search is not None:
+            search.limiters.clear()
+            search.limiters.update(provider_limiters)
+
+
+async def analyze_many_async(tool, phone_numbers, concurrency=DEFAULT_CONCURRENCY, rate_limits=None):
+    """Analyze many phone numbers, overlapping their network stages
+
+    Args:
+        tool: The PhoneInfoTool whose stages are run
+        phone_numbers: Iterable of phone numbers to analyze
+        concurrency: Maximum number of network stages running at once
+        rate_limits: Mapping of host name to allowed requests per second for
+            this run, applied to the geocoder and the online providers on that
+            host (see host_rate_limits). Requests are limited where they are
+            sent (PhoneInfoTool.geocode and OnlineDatabaseSearch.query), so
+            stages answered offline or from a cache never wait.
+
+    Returns:
+        List of AnalysisResult objects in input order
+    """
+    with host_rate_limits(tool, rate_limits):
+        return await _analyze_many(tool, phone_numbers, concurrency)
+
+
+async def _analyze_many(tool, phone_numbers, concurrency):
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    numbers = enumerate(phone_numbers)
+    clock = ZoneClock.snapshot()
+    results = []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        async def run_network_stage(stage, context, timings):
+            """Run a blocking network stage in the executor within the concurrency limit"""
+            async with semaphore:
+                return await loop.run_in_executor(executor, tool.run_stage, stage, context, timings)
+
+        async def analyze(phone_number):
+            """Analyze one number: CPU stages inline, network stages concurrently"""
+            start = time.perf_counter()
+            context = tool.validated_context(phone_number)
+            if not context:
+                return tool._invalid_lookup(phone_number, start)
+            context.clock = clock
+
+            # Sections found in the result cache skip their stage, network ones included
+            cache = tool.result_cache
+            sections = cache.get(context.e164) if cache is not None else {}
+            computed = {}
+            timings = tool._start_timings(start)
+            network_stages = []
+            for stage in tool.stages:
+                if stage.section in sections:
+                    continue
+                if tool.uses_network(stage):
+                    context.prepare(stage.requires)
+                    network_stages.append(stage)
+                else:
+                    computed[stage.section] = tool.run_stage(stage, context, timings)
+
+            answers = await asyncio.gather(*(
+                run_network_stage(stage, context, timings) for stage in network_stages
+            ))
+            computed.update(zip((stage.section for stage in network_stages), answers))
+            result, fresh = tool._finish_lookup(phone_number, sections, computed, start, timings)
+            if fresh:
+                cache.set(context.e164, fresh)
+            return result
+
+        async def worker():
+            """Analyze numbers from the shared input until it is exhausted"""
+            for index, phone_number in numbers:
+                result = await analyze(phone_number)
+                if index >= len(results):
+                    results.extend([None] * (index + 1 - len(results)))
+                results[index] = result
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return results
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Background batch jobs for the Phone Information Gathering Tool GUI
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+A JobManager runs file-based batch jobs one after another on a background
+thread, each analyzing its numbers with PhoneInfoTool.iter_batch (a process
+pool). Results are posted in small groups to a thread-safe queue that the GUI
+drains from its own loop (Tk's root.after), so the interface never waits on an
+analysis. Jobs can be paused, resumed and cancelled; each reports its progress,
+throughput and estimated time left.
+"""
+
+import time
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from phone_info_tool import DEFAULT_CHUNKSIZE, _read_numbers
+from result_writers import open_writer
+
+# Largest number of results posted in one event, and the longest time results wait to be posted
+EVENT_BATCH_SIZE = 500
+EVENT_INTERVAL = 0.2
+
+# Job states
+QUEUED, RUNNING, PAUSED, DONE, CANCELLED, FAILED = 'queued', 'running', 'paused', 'done', 'cancelled', 'failed'
+
+# An event posted by a batch job: kind is 'started', 'results' (``pairs`` holds
+# new (phone_number, results) pairs) or 'finished'. Background tasks post their
+# own kind with ``job`` None and ``pairs`` holding one (key, result) pair.
+JobEvent = namedtuple('JobEvent', ['job', 'kind', 'pairs'])
+
+
+class BatchJob:
+    """State and progress of one batch job; pause(), resume() and cancel() may be called from any thread"""
+
+    def __init__(self, job_id, input_file, output_file=None):
+        self.id = job_id
+        self.input_file = input_file
+        self.output_file = output_file
+        self.state = QUEUED
+        self.total = None
+        self.done = 0
+        self.valid = 0
+        self.error = None
+        self.started = False
+        self._active_time = 0.0
+        self._resumed_at = None
+        self._cancelled = False
+        # Set when the runner skipped the job because it was paused before starting;
+        # resume() and cancel() then hand it back to the manager through _requeue
+        self._deferred = False
+        self._requeue = None
+        self._running = threading.Event()
+        self._running.set()
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self):
+        return self.state in (DONE, CANCELLED, FAILED)
+
+    def pause(self):
+        """Stop taking results until resume(); workers idle once their queued chunks are done
+
+        A job paused before it starts is skipped, and the jobs after it run.
+        """
+        with self._lock:
+            if self.state in (QUEUED, RUNNING):
+                self._stop_clock()
+                self.state = PAUSED
+                self._running.clear()
+
+    def resume(self):
+        with self._lock:
+            if self.state == PAUSED:
+                self.state = RUNNING if self.started else QUEUED
+                if self.started:
+                    self._resumed_at = time.monotonic()
+                self._running.set()
+        self._take_back()
+
+    def cancel(self):
+        """Stop the job; results already posted are kept"""
+        with self._lock:
+            if not self.finished:
+                self._cancelled = True
+                self._running.set()
+        self._take_back()
+
+    def _defer(self):
+        """Mark the job skipped if it is paused and has not started, returning whether it was"""
+        with self._lock:
+            self._deferred = self.state == PAUSED and not self.started and not self._cancelled
+            return self._deferred
+
+    def _take_back(self):
+        with self._lock:
+            deferred, self._deferred = self._deferred, False
+        if deferred:
+            self._requeue(self)
+
+    @property
+    def elapsed(self):
+        """Seconds spent running, excluding pauses"""
+        with self._lock:
+            running = time.monotonic() - self._resumed_at if self._resumed_at is not None else 0.0
+            return self._active_time + running
+
+    @property
+    def throughput(self):
+        """Numbers analyzed per running second"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self):
+        """Estimated seconds left (None until known)"""
+        throughput = self.throughput
+        if self.total is None or not throughput:
+            return None
+        return max(0, self.total - self.done) / throughput
+
+    def _start_clock(self):
+        with self._lock:
+            self.started = True
+            if self.state == QUEUED:
+                self.state = RUNNING
+                self._resumed_at = time.monotonic()
+
+    def _stop_clock(self):
+        if self._resumed_at is not None:
+            self._active_time += time.monotonic() - self._resumed_at
+            self._resumed_at = None
+
+    def _finish(self, state, error=None):
+        with self._lock:
+            self._stop_clock()
+            self.state = state
+            self.error = error
+
+    def __repr__(self):
+        return f"BatchJob({self.id}, {self.input_file!r}, {self.state}, {self.done}/{self.total})"
+
+
+class JobManager:
+    """Runs batch jobs and other tasks in the background, posting JobEvents to ``events``"""
+
+    def __init__(self, tool, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Args:
+            tool: The PhoneInfoTool analyzing the numbers
+            workers: Worker processes of each batch job (default: CPU count)
+            chunksize: Numbers handed to a worker process at a time
+        """
+        self.tool = tool
+        self.workers = workers
+        self.chunksize = chunksize
+        self.events = queue.Queue()
+        self.jobs = []
+        # Batch jobs run one at a time, each on its own process pool
+        self._batch_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch-job')
+        self._task_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui-task')
+        # Futures not yet done, cancelled by shutdown()
+        self._futures = []
+
+    def submit_file(self, input_file, output_file=None):
+        """Queue a job analyzing every number of a file; results are also written to ``output_file`` if given"""
+        job = BatchJob(len(self.jobs) + 1, input_file, output_file)
+        job._requeue = self._queue
+        self.jobs.append(job)
+        self._queue(job)
+        return job
+
+    def _queue(self, job):
+        self._submit(self._batch_runner, self._run, job)
+
+    def submit_lookup(self, phone_number):
+        """Analyze one number in the background; a 'lookup' event carries its AnalysisResult"""
+        self.submit_task('lookup', phone_number, self.tool.lookup, phone_number)
+
+    def submit_task(self, kind, key, function, *args):
+        """Run a function in the background and post JobEvent(None, kind, [(key, result)])
+
+        If the function raises, the exception is posted in place of its result.
+        """
+        def task():
+            try:
+                result = function(*args)
+            except Exception as e:
+                result = e
+            self.events.put(JobEvent(None, kind, [(key, result)]))
+        self._submit(self._task_runner, task)
+
+    def _submit(self, runner, function, *args):
+        self._futures = [future for future in self._futures if not future.done()]
+        self._futures.append(runner.submit(function, *args))
+
+    def poll(self, limit=None):
+        """Return the events posted so far (at most ``limit``) without waiting"""
+        events = []
+        while limit is None or len(events) < limit:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def _run(self, job):
+        # A job paused before it starts is skipped, so the jobs queued after it
+        # can run; resuming or cancelling it queues it again
+        if job._defer():
+            return
+        if job._cancelled:
+            job._finish(CANCELLED)
+            self.events.put(JobEvent(job, 'finished', []))
+            return
+
+        writer = None
+        pending = []
+        posted_at = time.monotonic()
+        try:
+            job.total = sum(1 for _ in _read_numbers(job.input_file))
+            job._start_clock()
+            self.events.put(JobEvent(job, 'started', []))
+            if job.output_file:
+                writer = open_writer(job.output_file)
+            pairs = self.tool.iter_batch(_read_numbers(job.input_file), self.workers, self.chunksize)
+            try:
+                for phone_number, results in pairs:
+                    if not job._running.is_set():
+                        self._post(job, pending)
+                        pending = []
+                        job._running.wait()
+                    if job._cancelled:
+                        break
+                    if writer is not None:
+                        writer.write(phone_number, results)
+                    pending.append((phone_number, results))
+                    job.done += 1
+                    job.valid += results is not None
+                    if len(pending) >= EVENT_BATCH_SIZE or time.monotonic() - posted_at >= EVENT_INTERVAL:
+                        self._post(job, pending)
+                        pending = []
+                        posted_at = time.monotonic()
+            finally:
+                pairs.close()
+            self._post(job, pending)
+            job._finish(CANCELLED if job._cancelled else DONE)
+        except Exception as e:
+            self._post(job, pending)
+            job._finish(FAILED, str(e))
+        finally:
+            if writer is not None:
+                writer.close()
+        self.events.put(JobEvent(job, 'finished', []))
+
+    def _post(self, job, pairs):
+        if pairs:
+            self.events.put(JobEvent(job, 'results', pairs))
+
+    def shutdown(self):
+        """Cancel every job and stop the background threads"""
+        for job in self.jobs:
+            job.cancel()
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in self._futures:
+            future.cancel()
+        self._batch_runner.shutdown(wait=False)
+        self._task_runner.shutdown(wait=False)
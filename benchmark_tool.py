@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Measures how long the tool takes to import in a fresh interpreter and checks
+that no heavy optional dependency is loaded by a plain lookup, so start-up
+regressions of the CLI are caught early.
+
+The suite benchmark runs the analysis stages, full lookups and every export
+format over a reproducible corpus built from the phonenumbers example numbers
+of all regions mixed with malformed inputs, reporting throughput and latency
+percentiles. Results can be saved and compared between versions.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+import phonenumbers
+from phonenumbers import PhoneNumberFormat, PhoneNumberType
+
+# Modules that a plain CLI lookup must not import
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'geopy', 'requests', 'asyncio')
+
+# Default number of fresh interpreters timed per module
+DEFAULT_IMPORT_RUNS = 5
+
+# Snippet run in each fresh interpreter: time the import and list the heavy modules it loaded
+_IMPORT_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module='phone_info_tool', runs=DEFAULT_IMPORT_RUNS, heavy_modules=HEAVY_MODULES):
+    """Import a module in ``runs`` fresh interpreters and summarize the import time
+
+    Returns a dictionary with the median, minimum and maximum import time in
+    seconds and the heavy modules the import loaded.
+    """
+    code = _IMPORT_PROBE.format(module=module, heavy=tuple(heavy_modules))
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        probe = json.loads(output.stdout.strip().splitlines()[-1])
+        timings.append(probe['seconds'])
+        loaded.update(probe['heavy'])
+    return {
+        'module': module,
+        'runs': runs,
+        'median': statistics.median(timings),
+        'min': min(timings),
+        'max': max(timings),
+        'heavy_modules': sorted(loaded)
+    }
+
+
+# Default corpus size and share of invalid inputs of the suite benchmark
+DEFAULT_CORPUS_SIZE = 2000
+DEFAULT_INVALID_RATIO = 0.1
+
+# Number types whose example numbers seed the corpus
+CORPUS_NUMBER_TYPES = (
+    PhoneNumberType.FIXED_LINE, PhoneNumberType.MOBILE, PhoneNumberType.TOLL_FREE,
+    PhoneNumberType.PREMIUM_RATE, PhoneNumberType.SHARED_COST, PhoneNumberType.VOIP,
+    PhoneNumberType.PERSONAL_NUMBER, PhoneNumberType.PAGER, PhoneNumberType.UAN,
+    PhoneNumberType.VOICEMAIL
+)
+
+# Single-number exports benchmarked through PhoneInfoTool.export_results, which
+# are slow enough (pandas) to be timed on a sample of the valid numbers only
+EXPORT_RESULTS_FORMATS = ('json', 'csv', 'excel', 'html')
+EXPORT_RESULTS_SAMPLE = 20
+
+# Legacy stage methods benchmarked on the valid numbers of the corpus
+STAGE_METHODS = ('get_basic_info', 'get_geolocation', 'get_timezone_info')
+
+# Metrics compared between saved results, and whether higher values are better
+COMPARED_METRICS = (('throughput', True), ('p50_ms', False), ('p99_ms', False))
+
+
+def example_numbers():
+    """Return the phonenumbers example numbers of every region and corpus number type"""
+    numbers = []
+    for region in sorted(phonenumbers.SUPPORTED_REGIONS):
+        for number_type in CORPUS_NUMBER_TYPES:
+            example = phonenumbers.example_number_for_type(region, number_type)
+            if example is not None:
+                numbers.append(example)
+    return numbers
+
+
+def _vary(rng, example):
+    """Return a valid number close to an example, changing its last digits when possible"""
+    national = phonenumbers.national_significant_number(example)
+    for _ in range(5):
+        digits = national[:-3] + ''.join(rng.choice('0123456789') for _ in range(min(3, len(national))))
+        candidate = phonenumbers.parse(f"+{example.country_code}{digits}", None)
+        if phonenumbers.is_valid_number(candidate):
+            return candidate
+    return example
+
+
+def _spell(rng, number):
+    """Write a parsed number the way users type it"""
+    style = rng.randrange(3)
+    if style == 0:
+        return phonenumbers.format_number(number, PhoneNumberFormat.E164)
+    if style == 1:
+        return phonenumbers.format_number(number, PhoneNumberFormat.INTERNATIONAL)
+    return "00" + phonenumbers.format_number(number, PhoneNumberFormat.E164)[1:]
+
+
+def _malformed(rng, examples):
+    """Return an input that fails validation"""
+    kind = rng.randrange(5)
+    if kind == 0:
+        return ''.join(rng.choice('0123456789') for _ in range(rng.randint(1, 5)))
+    if kind == 1:
+        return "+" + ''.join(rng.choice('0123456789') for _ in range(rng.randint(17, 20)))
+    if kind == 2:
+        return "+999 " + ''.join(rng.choice('0123456789') for _ in range(8))
+    if kind == 3:
+        return ''.join(rng.choice('abcdefghij-+() ') for _ in range(rng.randint(3, 12)))
+    # A real example with digits missing
+    e164 = phonenumbers.format_number(rng.choice(examples), PhoneNumberFormat.E164)
+    return e164[:max(2, len(e164) // 2)]
+
+
+def build_corpus(size=DEFAULT_CORPUS_SIZE, invalid_ratio=DEFAULT_INVALID_RATIO, seed=0):
+    """Build a reproducible list of ``size`` inputs, about ``invalid_ratio`` of them invalid
+
+    Valid inputs are variations of the example numbers of every region written
+    in E.164, international or "00" form; invalid ones are malformed strings.
+    The same arguments always give the same corpus.
+    """
+    rng = random.Random(seed)
+    examples = example_numbers()
+    invalid_count = round(size * invalid_ratio)
+    corpus = [_spell(rng, _vary(rng, examples[i % len(examples)])) for i in range(size - invalid_count)]
+    corpus += [_malformed(rng, examples) for _ in range(invalid_count)]
+    rng.shuffle(corpus)
+    return corpus
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, items=None):
+    """Summarize per-operation latencies (seconds) as throughput and millisecond percentiles
+
+    ``items`` is the number of items processed when it differs from the
+    number of timed operations (e.g. one export call writing a whole batch).
+    """
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    items = len(ordered) if items is None else items
+    return {
+        'operations': len(ordered),
+        'items': items,
+        'total_s': total,
+        'throughput': items / total if total else 0.0,
+        'mean_ms': 1000 * total / len(ordered) if ordered else 0.0,
+        'p50_ms': 1000 * percentile(ordered, 0.50),
+        'p90_ms': 1000 * percentile(ordered, 0.90),
+        'p99_ms': 1000 * percentile(ordered, 0.99),
+        'max_ms': 1000 * ordered[-1] if ordered else 0.0
+    }
+
+
+def _timed(function, *args):
+    """Call a function, returning its elapsed time in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def benchmark_suite(corpus, workers=1, export_dir=None):
+    """Benchmark the analysis stages, full lookups and exports over a corpus
+
+    Stages run in offline mode. Returns a dictionary of summaries keyed by
+    benchmark name ("stage.get_basic_info", "lookup", "export.parquet"...).
+    """
+    from phone_info_tool import PhoneInfoTool
+    from result_writers import WRITERS, open_writer
+
+    tool = PhoneInfoTool(quiet=True)
+    results = {}
+
+    # Validation of every input, valid or not
+    parsed = []
+    latencies = []
+    for phone_number in corpus:
+        start = time.perf_counter()
+        parsed_number = tool.validate_phone_number(phone_number)
+        latencies.append(time.perf_counter() - start)
+        if parsed_number is not None:
+            parsed.append((phone_number, parsed_number))
+    results['stage.validate_phone_number'] = summarize(latencies)
+
+    # Individual stages on the valid numbers
+    for method in STAGE_METHODS:
+        stage = getattr(tool, method)
+        latencies = []
+        for phone_number, parsed_number in parsed:
+            tool.phone_number, tool.parsed_number = phone_number, parsed_number
+            latencies.append(_timed(stage))
+        results[f'stage.{method}'] = summarize(latencies)
+
+    # Full analyses, one at a time and as a batch
+    results['lookup'] = summarize([_timed(tool.lookup, phone_number) for phone_number in corpus])
+    start = time.perf_counter()
+    pairs = list(tool.iter_batch(corpus, workers))
+    results['batch'] = summarize([time.perf_counter() - start], len(corpus))
+    results['batch']['workers'] = workers
+
+    with tempfile.TemporaryDirectory(dir=export_dir) as directory:
+        # Batch exports through the result writers
+        for format_type in WRITERS:
+            path = os.path.join(directory, f"batch.{format_type}")
+            try:
+                start = time.perf_counter()
+                with open_writer(path, format_type) as writer:
+                    writer.write_all(pairs)
+                elapsed = time.perf_counter() - start
+            except ImportError:
+                continue  # Optional dependency (pyarrow) not installed
+            results[f'export.{format_type}'] = summarize([elapsed], len(pairs))
+            results[f'export.{format_type}']['bytes'] = os.path.getsize(path)
+
+        # Single-number exports through export_results
+        sample = [result for result in (tool.lookup(phone_number) for phone_number, _ in parsed)
+                  if result.valid][:EXPORT_RESULTS_SAMPLE]
+        for format_type in EXPORT_RESULTS_FORMATS:
+            latencies = [_timed(tool.export_results, format_type, os.path.join(directory, f"single_{i}"), result)
+                         for i, result in enumerate(sample)]
+            results[f'export_results.{format_type}'] = summarize(latencies)
+
+    return results
+
+
+def environment():
+    """Describe the interpreter, library versions and source revision of a run"""
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'phonenumbers': phonenumbers.__version__,
+        'revision': revision
+    }
+
+
+def compare(current, baseline):
+    """Return the relative change of the compared metrics of every shared benchmark
+
+    Each entry maps "benchmark.metric" to (baseline, current, change) where a
+    positive change is an improvement.
+    """
+    changes = {}
+    for name, summary in current.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            before, after = previous.get(metric), summary.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            changes[f"{name}.{metric}"] = (before, after, change if higher_is_better else -change)
+    return changes
+
+
+def print_suite(results):
+    """Print the suite summaries as a table"""
+    print(f"{'benchmark':<32} {'items':>7} {'items/s':>11} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+    for name, summary in results.items():
+        print(f"{name:<32} {summary['items']:>7} {summary['throughput']:>11.1f} {summary['p50_ms']:>9.3f} "
+              f"{summary['p90_ms']:>9.3f} {summary['p99_ms']:>9.3f}")
+
+
+def run_suite(args):
+    """Run the suite benchmark from parsed arguments, returning the process exit status"""
+    corpus = build_corpus(args.size, args.invalid_ratio, args.seed)
+    results = benchmark_suite(corpus, args.workers)
+    print_suite(results)
+
+    report = {
+        'environment': environment(),
+        'corpus': {'size': args.size, 'invalid_ratio': args.invalid_ratio, 'seed': args.seed},
+        'results': results
+    }
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+        print(f"[+] Results saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('corpus') != report['corpus']:
+            print("[!] The baseline was measured on a different corpus", file=sys.stderr)
+        print(f"\nChange against {args.compare} (positive is better):")
+        for key, (before, after, change) in compare(results, baseline['results']).items():
+            print(f"  {key:<44} {before:>12.3f} -> {after:>12.3f} ({change:+.1%})")
+    return 0
+
+
+def parse_args(argv=None):
+    """Parse the command line arguments"""
+    parser = argparse.ArgumentParser(description="Phone Information Gathering Tool benchmarks")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    imports = subparsers.add_parser('import', help="Import time of the tool in a fresh interpreter")
+    imports.add_argument('--module', default='phone_info_tool', help="Module to import (default: phone_info_tool)")
+    imports.add_argument('--runs', type=int, default=DEFAULT_IMPORT_RUNS,
+                         help=f"Fresh interpreters to time (default: {DEFAULT_IMPORT_RUNS})")
+    imports.add_argument('--max-seconds', type=float, default=None,
+                         help="Fail when the median import time exceeds this budget")
+
+    suite = subparsers.add_parser('suite', help="Stage, lookup and export benchmarks over a synthetic corpus")
+    suite.add_argument('--size', type=int, default=DEFAULT_CORPUS_SIZE,
+                       help=f"Number of inputs in the corpus (default: {DEFAULT_CORPUS_SIZE})")
+    suite.add_argument('--invalid-ratio', type=float, default=DEFAULT_INVALID_RATIO,
+                       help=f"Share of malformed inputs (default: {DEFAULT_INVALID_RATIO})")
+    suite.add_argument('--seed', type=int, default=0, help="Seed of the corpus generator (default: 0)")
+    suite.add_argument('-w', '--workers', type=int, default=1,
+                       help="Worker processes of the batch benchmark (default: 1)")
+    suite.add_argument('--save', metavar='FILE', help="Save the results as JSON for later comparison")
+    suite.add_argument('--compare', metavar='FILE', help="Compare against results saved with --save")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the selected benchmark, returning the process exit status"""
+    args = parse_args(argv)
+    if args.benchmark == 'suite':
+        return run_suite(args)
+
+    result = measure_import(args.module, args.runs)
+    print(json.dumps(result, indent=4))
+
+    failed = False
+    if result['heavy_modules']:
+        print(f"[!] Importing {args.module} loads {', '.join(result['heavy_modules'])}", file=sys.stderr)
+        failed = True
+    if args.max_seconds is not None and result['median'] > args.max_seconds:
+        print(f"[!] Median import time {result['median']:.3f}s exceeds {args.max_seconds:.3f}s", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compact result storage for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+A results dictionary spends most of its memory on its structure: a dict per
+section, repeated string keys and a boxed object per value. Here a result is
+split into a "shape" (the nested keys, list lengths and value types, shared by
+every result with the same layout) and its flat list of leaf values.
+ResultBatch keeps the leaf values of the results sharing a shape in one
+column per leaf: typed arrays for integers, floats and booleans, and for
+strings either ids into one table of interned strings or, for leaves that are
+mostly unique (formatted numbers, E.164), the strings themselves. Results
+convert back to the exact dictionary they were built from.
+"""
+
+import sys
+from array import array
+
+# Leaf type codes of a shape
+_STRING, _INT, _FLOAT, _BOOL, _NONE, _OBJECT = 's', 'i', 'f', 'b', 'n', 'o'
+
+# Integers stored in the int64 column; larger ones are kept as objects
+_INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+# String values of a leaf sampled before deciding whether to keep interning it,
+# and the share of new strings among them above which the leaf stores plain strings
+INTERN_SAMPLE = 256
+INTERN_MAX_NEW_SHARE = 0.5
+
+
+def shape_of(value, leaves):
+    """Return the shape of a value, appending its leaf values to ``leaves``
+
+    Dicts become ('d', keys, shapes), lists ('l', shapes) and tuples
+    ('t', shapes); leaves are a type code.
+    """
+    if isinstance(value, dict):
+        return ('d', tuple(value), tuple(shape_of(item, leaves) for item in value.values()))
+    if isinstance(value, list):
+        return ('l', tuple(shape_of(item, leaves) for item in value))
+    if isinstance(value, tuple):
+        return ('t', tuple(shape_of(item, leaves) for item in value))
+    if value is None:
+        return _NONE
+    leaves.append(value)
+    if isinstance(value, str):
+        return _STRING
+    if isinstance(value, bool):
+        return _BOOL
+    if isinstance(value, int):
+        return _INT if value in _INT64_RANGE else _OBJECT
+    if isinstance(value, float):
+        return _FLOAT
+    return _OBJECT
+
+
+def build(shape, leaves):
+    """Rebuild the value of a shape from an iterator over its leaf values"""
+    if shape == _NONE:
+        return None
+    if len(shape) == 1:
+        return next(leaves)
+    if shape[0] == 'd':
+        return {key: build(item, leaves) for key, item in zip(shape[1], shape[2])}
+    items = [build(item, leaves) for item in shape[1]]
+    return items if shape[0] == 'l' else tuple(items)
+
+
+def leaf_codes(shape):
+    """Return the type codes of a shape's stored leaves, in order, as a string"""
+    if len(shape) == 1:
+        return '' if shape == _NONE else shape
+    return ''.join(leaf_codes(item) for item in shape[-1])
+
+
+def _new_column(code):
+    """Return an empty column for leaves of a type code"""
+    if code == _BOOL:
+        return bytearray()
+    if code == _OBJECT:
+        return []
+    return array({_STRING: 'L', _INT: 'q', _FLOAT: 'd'}[code])
+
+
+class _ShapeTable:
+    """Leaf columns of the rows sharing one shape"""
+
+    __slots__ = ('shape', 'codes', 'columns', 'new_strings', 'rows')
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.codes = leaf_codes(shape) if shape is not None else ''
+        self.columns = [_new_column(code) for code in self.codes]
+        # Strings first interned by each leaf, counted until its column is sampled
+        self.new_strings = [0] * len(self.codes)
+        self.rows = 0
+
+
+class ResultBatch:
+    """Array-backed container of many analyses
+
+    Behaves like the list returned by PhoneInfoTool.analyze_batch: ``batch[i]``
+    is the results dictionary of the i-th number (None if invalid), rebuilt on
+    access. ``numbers`` lists the numbers and pairs() yields (phone_number,
+    results) pairs for the result writers.
+    """
+
+    def __init__(self, pairs=()):
+        """Create a batch, optionally filled with (phone_number, results) pairs"""
+        self.strings = []
+        self._string_ids = {}
+        self._tables = [_ShapeTable(None)]
+        self._table_ids = {None: 0}
+        self._numbers = []
+        self._row_tables = array('L')
+        self._row_index = array('L')
+        self.extend(pairs)
+
+    def __len__(self):
+        return len(self._row_tables)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.results(row) for row in range(*index.indices(len(self)))]
+        return self.results(index)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.results(row)
+
+    @property
+    def shapes(self):
+        """The distinct result shapes of the batch (None for invalid numbers first)"""
+        return [table.shape for table in self._tables]
+
+    def _intern(self, string):
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return string_id
+
+    def append(self, phone_number, results):
+        """Add the results dictionary of one number (None if it is invalid)"""
+        leaves = []
+        shape = None if results is None else shape_of(results, leaves)
+        table_id = self._table_ids.get(shape)
+        if table_id is None:
+            table_id = self._table_ids[shape] = len(self._tables)
+            self._tables.append(_ShapeTable(shape))
+        table = self._tables[table_id]
+
+        for slot, (code, leaf) in enumerate(zip(table.codes, leaves)):
+            column = table.columns[slot]
+            if code != _STRING or isinstance(column, list):
+                column.append(leaf)
+                continue
+            known = len(self.strings)
+            column.append(self._intern(leaf))
+            if len(column) <= INTERN_SAMPLE:
+                table.new_strings[slot] += len(self.strings) > known
+                if len(column) == INTERN_SAMPLE and table.new_strings[slot] > INTERN_MAX_NEW_SHARE * INTERN_SAMPLE:
+                    # Mostly unique values: keep this leaf's strings in a plain list from now on
+                    table.columns[slot] = [self.strings[string_id] for string_id in column]
+        self._numbers.append(phone_number)
+        self._row_tables.append(table_id)
+        self._row_index.append(table.rows)
+        table.rows += 1
+
+    def extend(self, pairs):
+        """Add every (phone_number, results) pair of an iterable"""
+        for phone_number, results in pairs:
+            self.append(phone_number, results)
+        return self
+
+    def phone_number(self, row):
+        return self._numbers[row]
+
+    @property
+    def numbers(self):
+        """The phone numbers of the batch, in order"""
+        return list(self._numbers)
+
+    def results(self, row):
+        """Rebuild the results dictionary of a row (None for an invalid number)"""
+        row = range(len(self))[row]
+        table = self._tables[self._row_tables[row]]
+        if table.shape is None:
+            return None
+        index = self._row_index[row]
+        leaves = []
+        for code, column in zip(table.codes, table.columns):
+            value = column[index]
+            if code == _STRING and not isinstance(column, list):
+                value = self.strings[value]
+            elif code == _BOOL:
+                value = bool(value)
+            leaves.append(value)
+        return build(table.shape, iter(leaves))
+
+    def pairs(self):
+        """Yield (phone_number, results) pairs in order"""
+        for row in range(len(self)):
+            yield self._numbers[row], self.results(row)
+
+    def nbytes(self):
+        """Approximate memory held by the batch, in bytes"""
+        size = sum(sys.getsizeof(string) for string in self.strings) + sys.getsizeof(self.strings)
+        size += sys.getsizeof(self._string_ids)
+        size += sum(sys.getsizeof(number) for number in self._numbers) + sys.getsizeof(self._numbers)
+        for table in self._tables:
+            for code, column in zip(table.codes, table.columns):
+                size += sys.getsizeof(column)
+                if code == _STRING and isinstance(column, list):
+                    size += sum(sys.getsizeof(string) for string in column)
+        size += sys.getsizeof(self._row_tables) + sys.getsizeof(self._row_index)
+        return size
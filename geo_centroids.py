@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offline geolocation data for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Approximate centroid coordinates (latitude, longitude) for every region code
+supported by the phonenumbers library, so that geolocation does not need a
+network round-trip for each analyzed number.
+"""
+
+import phonenumbers
+from phonenumbers import geocoder
+
+# ISO 3166-1 alpha-2 region code -> (latitude, longitude)
+REGION_CENTROIDS = {
+    'AC': (-7.95, -14.36),  # Ascension Island
+    'AD': (42.5, 1.5),  # Andorra
+    'AE': (24.0, 54.0),  # United Arab Emirates
+    'AF': (33.0, 65.0),  # Afghanistan
+    'AG': (17.05, -61.8),  # Antigua and Barbuda
+    'AI': (18.25, -63.16666666),  # Anguilla
+    'AL': (41.0, 20.0),  # Albania
+    'AM': (40.0, 45.0),  # Armenia
+    'AO': (-12.5, 18.5),  # Angola
+    'AR': (-34.0, -64.0),  # Argentina
+    'AS': (-14.33333333, -170.0),  # American Samoa
+    'AT': (47.33333333, 13.33333333),  # Austria
+    'AU': (-27.0, 133.0),  # Australia
+    'AW': (12.5, -69.96666666),  # Aruba
+    'AX': (60.17, 19.92),  # Åland Islands
+    'AZ': (40.5, 47.5),  # Azerbaijan
+    'BA': (44.0, 18.0),  # Bosnia and Herzegovina
+    'BB': (13.16666666, -59.53333333),  # Barbados
+    'BD': (24.0, 90.0),  # Bangladesh
+    'BE': (50.83333333, 4.0),  # Belgium
+    'BF': (13.0, -2.0),  # Burkina Faso
+    'BG': (43.0, 25.0),  # Bulgaria
+    'BH': (26.0, 50.55),  # Bahrain
+    'BI': (-3.5, 30.0),  # Burundi
+    'BJ': (9.5, 2.25),  # Benin
+    'BL': (17.9, -62.83),  # Saint Barthélemy
+    'BM': (32.33333333, -64.75),  # Bermuda
+    'BN': (4.5, 114.66666666),  # Brunei
+    'BO': (-17.0, -65.0),  # Bolivia
+    'BQ': (12.18, -68.25),  # Bonaire, Sint Eustatius and Saba
+    'BR': (-10.0, -55.0),  # Brazil
+    'BS': (24.25, -76.0),  # Bahamas
+    'BT': (27.5, 90.5),  # Bhutan
+    'BW': (-22.0, 24.0),  # Botswana
+    'BY': (53.0, 28.0),  # Belarus
+    'BZ': (17.25, -88.75),  # Belize
+    'CA': (60.0, -95.0),  # Canada
+    'CC': (-12.5, 96.83333333),  # Cocos Islands
+    'CD': (0.0, 25.0),  # The Democratic Republic Of Congo
+    'CF': (7.0, 21.0),  # Central African Republic
+    'CG': (-1.0, 15.0),  # Congo
+    'CH': (47.0, 8.0),  # Switzerland
+    'CI': (8.0, -5.0),  # Côte d'Ivoire
+    'CK': (-21.23333333, -159.76666666),  # Cook Islands
+    'CL': (-30.0, -71.0),  # Chile
+    'CM': (6.0, 12.0),  # Cameroon
+    'CN': (35.0, 105.0),  # China
+    'CO': (4.0, -72.0),  # Colombia
+    'CR': (10.0, -84.0),  # Costa Rica
+    'CU': (21.5, -80.0),  # Cuba
+    'CV': (16.0, -24.0),  # Cape Verde
+    'CW': (12.17, -68.99),  # Curaçao
+    'CX': (-10.5, 105.66666666),  # Christmas Island
+    'CY': (35.0, 33.0),  # Cyprus
+    'CZ': (49.75, 15.5),  # Czech Republic
+    'DE': (51.0, 9.0),  # Germany
+    'DJ': (11.5, 43.0),  # Djibouti
+    'DK': (56.0, 10.0),  # Denmark
+    'DM': (15.41666666, -61.33333333),  # Dominica
+    'DO': (19.0, -70.66666666),  # Dominican Republic
+    'DZ': (28.0, 3.0),  # Algeria
+    'EC': (-2.0, -77.5),  # Ecuador
+    'EE': (59.0, 26.0),  # Estonia
+    'EG': (27.0, 30.0),  # Egypt
+    'EH': (24.5, -13.0),  # Western Sahara
+    'ER': (15.0, 39.0),  # Eritrea
+    'ES': (40.0, -4.0),  # Spain
+    'ET': (8.0, 38.0),  # Ethiopia
+    'FI': (64.0, 26.0),  # Finland
+    'FJ': (-18.0, 175.0),  # Fiji
+    'FK': (-51.75, -59.0),  # Falkland Islands
+    'FM': (6.91666666, 158.25),  # Micronesia
+    'FO': (62.0, -7.0),  # Faroe Islands
+    'FR': (46.0, 2.0),  # France
+    'GA': (-1.0, 11.75),  # Gabon
+    'GB': (54.0, -2.0),  # United Kingdom
+    'GD': (12.11666666, -61.66666666),  # Grenada
+    'GE': (42.0, 43.5),  # Georgia
+    'GF': (4.0, -53.0),  # French Guiana
+    'GG': (49.46666666, -2.58333333),  # Guernsey
+    'GH': (8.0, -2.0),  # Ghana
+    'GI': (36.13333333, -5.35),  # Gibraltar
+    'GL': (72.0, -40.0),  # Greenland
+    'GM': (13.46666666, -16.56666666),  # Gambia
+    'GN': (11.0, -10.0),  # Guinea
+    'GP': (16.25, -61.583333),  # Guadeloupe
+    'GQ': (2.0, 10.0),  # Equatorial Guinea
+    'GR': (39.0, 22.0),  # Greece
+    'GT': (15.5, -90.25),  # Guatemala
+    'GU': (13.46666666, 144.78333333),  # Guam
+    'GW': (12.0, -15.0),  # Guinea-Bissau
+    'GY': (5.0, -59.0),  # Guyana
+    'HK': (22.25, 114.16666666),  # Hong Kong
+    'HN': (15.0, -86.5),  # Honduras
+    'HR': (45.16666666, 15.5),  # Croatia
+    'HT': (19.0, -72.41666666),  # Haiti
+    'HU': (47.0, 20.0),  # Hungary
+    'ID': (-5.0, 120.0),  # Indonesia
+    'IE': (53.0, -8.0),  # Ireland
+    'IL': (31.5, 34.75),  # Israel
+    'IM': (54.25, -4.5),  # Isle Of Man
+    'IN': (20.0, 77.0),  # India
+    'IO': (-6.0, 71.5),  # British Indian Ocean Territory
+    'IQ': (33.0, 44.0),  # Iraq
+    'IR': (32.0, 53.0),  # Iran
+    'IS': (65.0, -18.0),  # Iceland
+    'IT': (42.83333333, 12.83333333),  # Italy
+    'JE': (49.25, -2.16666666),  # Jersey
+    'JM': (17.971389, -76.793056),  # Jamaica
+    'JO': (31.0, 36.0),  # Jordan
+    'JP': (36.0, 138.0),  # Japan
+    'KE': (1.0, 38.0),  # Kenya
+    'KG': (41.0, 75.0),  # Kyrgyzstan
+    'KH': (13.0, 105.0),  # Cambodia
+    'KI': (1.41666666, 173.0),  # Kiribati
+    'KM': (-12.16666666, 44.25),  # Comoros
+    'KN': (17.33333333, -62.75),  # Saint Kitts And Nevis
+    'KP': (40.0, 127.0),  # North Korea
+    'KR': (37.0, 127.5),  # South Korea
+    'KW': (29.5, 45.75),  # Kuwait
+    'KY': (19.5, -80.5),  # Cayman Islands
+    'KZ': (48.0, 68.0),  # Kazakhstan
+    'LA': (18.0, 105.0),  # Laos
+    'LB': (33.83333333, 35.83333333),  # Lebanon
+    'LC': (13.88333333, -60.96666666),  # Saint Lucia
+    'LI': (47.26666666, 9.53333333),  # Liechtenstein
+    'LK': (7.0, 81.0),  # Sri Lanka
+    'LR': (6.5, -9.5),  # Liberia
+    'LS': (-29.5, 28.5),  # Lesotho
+    'LT': (56.0, 24.0),  # Lithuania
+    'LU': (49.75, 6.16666666),  # Luxembourg
+    'LV': (57.0, 25.0),  # Latvia
+    'LY': (25.0, 17.0),  # Libya
+    'MA': (32.0, -5.0),  # Morocco
+    'MC': (43.73333333, 7.4),  # Monaco
+    'MD': (47.0, 29.0),  # Moldova
+    'ME': (42.7044223, 19.3957785),  # Montenegro
+    'MF': (18.08, -63.05),  # Saint Martin
+    'MG': (-20.0, 47.0),  # Madagascar
+    'MH': (9.0, 168.0),  # Marshall Islands
+    'MK': (41.83333333, 22.0),  # Macedonia
+    'ML': (17.0, -4.0),  # Mali
+    'MM': (19.75, 96.1),  # Myanmar
+    'MN': (46.0, 105.0),  # Mongolia
+    'MO': (22.16666666, 113.55),  # Macao
+    'MP': (15.2, 145.75),  # Northern Mariana Islands
+    'MQ': (14.666667, -61.0),  # Martinique
+    'MR': (20.0, -12.0),  # Mauritania
+    'MS': (16.75, -62.2),  # Montserrat
+    'MT': (35.83333333, 14.58333333),  # Malta
+    'MU': (-20.28333333, 57.55),  # Mauritius
+    'MV': (3.25, 73.0),  # Maldives
+    'MW': (-13.5, 34.0),  # Malawi
+    'MX': (23.0, -102.0),  # Mexico
+    'MY': (2.5, 112.5),  # Malaysia
+    'MZ': (-18.25, 35.0),  # Mozambique
+    'NA': (-22.0, 17.0),  # Namibia
+    'NC': (-21.5, 165.5),  # New Caledonia
+    'NE': (16.0, 8.0),  # Niger
+    'NF': (-29.03333333, 167.95),  # Norfolk Island
+    'NG': (10.0, 8.0),  # Nigeria
+    'NI': (13.0, -85.0),  # Nicaragua
+    'NL': (52.5, 5.75),  # Netherlands
+    'NO': (62.0, 10.0),  # Norway
+    'NP': (28.0, 84.0),  # Nepal
+    'NR': (-0.53333333, 166.91666666),  # Nauru
+    'NU': (-19.03333333, -169.86666666),  # Niue
+    'NZ': (-41.0, 174.0),  # New Zealand
+    'OM': (21.0, 57.0),  # Oman
+    'PA': (9.0, -80.0),  # Panama
+    'PE': (-10.0, -76.0),  # Peru
+    'PF': (-15.0, -140.0),  # French Polynesia
+    'PG': (-6.0, 147.0),  # Papua New Guinea
+    'PH': (13.0, 122.0),  # Philippines
+    'PK': (30.0, 70.0),  # Pakistan
+    'PL': (52.0, 20.0),  # Poland
+    'PM': (46.83333333, -56.33333333),  # Saint Pierre And Miquelon
+    'PR': (18.25, -66.5),  # Puerto Rico
+    'PS': (31.9, 35.2),  # Palestine
+    'PT': (39.5, -8.0),  # Portugal
+    'PW': (7.5, 134.5),  # Palau
+    'PY': (-23.0, -58.0),  # Paraguay
+    'QA': (25.5, 51.25),  # Qatar
+    'RE': (-21.15, 55.5),  # Reunion
+    'RO': (46.0, 25.0),  # Romania
+    'RS': (44.016521, 21.005859),  # Serbia
+    'RU': (60.0, 100.0),  # Russia
+    'RW': (-2.0, 30.0),  # Rwanda
+    'SA': (25.0, 45.0),  # Saudi Arabia
+    'SB': (-8.0, 159.0),  # Solomon Islands
+    'SC': (-4.58333333, 55.66666666),  # Seychelles
+    'SD': (15.0, 30.0),  # Sudan
+    'SE': (62.0, 15.0),  # Sweden
+    'SG': (1.36666666, 103.8),  # Singapore
+    'SH': (-15.95, -5.7),  # Saint Helena
+    'SI': (46.11666666, 14.81666666),  # Slovenia
+    'SJ': (78.0, 20.0),  # Svalbard And Jan Mayen
+    'SK': (48.66666666, 19.5),  # Slovakia
+    'SL': (8.5, -11.5),  # Sierra Leone
+    'SM': (43.76666666, 12.41666666),  # San Marino
+    'SN': (14.0, -14.0),  # Senegal
+    'SO': (10.0, 49.0),  # Somalia
+    'SR': (4.0, -56.0),  # Suriname
+    'SS': (7.0, 30.0),  # South Sudan
+    'ST': (1.0, 7.0),  # Sao Tome And Principe
+    'SV': (13.83333333, -88.91666666),  # El Salvador
+    'SX': (18.04, -63.07),  # Sint Maarten (Dutch part)
+    'SY': (35.0, 38.0),  # Syria
+    'SZ': (-26.5, 31.5),  # Swaziland
+    'TA': (-37.11, -12.28),  # Tristan da Cunha
+    'TC': (21.75, -71.58),  # Turks And Caicos Islands
+    'TD': (15.0, 19.0),  # Chad
+    'TG': (8.0, 1.16666666),  # Togo
+    'TH': (15.0, 100.0),  # Thailand
+    'TJ': (39.0, 71.0),  # Tajikistan
+    'TK': (-9.0, -172.0),  # Tokelau
+    'TL': (-8.83333333, 125.91666666),  # Timor-Leste
+    'TM': (40.0, 60.0),  # Turkmenistan
+    'TN': (34.0, 9.0),  # Tunisia
+    'TO': (-20.0, -175.0),  # Tonga
+    'TR': (39.0, 35.0),  # Turkey
+    'TT': (11.0, -61.0),  # Trinidad and Tobago
+    'TV': (-8.0, 178.0),  # Tuvalu
+    'TW': (23.5, 121.0),  # Taiwan
+    'TZ': (-6.0, 35.0),  # Tanzania
+    'UA': (49.0, 32.0),  # Ukraine
+    'UG': (1.0, 32.0),  # Uganda
+    'US': (38.0, -97.0),  # United States
+    'UY': (-33.0, -56.0),  # Uruguay
+    'UZ': (41.0, 64.0),  # Uzbekistan
+    'VA': (41.90244, 12.45389),  # Vatican
+    'VC': (13.25, -61.2),  # Saint Vincent And The Grenadines
+    'VE': (8.0, -66.0),  # Venezuela
+    'VG': (18.43, -64.62),  # British Virgin Islands
+    'VI': (18.34, -64.9),  # U.S. Virgin Islands
+    'VN': (16.16666666, 107.83333333),  # Vietnam
+    'VU': (-16.0, 167.0),  # Vanuatu
+    'WF': (-13.3, -176.2),  # Wallis And Futuna
+    'WS': (-13.58333333, -172.33333333),  # Samoa
+    'XK': (42.6, 20.9),  # Kosovo
+    'YE': (15.0, 48.0),  # Yemen
+    'YT': (-12.83333333, 45.16666666),  # Mayotte
+    'ZA': (-29.0, 24.0),  # South Africa
+    'ZM': (-15.0, 30.0),  # Zambia
+    'ZW': (-20.0, 30.0),  # Zimbabwe
+}
+
+
+def region_display_name(region_code, lang='en'):
+    """Return the display name of a region in a language, or '' if unknown
+
+    Uses the public geocoder API on the region's example number. Regions that
+    share their numbering plan with another (e.g. EH with MA) get no name that
+    way; for them the geocoder's private name table is used while this
+    phonenumbers version still provides it.
+    """
+    example = phonenumbers.example_number(region_code)
+    name = geocoder.country_name_for_number(example, lang) if example is not None else ''
+    if name:
+        return name
+    region_name = getattr(geocoder, '_region_display_name', None)
+    if region_name is None:
+        return ''
+    try:
+        return region_name(region_code, lang)
+    except Exception:
+        return ''
+
+
+class CentroidIndex:
+    """In-memory index of region centroids keyed by region code and English country name"""
+    
+    def __init__(self, centroids=None):
+        """Build the index from a {region_code: (latitude, longitude)} mapping"""
+        self.by_region = dict(REGION_CENTROIDS if centroids is None else centroids)
+        self.by_name = {}
+        for region_code, coordinates in self.by_region.items():
+            name = region_display_name(region_code)
+            if name:
+                self.by_name[name.casefold()] = coordinates
+    
+    def lookup(self, description=None, region_code=None):
+        """Return (latitude, longitude) for a country name or region code, or None if unknown"""
+        if description:
+            coordinates = self.by_name.get(description.casefold())
+            if coordinates is not None:
+                return coordinates
+        if region_code:
+            return self.by_region.get(region_code)
+        return None
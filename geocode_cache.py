@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Geocoding cache for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Two-tier cache for online geocoding results: a bounded in-process LRU in front
+of an on-disk SQLite store that is shared by every process using the same file.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# Default location of the on-disk cache
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".phone_info_tool", "geocode_cache.sqlite3")
+
+# Default lifetime of a cached geocoding result (30 days)
+DEFAULT_TTL = 30 * 24 * 60 * 60
+
+# Default number of entries kept in the in-process LRU
+DEFAULT_MAXSIZE = 1024
+
+# Returned by GeocodeCache.get when a query is not cached
+MISS = object()
+
+
+class GeocodeCache:
+    """Cache of geocoding results keyed by the query string
+
+    Values are (latitude, longitude) tuples, or None for queries the geocoder
+    could not resolve, so that unknown places are not re-queried either.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, maxsize=DEFAULT_MAXSIZE):
+        """Open the cache
+
+        Args:
+            path: SQLite file for the persistent tier, or None for an in-process cache only
+            ttl: Seconds before a cached result expires
+            maxsize: Maximum number of entries in the in-process LRU
+        """
+        self.path = path
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                "query TEXT PRIMARY KEY, latitude REAL, longitude REAL, stored_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, query):
+        """Return the cached location for a query, or MISS if absent or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(query)
+            if entry is not None:
+                expires_at, location = entry
+                if expires_at > now:
+                    self._memory.move_to_end(query)
+                    self.hits += 1
+                    return location
+                del self._memory[query]
+
+            if self._conn is None:
+                self.misses += 1
+                return MISS
+            row = self._conn.execute(
+                "SELECT latitude, longitude, stored_at FROM geocode WHERE query = ?", (query,)
+            ).fetchone()
+            if row is None or row[2] + self.ttl <= now:
+                self.misses += 1
+                return MISS
+            location = (row[0], row[1]) if row[0] is not None else None
+            self._remember(query, location, row[2] + self.ttl)
+            self.hits += 1
+            return location
+
+    def set(self, query, location):
+        """Store the location (or None if not found) for a query"""
+        now = time.time()
+        latitude, longitude = location if location is not None else (None, None)
+        with self._lock:
+            self._remember(query, location, now + self.ttl)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocode (query, latitude, longitude, stored_at) VALUES (?, ?, ?, ?)",
+                    (query, latitude, longitude, now)
+                )
+                self._conn.commit()
+
+    def stats(self):
+        """Return hit/miss counters and the number of entries held in memory"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self._memory)
+        }
+
+    def clear(self):
+        """Remove every cached entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM geocode")
+                self._conn.commit()
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, query, location, expires_at):
+        """Insert an entry into the LRU, evicting the least recently used one if full"""
+        self._memory[query] = (expires_at, location)
+        self._memory.move_to_end(query)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
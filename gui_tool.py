@@ -12,18 +12,235 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkinter.scrolledtext import ScrolledText
-import threading
 import json
 import webbrowser
+from datetime import datetime
 
 # استيراد الأداة الرئيسية
 try:
-    from phone_info_tool import PhoneInfoTool
+    from phone_info_tool import PhoneInfoTool, default_export_filename
+    from result_table import ResultTable, load_table
+    from batch_jobs import JobManager, PAUSED
 except ImportError:
     messagebox.showerror("خطأ", "لم يتم العثور على ملف phone_info_tool.py")
     sys.exit(1)
 
 
+# الارتفاع الافتراضي لصف الجدول وعنوانه بالبكسل (عندما لا يحدده النمط)
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+
+# الفاصل الزمني بالمللي ثانية لقراءة أحداث المهام الخلفية، وأقصى عدد أحداث في كل مرة
+POLL_INTERVAL = 100
+POLL_EVENTS = 50
+
+
+class VirtualTable(ttk.Frame):
+    """جدول Treeview افتراضي يعرض فقط الصفوف الظاهرة من نموذج ResultTable
+    
+    يحتوي الجدول على عدد ثابت من العناصر بقدر ما يتسع له الإطار، وعند التمرير
+    تُستبدل قيمها بصفوف النموذج الظاهرة، فلا يتأثر الأداء بعدد الصفوف. الفرز
+    والتصفية يتمان على النموذج وليس على عناصر الجدول.
+    """
+    
+    def __init__(self, master, model, on_change=None):
+        super().__init__(master)
+        self.model = model
+        self.offset = 0
+        self.on_change = on_change
+        self._items = []
+        
+        self.row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        self.tree = ttk.Treeview(self, show="headings", height=1, selectmode="browse")
+        self.vbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        hbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscrollcommand=hbar.set)
+        
+        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
+        self.vbar.grid(row=0, column=1, sticky=tk.NS)
+        hbar.grid(row=1, column=0, sticky=tk.EW)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        
+        # التمرير بعجلة الفأرة ولوحة المفاتيح
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1, "units", 3))
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-1, "units", 3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(1, "units", 3))
+        self.tree.bind("<Prior>", lambda event: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda event: self.scroll(1, "pages"))
+        self.tree.bind("<Home>", lambda event: self.yview("moveto", 0))
+        self.tree.bind("<End>", lambda event: self.yview("moveto", 1))
+        self.bind("<Configure>", self._on_resize)
+        
+        self.set_model(model)
+    
+    def set_model(self, model):
+        """عرض نموذج جديد من بدايته"""
+        self.model = model
+        self.offset = 0
+        self.tree.configure(columns=model.columns)
+        for column in model.columns:
+            self.tree.heading(column, text=column, command=lambda column=column: self.sort_by(column))
+            self.tree.column(column, width=150, minwidth=60, stretch=False)
+        self.refresh()
+    
+    @property
+    def page_size(self):
+        return int(self.tree.cget("height"))
+    
+    def _on_resize(self, event):
+        rows = max(1, (event.height - HEADING_HEIGHT - self.row_height) // self.row_height)
+        if rows != self.page_size:
+            self.tree.configure(height=rows)
+            self.refresh()
+    
+    def scroll(self, amount, what, step=1):
+        """التمرير بعدد من الصفوف ("units") أو الصفحات ("pages")"""
+        self.yview("scroll", amount * step, what)
+        return "break"
+    
+    def yview(self, *args):
+        """أمر شريط التمرير العمودي: moveto أو scroll بالصفوف أو الصفحات"""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.model))
+        elif args[0] == "scroll":
+            self.offset += int(args[1]) * (self.page_size if args[2] == "pages" else 1)
+        self.refresh()
+    
+    def sort_by(self, column):
+        """فرز النموذج حسب عمود، وعكس الترتيب عند النقر على العمود نفسه مرة أخرى"""
+        columns = self.model.columns
+        descending = self.model.sort_column == columns.index(column) and not self.model.descending
+        self.model.sort(column, descending)
+        for name in columns:
+            arrow = (" ▼" if descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=name + arrow)
+        self.refresh()
+    
+    def refresh(self):
+        """إعادة ملء العناصر الظاهرة من النموذج"""
+        count = len(self.model)
+        page_size = self.page_size
+        self.offset = max(0, min(self.offset, count - page_size))
+        rows = self.model.rows(self.offset, self.offset + page_size)
+        
+        while len(self._items) > len(rows):
+            self.tree.delete(self._items.pop())
+        for i, values in enumerate(rows):
+            if i < len(self._items):
+                self.tree.item(self._items[i], values=values)
+            else:
+                self._items.append(self.tree.insert("", tk.END, values=values))
+        
+        if count:
+            self.vbar.set(self.offset / count, (self.offset + len(rows)) / count)
+        else:
+            self.vbar.set(0, 1)
+        if self.on_change:
+            self.on_change(self.offset, len(rows), count)
+
+
+class BatchWindow(tk.Toplevel):
+    """نافذة عرض نتائج دفعة من الأرقام مع الفرز والتصفية"""
+    
+    ALL_COLUMNS = "كل الأعمدة"
+    
+    def __init__(self, master, model, title="نتائج الدفعة", job=None):
+        super().__init__(master)
+        self.title(title)
+        self.geometry("1000x600")
+        self.job = job
+        
+        if job is not None:
+            job_frame = ttk.Frame(self)
+            job_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+            
+            self.progress = ttk.Progressbar(job_frame, mode="determinate", length=300)
+            self.progress.pack(side=tk.LEFT)
+            self.pause_button = ttk.Button(job_frame, text="إيقاف مؤقت", command=self.toggle_pause)
+            self.pause_button.pack(side=tk.LEFT, padx=5)
+            self.cancel_button = ttk.Button(job_frame, text="إلغاء", command=job.cancel)
+            self.cancel_button.pack(side=tk.LEFT)
+            self.job_var = tk.StringVar(value="في الانتظار...")
+            ttk.Label(job_frame, textvariable=self.job_var).pack(side=tk.LEFT, padx=10)
+            
+            # إلغاء المهمة عند إغلاق نافذتها
+            self.protocol("WM_DELETE_WINDOW", self.close)
+        
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        ttk.Label(filter_frame, text="تصفية:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=30)
+        filter_entry.pack(side=tk.LEFT, padx=5)
+        filter_entry.bind("<Return>", lambda event: self.apply_filter())
+        
+        self.filter_column_var = tk.StringVar(value=self.ALL_COLUMNS)
+        self.filter_column_box = ttk.Combobox(filter_frame, textvariable=self.filter_column_var, state="readonly",
+                                              values=(self.ALL_COLUMNS,) + model.columns, width=30)
+        self.filter_column_box.pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(filter_frame, text="تطبيق", command=self.apply_filter).pack(side=tk.LEFT, padx=5)
+        ttk.Button(filter_frame, text="إلغاء التصفية", command=self.clear_filter).pack(side=tk.LEFT)
+        
+        self.status_var = tk.StringVar()
+        status_label = ttk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
+        status_label.pack(fill=tk.X, side=tk.BOTTOM, padx=10, pady=(0, 10))
+        
+        self.table = VirtualTable(self, model, on_change=self._update_status)
+        self.table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    @property
+    def model(self):
+        return self.table.model
+    
+    def apply_filter(self):
+        column = self.filter_column_var.get()
+        self.model.filter(self.filter_var.get(), None if column == self.ALL_COLUMNS else column)
+        self.table.offset = 0
+        self.table.refresh()
+    
+    def clear_filter(self):
+        self.filter_var.set("")
+        self.filter_column_var.set(self.ALL_COLUMNS)
+        self.apply_filter()
+    
+    def toggle_pause(self):
+        if self.job.state == PAUSED:
+            self.job.resume()
+        else:
+            self.job.pause()
+        self.update_job()
+    
+    def update_job(self):
+        """تحديث شريط التقدم والسرعة والوقت المتبقي للمهمة"""
+        job = self.job
+        if job.total:
+            self.progress.configure(maximum=job.total, value=job.done)
+        text = f"{job.done}/{job.total if job.total is not None else '?'} ({job.valid} صالح)"
+        if job.throughput:
+            text += f" - {job.throughput:.0f} رقم/ث"
+        if job.state == PAUSED:
+            text += " - متوقف مؤقتاً"
+        elif job.finished:
+            text += {"done": " - اكتمل", "cancelled": " - ألغي"}.get(job.state, f" - فشل: {job.error}")
+        elif job.eta is not None:
+            text += f" - الوقت المتبقي {job.eta:.0f} ث"
+        self.job_var.set(text)
+        self.pause_button.configure(text="استئناف" if job.state == PAUSED else "إيقاف مؤقت",
+                                    state=tk.DISABLED if job.finished else tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED if job.finished else tk.NORMAL)
+    
+    def close(self):
+        self.job.cancel()
+        self.destroy()
+    
+    def _update_status(self, offset, shown, count):
+        first = offset + 1 if shown else 0
+        self.status_var.set(f"الصفوف {first}-{offset + shown} من {count} (الإجمالي {self.model.total})")
+
+
 class PhoneInfoGUI:
     def __init__(self, root):
         self.root = root
@@ -34,6 +251,10 @@ class PhoneInfoGUI:
         # تهيئة أداة معلومات الهاتف
         self.phone_tool = PhoneInfoTool()
         
+        # المهام الخلفية: تُقرأ نتائجها من الطابور في الحلقة الرئيسية لـ Tk
+        self.jobs = JobManager(self.phone_tool)
+        self.job_windows = {}
+        
         # إنشاء المتغيرات
         self.phone_number_var = tk.StringVar()
         self.export_format_var = tk.StringVar(value="json")
@@ -48,6 +269,9 @@ class PhoneInfoGUI:
         # النتائج
         self.results = None
         
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+        self.root.after(POLL_INTERVAL, self._poll_jobs)
+        
     def set_theme(self):
         # تعيين ألوان وأنماط الواجهة
         bg_color = "#f0f0f0"
@@ -91,6 +315,9 @@ class PhoneInfoGUI:
         clear_button = ttk.Button(input_frame, text="مسح", command=self.clear_results)
         clear_button.grid(row=0, column=3, padx=5, pady=5)
         
+        batch_button = ttk.Button(input_frame, text="تحليل ملف أرقام...", command=self.analyze_file)
+        batch_button.grid(row=0, column=4, padx=5, pady=5)
+        
         # إطار التصدير
         export_frame = ttk.LabelFrame(main_frame, text="تصدير النتائج")
         export_frame.pack(fill=tk.X, pady=10)
@@ -112,6 +339,9 @@ class PhoneInfoGUI:
         export_button = ttk.Button(export_frame, text="تصدير النتائج", command=self.export_results)
         export_button.grid(row=2, column=0, columnspan=5, padx=5, pady=5)
         
+        # الأزرار المعطلة أثناء تحليل رقم واحد
+        self.action_buttons = [analyze_button, clear_button, export_button]
+        
         # إطار النتائج
         results_frame = ttk.LabelFrame(main_frame, text="النتائج")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -142,8 +372,10 @@ class PhoneInfoGUI:
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="تحليل رقم جديد", command=self.clear_results)
         file_menu.add_command(label="تصدير النتائج", command=self.export_results)
+        file_menu.add_command(label="تحليل ملف أرقام...", command=self.analyze_file)
+        file_menu.add_command(label="فتح نتائج دفعة...", command=self.open_batch_results)
         file_menu.add_separator()
-        file_menu.add_command(label="خروج", command=self.root.quit)
+        file_menu.add_command(label="خروج", command=self.quit)
         menubar.add_cascade(label="ملف", menu=file_menu)
         
         # قائمة المساعدة
@@ -160,40 +392,89 @@ class PhoneInfoGUI:
             messagebox.showwarning("تحذير", "الرجاء إدخال رقم هاتف")
             return
         
-        # تعطيل الزر أثناء التحليل
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.config(state=tk.DISABLED)
+        # تعطيل الأزرار أثناء التحليل
+        self._set_buttons_state(tk.DISABLED)
         
         self.status_var.set("جاري تحليل الرقم...")
         
-        # تشغيل التحليل في خيط منفصل
-        threading.Thread(target=self._analyze_thread, args=(phone_number,), daemon=True).start()
+        # تشغيل التحليل في الخلفية، وتصل النتيجة عبر _poll_jobs
+        self.jobs.submit_lookup(phone_number)
+    
+    def _set_buttons_state(self, state):
+        for button in self.action_buttons:
+            button.config(state=state)
     
-    def _analyze_thread(self, phone_number):
+    def analyze_file(self):
+        input_file = filedialog.askopenfilename(
+            title="تحليل ملف أرقام",
+            filetypes=[("ملفات نصية", "*.txt"), ("كل الملفات", "*.*")])
+        if not input_file:
+            return
+        
+        export_path = self.export_path_var.get()
         try:
-            # تحليل الرقم
-            self.results = self.phone_tool.analyze_number(phone_number)
-            
-            # عرض النتائج في واجهة المستخدم
-            self.root.after(0, self._update_results)
+            os.makedirs(export_path, exist_ok=True)
         except Exception as e:
-            self.root.after(0, lambda: self._show_error(str(e)))
+            messagebox.showerror("خطأ", f"لا يمكن إنشاء مجلد التصدير: {str(e)}")
+            return
+        
+        # تُحفظ النتائج أيضاً في ملف JSON Lines يمكن فتحه لاحقاً من "فتح نتائج دفعة"
+        output_file = os.path.join(export_path, f"phone_info_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        job = self.jobs.submit_file(input_file, output_file)
+        self.job_windows[job.id] = BatchWindow(self.root, ResultTable(), title=os.path.basename(input_file), job=job)
+        self.status_var.set(f"تمت إضافة مهمة تحليل {input_file}، والنتائج تحفظ في {output_file}")
+    
+    def _poll_jobs(self):
+        """قراءة أحداث المهام الخلفية وتحديث الواجهة، ثم إعادة الجدولة"""
+        changed = set()
+        for event in self.jobs.poll(POLL_EVENTS):
+            if event.job is None:
+                (key, result), = event.pairs
+                if isinstance(result, Exception):
+                    self._show_error(str(result))
+                elif event.kind == 'lookup':
+                    self._update_results(result)
+                elif event.kind == 'table':
+                    self._show_batch(key, result)
+                continue
+            window = self.job_windows.get(event.job.id)
+            if window is None or not window.winfo_exists():
+                continue
+            if event.kind == 'results':
+                window.model.extend(event.pairs)
+            changed.add(window)
+        
+        for job_id, window in list(self.job_windows.items()):
+            if not window.winfo_exists():
+                del self.job_windows[job_id]
+                continue
+            if window in changed:
+                window.table.refresh()
+            if window in changed or not window.job.finished:
+                window.update_job()
+        
+        self.root.after(POLL_INTERVAL, self._poll_jobs)
     
-    def _update_results(self):
+    def quit(self):
+        self.jobs.shutdown()
+        self.root.destroy()
+    
+    def _update_results(self, result):
+        self.results = result
+        
         # تحديث مربع النتائج
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
         
         if self.results:
-            if self.results["valid"]:
+            if self.results.valid:
                 # تنسيق النتائج
-                formatted_results = json.dumps(self.results, indent=4, ensure_ascii=False)
+                formatted_results = json.dumps(self.results.to_dict(), indent=4, ensure_ascii=False)
                 self.results_text.insert(tk.END, formatted_results)
-                self.status_var.set(f"تم تحليل الرقم {self.results['number']} بنجاح")
+                self.status_var.set(f"تم تحليل الرقم {self.results.phone_number} بنجاح")
             else:
-                self.results_text.insert(tk.END, f"الرقم {self.results['number']} غير صالح")
-                self.status_var.set(f"الرقم {self.results['number']} غير صالح")
+                self.results_text.insert(tk.END, f"الرقم {self.results.phone_number} غير صالح")
+                self.status_var.set(f"الرقم {self.results.phone_number} غير صالح")
         else:
             self.results_text.insert(tk.END, "لم يتم العثور على نتائج")
             self.status_var.set("لم يتم العثور على نتائج")
@@ -201,18 +482,14 @@ class PhoneInfoGUI:
         self.results_text.config(state=tk.DISABLED)
         
         # إعادة تفعيل الأزرار
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.config(state=tk.NORMAL)
+        self._set_buttons_state(tk.NORMAL)
     
     def _show_error(self, error_message):
         messagebox.showerror("خطأ", f"حدث خطأ أثناء تحليل الرقم: {error_message}")
         self.status_var.set("حدث خطأ")
         
         # إعادة تفعيل الأزرار
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.config(state=tk.NORMAL)
+        self._set_buttons_state(tk.NORMAL)
     
     def clear_results(self):
         self.phone_number_var.set("")
@@ -222,13 +499,29 @@ class PhoneInfoGUI:
         self.results_text.config(state=tk.DISABLED)
         self.status_var.set("جاهز")
     
+    def open_batch_results(self):
+        file_path = filedialog.askopenfilename(
+            title="فتح نتائج دفعة",
+            filetypes=[("نتائج الدفعات", "*.json *.jsonl *.csv"), ("كل الملفات", "*.*")])
+        if not file_path:
+            return
+        
+        self.status_var.set(f"جاري تحميل {file_path}...")
+        
+        # تحميل الملف في الخلفية حتى لا تتوقف الواجهة مع الملفات الكبيرة
+        self.jobs.submit_task('table', file_path, load_table, file_path)
+    
+    def _show_batch(self, file_path, table):
+        BatchWindow(self.root, table, title=os.path.basename(file_path))
+        self.status_var.set(f"تم تحميل {table.total} نتيجة من {file_path}")
+    
     def browse_export_path(self):
         directory = filedialog.askdirectory(initialdir=self.export_path_var.get())
         if directory:
             self.export_path_var.set(directory)
     
     def export_results(self):
-        if not self.results or not self.results.get("valid", False):
+        if not self.results or not self.results.valid:
             messagebox.showwarning("تحذير", "لا توجد نتائج صالحة للتصدير")
             return
         
@@ -245,8 +538,8 @@ class PhoneInfoGUI:
         
         try:
             # تصدير النتائج
-            file_path = self.phone_tool.export_results(
-                self.results, export_format, export_path, self.results["number"])
+            filename = os.path.join(export_path, default_export_filename(self.results.phone_number))
+            file_path = self.phone_tool.export_results(export_format, filename, self.results)
             
             if file_path:
                 self.status_var.set(f"تم تصدير النتائج إلى {file_path}")
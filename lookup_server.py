@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP lookup service for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Keeps one warm PhoneInfoTool in memory and answers lookups over HTTP, so other
+services get results without starting a Python process per number:
+
+    GET  /lookup?number=+966501234567   one analysis
+    POST /batch  {"numbers": [...]}     many analyses, in input order
+    GET  /health                        liveness check
+    GET  /stats                         tool.stats() as JSON
+    GET  /metrics                       Prometheus text metrics
+
+Analyses run on a bounded worker pool; requests that do not finish within the
+request timeout are answered with 504.
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import phonenumbers
+from phonenumbers import PhoneMetadata
+
+# Default address and port of the service
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+
+# Default seconds allowed for a request before it is answered with 504
+DEFAULT_REQUEST_TIMEOUT = 10.0
+
+# Default maximum number of numbers accepted by one /batch request
+DEFAULT_MAX_BATCH = 10000
+
+# Largest accepted request body, in bytes
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+def warm_up(tool):
+    """Load the phonenumbers metadata of every region and run one full analysis
+
+    phonenumbers loads region metadata on first use; loading it up front keeps
+    that cost out of the first requests.
+    """
+    for region in phonenumbers.SUPPORTED_REGIONS:
+        PhoneMetadata.metadata_for_region(region)
+    for country_code in phonenumbers.COUNTRY_CODES_FOR_NON_GEO_REGIONS:
+        PhoneMetadata.metadata_for_nongeo_region(country_code)
+    tool.lookup("+966501234567")
+
+
+def lookup_entry(tool, phone_number):
+    """Analyze one number and return its JSON entry"""
+    result = tool.lookup(phone_number)
+    return {'number': phone_number, 'valid': result.valid, 'results': result.to_dict() if result.valid else None}
+
+
+class LookupHandler(BaseHTTPRequestHandler):
+    """Routes the service endpoints to the LookupServer"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'PhoneInfoTool'
+    # Headers and body go out in separate writes; without TCP_NODELAY the body
+    # waits for the client's delayed ACK on keep-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # Bound the time spent waiting on a slow or idle client
+        self.timeout = self.server.request_timeout
+        super().setup()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/lookup':
+            numbers = parse_qs(url.query).get('number')
+            if not numbers or not numbers[0].strip():
+                self.send_json(400, {'error': "Missing 'number' query parameter"})
+                return
+            self.run_lookups(numbers[:1], single=True)
+        elif url.path == '/health':
+            self.send_json(200, {'status': "ok"})
+        elif url.path == '/stats':
+            self.send_json(200, self.server.tool.stats())
+        elif url.path == '/metrics':
+            self.send_body(200, self.server.tool.prometheus_metrics().encode('utf-8'),
+                           'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            self.send_json(404, {'error': "Not found"})
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/batch':
+            self.send_json(404, {'error': "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # rfile.read() of a negative length would wait for the client to close the connection
+            self.send_json(400, {'error': "Invalid Content-Length"})
+            self.close_connection = True
+            return
+        if length > MAX_BODY_SIZE:
+            self.send_json(413, {'error': "Request body too large"})
+            self.close_connection = True
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            self.send_json(400, {'error': "Body must be JSON"})
+            return
+
+        numbers = payload.get('numbers') if isinstance(payload, dict) else payload
+        if not isinstance(numbers, list) or not all(isinstance(number, str) for number in numbers):
+            self.send_json(400, {'error': "Expected {\"numbers\": [...]} with string numbers"})
+            return
+        if len(numbers) > self.server.max_batch:
+            self.send_json(413, {'error': f"At most {self.server.max_batch} numbers per batch"})
+            return
+        self.run_lookups(numbers, single=False)
+
+    def run_lookups(self, numbers, single):
+        """Analyze numbers on the worker pool within the request timeout and send the answer"""
+        server = self.server
+        deadline = time.monotonic() + server.request_timeout
+        futures = [server.submit(lookup_entry, server.tool, number) for number in numbers]
+        try:
+            entries = [future.result(max(0.0, deadline - time.monotonic())) for future in futures]
+        except FutureTimeout:
+            for future in futures:
+                future.cancel()
+            self.send_json(504, {'error': f"Request timed out after {server.request_timeout:g}s"})
+            return
+        except Exception as e:
+            self.send_json(500, {'error': str(e)})
+            return
+        self.send_json(200, entries[0] if single else {'results': entries})
+
+    def send_json(self, status, body):
+        """Send a JSON response"""
+        self.send_body(status, json.dumps(body, separators=(',', ':')).encode('utf-8'), 'application/json')
+
+    def send_body(self, status, data, content_type):
+        """Send a response with a body of known length"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.server.tool.quiet:
+            super().log_message(format, *args)
+
+
+class LookupServer(ThreadingHTTPServer):
+    """HTTP server answering lookups with a shared PhoneInfoTool and worker pool"""
+
+    daemon_threads = True
+
+    def __init__(self, tool, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None,
+                 request_timeout=DEFAULT_REQUEST_TIMEOUT, max_batch=DEFAULT_MAX_BATCH):
+        """Bind the server; call serve_forever() to start answering requests
+
+        Args:
+            tool: The PhoneInfoTool answering lookups (its lookup() is reentrant)
+            host, port: Address to listen on (port 0 picks a free port)
+            workers: Size of the analysis worker pool (default: CPU count)
+            request_timeout: Seconds allowed for a request before answering 504
+            max_batch: Maximum number of numbers accepted by one /batch request
+        """
+        self.tool = tool
+        self.request_timeout = request_timeout
+        self.max_batch = max_batch
+        self.executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                           thread_name_prefix='lookup')
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        super().__init__((host, port), LookupHandler)
+
+    def submit(self, function, *args):
+        """Run a function on the worker pool, tracking it until done so server_close() can cancel it"""
+        future = self.executor.submit(function, *args)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def server_close(self):
+        super().server_close()
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9, so queued lookups are cancelled here
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+
+def serve(tool, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, request_timeout=DEFAULT_REQUEST_TIMEOUT,
+          max_batch=DEFAULT_MAX_BATCH):
+    """Warm the tool up and answer lookups over HTTP until interrupted"""
+    warm_up(tool)
+    server = LookupServer(tool, host, port, workers, request_timeout, max_batch)
+    print(f"[*] Serving lookups on http://{server.server_address[0]}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def start_in_thread(tool, host=DEFAULT_HOST, port=0, **options):
+    """Start a LookupServer in a background thread and return it (call shutdown() to stop)"""
+    server = LookupServer(tool, host, port, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
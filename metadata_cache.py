@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Prefix-keyed metadata cache for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Memoizes the carrier, geocoder and timezone lookups of phonenumbers. Those
+lookups only depend on the number type, the region and the longest prefix of
+the number found in the phonenumbers prefix data, so numbers sharing these
+share one cache entry.
+"""
+
+import threading
+
+import phonenumbers
+from phonenumbers import carrier, geocoder, timezone
+
+# Default maximum number of cached prefixes
+DEFAULT_MAXSIZE = 100000
+
+# Prefix tables consulted by the memoized lookups
+PREFIX_TABLES = (carrier.CARRIER_DATA, geocoder.GEOCODE_DATA, timezone.TIMEZONE_DATA)
+
+# Length of the longest prefix in any of the tables
+LONGEST_PREFIX = max(carrier.CARRIER_LONGEST_PREFIX, geocoder.GEOCODE_LONGEST_PREFIX,
+                     timezone.TIMEZONE_LONGEST_PREFIX)
+
+
+def metadata_prefix(country_code, national_number):
+    """Return the longest prefix of a number's digits present in any prefix table
+
+    All prefixes of the number longer than this one are absent from every
+    table, so each table lookup resolves to a prefix of it.
+    """
+    digits = str(country_code) + national_number
+    for length in range(min(LONGEST_PREFIX, len(digits)), 0, -1):
+        prefix = digits[:length]
+        for table in PREFIX_TABLES:
+            if prefix in table:
+                return prefix
+    return ""
+
+
+class MetadataCache:
+    """Cache of per-prefix carrier, location and timezone metadata, safe to share between threads"""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """Create an empty cache holding at most ``maxsize`` prefixes"""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, parsed_number, number_type=None, region_code=None):
+        """Return the metadata of a parsed number
+
+        The result is a dictionary with the keys 'description' (geocoder
+        description), 'region_description' (country name), 'carrier' and
+        'time_zones'. Pass ``number_type`` and ``region_code`` when they are
+        already known to avoid recomputing them.
+        """
+        if number_type is None:
+            number_type = phonenumbers.number_type(parsed_number)
+        if region_code is None:
+            region_code = phonenumbers.region_code_for_number(parsed_number)
+        national_number = phonenumbers.national_significant_number(parsed_number)
+
+        # Numbers carrying a mobile token (e.g. Argentina's "9") are geocoded
+        # without it, so their prefix does not identify the description
+        mobile_token = geocoder.country_mobile_token(parsed_number.country_code)
+        if mobile_token and national_number.startswith(mobile_token):
+            with self._lock:
+                self.misses += 1
+            return self._compute(parsed_number)
+
+        key = (metadata_prefix(parsed_number.country_code, national_number), number_type, region_code)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Computed outside the lock; threads missing the same prefix store equal entries
+        entry = self._compute(parsed_number)
+        with self._lock:
+            if key not in self._entries:
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = entry
+        return entry
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached prefixes"""
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._entries)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'size': size
+        }
+
+    def clear(self):
+        """Drop every cached entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _compute(parsed_number):
+        """Look up a number's metadata with phonenumbers"""
+        return {
+            'description': geocoder.description_for_number(parsed_number, 'en'),
+            'region_description': geocoder.description_for_number(parsed_number, 'en', region=True),
+            'carrier': carrier.name_for_number(parsed_number, 'en'),
+            'time_zones': tuple(timezone.time_zones_for_number(parsed_number))
+        }
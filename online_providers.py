@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Online database providers for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Each provider wraps one online phone number database. Providers are queried in
+parallel over pooled keep-alive HTTP sessions, with per-provider timeouts,
+retries with exponential backoff and token-bucket rate limiting, and their
+answers are merged into the tool's 'online_databases' section.
+"""
+
+import time
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limit import TokenBucket
+
+# Spam scores from least to most severe; the merged score is the most severe one
+SPAM_SCORES = ("Unknown", "Low", "Medium", "High")
+
+# HTTP status codes worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class ProviderError(Exception):
+    """Raised when a provider cannot answer a query"""
+
+
+class OnlineProvider:
+    """Base class for an online phone number database
+
+    Subclasses override build_request() and parse_response(). Provider objects only
+    hold configuration, so they can be sent to bulk-mode worker processes.
+    """
+
+    def __init__(self, name, base_url, timeout=5.0, retries=2, backoff=0.5, rate=None, pool_size=10):
+        """Configure the provider
+
+        Args:
+            name: Name the provider's answer is reported under
+            base_url: URL of the provider's lookup endpoint
+            timeout: Seconds to wait for each HTTP request
+            retries: Number of retries after a failed request
+            backoff: Delay before the first retry, doubled for each further retry
+            rate: Maximum requests per second, or None for no limit
+            pool_size: Maximum number of keep-alive connections to the provider
+        """
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate = rate
+        self.pool_size = pool_size
+
+    @property
+    def host(self):
+        """Host name of the provider's endpoint"""
+        return urlparse(self.base_url).netloc
+
+    def build_request(self, e164_number):
+        """Return the (url, params) of the lookup request for a number"""
+        raise NotImplementedError
+
+    def parse_response(self, response):
+        """Convert a successful HTTP response into an 'online_databases' style dictionary"""
+        raise NotImplementedError
+
+
+class JsonApiProvider(OnlineProvider):
+    """Provider for a JSON API answering GET <base_url>?number=<E.164 number>
+
+    The response is expected to contain any of the keys 'spam_score',
+    'reported_count', 'last_reported' and 'tags'. Answers whose values have
+    other types than the merged section's are rejected with ProviderError.
+    """
+
+    def build_request(self, e164_number):
+        return self.base_url, {'number': e164_number}
+
+    def parse_response(self, response):
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ProviderError(f"Invalid response: {e}") from None
+        if not isinstance(data, dict):
+            raise ProviderError("Invalid response: expected a JSON object")
+
+        spam_score = data.get('spam_score', "Unknown")
+        reported_count = data.get('reported_count', 0)
+        last_reported = data.get('last_reported', "Never")
+        tags = data.get('tags', [])
+        # merge_answers compares dates as strings and adds counts, so wrong types are rejected here
+        if not isinstance(spam_score, str) or not isinstance(last_reported, str):
+            raise ProviderError("Invalid response: spam_score and last_reported must be strings")
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ProviderError("Invalid response: tags must be a list of strings")
+        if isinstance(reported_count, str) and reported_count.strip().isdecimal():
+            reported_count = int(reported_count)
+        if isinstance(reported_count, bool) or not isinstance(reported_count, int) or reported_count < 0:
+            raise ProviderError("Invalid response: reported_count must be a non-negative integer")
+        return {
+            'spam_score': spam_score,
+            'reported_count': reported_count,
+            'last_reported': last_reported,
+            'tags': tags
+        }
+
+
+class OnlineDatabaseSearch:
+    """Queries a set of providers in parallel and merges their answers"""
+
+    def __init__(self, providers, max_workers=None):
+        """Create pooled sessions and rate limiters for the providers"""
+        self.providers = list(providers)
+        self.sessions = {}
+        self.limiters = {}
+        for provider in self.providers:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=provider.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.sessions[provider.name] = session
+            if provider.rate:
+                self.limiters[provider.name] = TokenBucket(provider.rate)
+        self.executor = None
+        if len(self.providers) > 1:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers or 4 * len(self.providers))
+
+    def search(self, e164_number):
+        """Query every provider for a number and return the merged section"""
+        if self.executor is None:
+            answers = [self._query_safely(provider, e164_number) for provider in self.providers]
+        else:
+            futures = [self.executor.submit(self._query_safely, provider, e164_number)
+                       for provider in self.providers]
+            answers = [future.result() for future in futures]
+        return merge_answers(zip(self.providers, answers))
+
+    def close(self):
+        """Close the HTTP sessions and the query thread pool"""
+        for session in self.sessions.values():
+            session.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    def _query_safely(self, provider, e164_number):
+        """Query a provider, returning a ProviderError instead of raising it"""
+        try:
+            return self.query(provider, e164_number)
+        except ProviderError as e:
+            return e
+
+    def query(self, provider, e164_number):
+        """Query one provider, retrying transient failures with exponential backoff"""
+        session = self.sessions[provider.name]
+        limiter = self.limiters.get(provider.name)
+        url, params = provider.build_request(e164_number)
+
+        for attempt in range(provider.retries + 1):
+            if attempt:
+                time.sleep(provider.backoff * 2 ** (attempt - 1))
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                response = session.get(url, params=params, timeout=provider.timeout)
+            except requests.RequestException as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            if response.status_code in RETRY_STATUSES:
+                error = f"HTTP {response.status_code}"
+                continue
+            if response.status_code != 200:
+                raise ProviderError(f"HTTP {response.status_code}")
+            try:
+                return provider.parse_response(response)
+            except ValueError as e:
+                raise ProviderError(f"Invalid response: {e}")
+
+        raise ProviderError(error)
+
+
+def merge_answers(answers):
+    """Merge (provider, answer or ProviderError) pairs into one 'online_databases' section"""
+    spam_score = "Unknown"
+    reported_count = 0
+    last_reported = "Never"
+    tags = []
+    sources = {}
+
+    for provider, answer in answers:
+        if isinstance(answer, ProviderError):
+            sources[provider.name] = {'error': str(answer)}
+            continue
+        sources[provider.name] = answer
+        score = answer.get('spam_score', "Unknown")
+        if score in SPAM_SCORES and SPAM_SCORES.index(score) > SPAM_SCORES.index(spam_score):
+            spam_score = score
+        reported_count += answer.get('reported_count', 0)
+        reported = answer.get('last_reported', "Never")
+        if reported != "Never" and (last_reported == "Never" or reported > last_reported):
+            last_reported = reported
+        for tag in answer.get('tags', []):
+            if tag not in tags:
+                tags.append(tag)
+
+    answered = sum(1 for source in sources.values() if 'error' not in source)
+    return {
+        'spam_score': spam_score,
+        'reported_count': reported_count,
+        'last_reported': last_reported,
+        'tags': tags or ["Not in database"],
+        'note': f"Merged results from {answered} of {len(sources)} online databases.",
+        'sources': sources
+    }
@@ -15,14 +15,28 @@ import os
 import re
 import json
 import time
+import argparse
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from urllib.parse import urlparse
 import phonenumbers
-from phonenumbers import carrier, geocoder, timezone
-import requests
-import pandas as pd
+from phonenumbers import PhoneMetadata, PhoneNumberType
+from phonenumbers.phonenumberutil import _number_type_helper
 from datetime import datetime
-import pytz
 # استخدام رموز ANSI مباشرة بدلاً من مكتبة colored
-from geopy.geocoders import Nominatim
+# pandas, geopy, requests (online providers), numpy and asyncio are imported only by
+# the code paths that use them, so a plain lookup starts without loading them
+from geo_centroids import CentroidIndex
+from metadata_cache import MetadataCache
+from zone_clock import ZoneClock
+from stage_metrics import StageMetrics, prometheus_text
+from result_cache import ResultCache, DEFAULT_RESULT_CACHE_PATH
+from compact_results import ResultBatch
+from geocode_cache import GeocodeCache, DEFAULT_CACHE_PATH, DEFAULT_TTL, MISS
+from result_writers import (flatten_results, open_writer, format_for_path, select_schema, schema_sections, SummaryWriter,
+                            WRITERS, FORMAT_EXTENSIONS, canonical_format, extension_for_format)
+from aggregation import ResultAggregator
 # تجاوز استخدام مكتبة pretty-html-table
 # from pretty_html_table import build_table
 
@@ -38,17 +52,279 @@ COLORS = {
     'bold': '\033[1m'
 }
 
+# Number of phone numbers handed to a worker process at a time in bulk mode
+DEFAULT_CHUNKSIZE = 256
+
+# Region assumed for numbers given without a country code
+DEFAULT_REGION = 'US'
+
+# Requests per second allowed to the Nominatim geocoder (its usage policy allows one),
+# shared by the tool and its bulk-mode worker processes
+GEOCODE_RATE_LIMIT = 1.0
+
+# Numbers checked against the per-number analysis before a bulk run uses the fast path
+FAST_PATH_SAMPLE = 1000
+
+# Sections of an analysis, in the order they are gathered
+RESULT_SECTIONS = ('basic_info', 'geolocation', 'timezone_info', 'online_databases')
+
+
+class AnalysisResult(namedtuple('AnalysisResult', ('phone_number', 'valid') + RESULT_SECTIONS + ('timings',),
+                                defaults=(None,))):
+    """Immutable result of analyzing one phone number
+    
+    Each section holds the same data as the matching key of PhoneInfoTool.results,
+    or None if the number is invalid or the section could not be gathered.
+    ``timings`` maps each step to its duration in seconds when the tool records
+    timings, and is None otherwise.
+    """
+    __slots__ = ()
+    
+    @classmethod
+    def from_sections(cls, phone_number, valid, sections, timings=None):
+        """Build a result from a {section: data} mapping; missing sections are None"""
+        return cls(phone_number, valid, *(sections.get(section) for section in RESULT_SECTIONS), timings)
+    
+    def to_dict(self):
+        """Return the sections in the PhoneInfoTool.results layout (plus 'timings' if recorded)"""
+        results = {
+            section: getattr(self, section)
+            for section in RESULT_SECTIONS
+            if getattr(self, section) is not None
+        }
+        if self.timings is not None:
+            results['timings'] = self.timings
+        return results
+
+
+# Names of the phonenumbers number types, as reported in basic_info
+NUMBER_TYPE_NAMES = {
+    0: "FIXED_LINE",
+    1: "MOBILE",
+    2: "FIXED_LINE_OR_MOBILE",
+    3: "TOLL_FREE",
+    4: "PREMIUM_RATE",
+    5: "SHARED_COST",
+    6: "VOIP",
+    7: "PERSONAL_NUMBER",
+    8: "PAGER",
+    9: "UAN",
+    10: "UNKNOWN",
+    27: "EMERGENCY",
+    28: "VOICEMAIL",
+    29: "SHORT_CODE",
+    30: "STANDARD_RATE"
+}
+
+# Marks NumberContext values that have not been computed yet
+_UNSET = object()
+
+
+class NumberContext:
+    """Intermediate values shared by the analysis stages of one parsed number
+    
+    Each value is computed on first use and reused by every later stage, so an
+    analysis runs each phonenumbers routine at most once per number. ``clock`` is
+    the ZoneClock of the batch the number belongs to, or None outside batches.
+    """
+    __slots__ = ('parsed_number', 'clock', '_metadata_cache', '_region_code', '_number_type', '_metadata',
+                 '_e164')
+    
+    def __init__(self, parsed_number, metadata_cache, clock=None):
+        self.parsed_number = parsed_number
+        self.clock = clock
+        self._metadata_cache = metadata_cache
+        self._region_code = _UNSET
+        self._number_type = _UNSET
+        self._metadata = _UNSET
+        self._e164 = _UNSET
+    
+    @property
+    def region_code(self):
+        """Region code of the number, or None if no region matches it"""
+        if self._region_code is _UNSET:
+            self._region_code = phonenumbers.region_code_for_number(self.parsed_number)
+        return self._region_code
+    
+    @property
+    def number_type(self):
+        """phonenumbers.PhoneNumberType of the number"""
+        if self._number_type is _UNSET:
+            # Same as phonenumbers.number_type, reusing the region code found above
+            metadata = PhoneMetadata.metadata_for_region_or_calling_code(
+                self.parsed_number.country_code, self.region_code
+            )
+            if metadata is None:
+                self._number_type = PhoneNumberType.UNKNOWN
+            else:
+                self._number_type = _number_type_helper(
+                    phonenumbers.national_significant_number(self.parsed_number), metadata
+                )
+        return self._number_type
+    
+    @property
+    def is_valid(self):
+        """Same as phonenumbers.is_valid_number: a number is valid if its type is known"""
+        return self.number_type != PhoneNumberType.UNKNOWN
+    
+    @property
+    def metadata(self):
+        """Carrier, location and timezone metadata from the metadata cache"""
+        if self._metadata is _UNSET:
+            self._metadata = self._metadata_cache.lookup(self.parsed_number, self.number_type, self.region_code)
+        return self._metadata
+    
+    @property
+    def e164(self):
+        """The number in E.164 format"""
+        if self._e164 is _UNSET:
+            self._e164 = phonenumbers.format_number(self.parsed_number, phonenumbers.PhoneNumberFormat.E164)
+        return self._e164
+    
+    def prepare(self, names):
+        """Compute the named values ahead of the stage that requires them"""
+        for name in names:
+            getattr(self, name)
+
+
+# An analysis stage: the results section it fills, the PhoneInfoTool method producing
+# it, its progress and error messages, the NumberContext values it requires, and the
+# tool attribute that makes it network-bound when set (None for CPU-only stages)
+Stage = namedtuple('Stage', 'section method message action requires network_client')
+
+# Stages of a full analysis, in the order they are run
+ANALYSIS_STAGES = (
+    Stage('basic_info', 'basic_info_for', "Gathering basic information", "getting basic info",
+          ('number_type', 'metadata'), None),
+    Stage('geolocation', 'geolocation_for', "Gathering geolocation information", "getting geolocation",
+          ('region_code', 'metadata'), 'geolocator'),
+    Stage('timezone_info', 'timezone_info_for', "Gathering timezone information", "getting timezone info",
+          ('metadata',), None),
+    Stage('online_databases', 'online_databases_for', "Searching online databases",
+          "searching online databases", ('e164',), 'online_search'),
+)
+
+STAGES_BY_SECTION = {stage.section: stage for stage in ANALYSIS_STAGES}
+
+# Short names accepted for the stages, e.g. --stages basic,timezone
+STAGE_ALIASES = {
+    'basic': 'basic_info',
+    'geo': 'geolocation',
+    'timezone': 'timezone_info',
+    'online': 'online_databases',
+}
+
+
+def select_stages(names=None):
+    """Return the stages named by section or short name, in pipeline order
+    
+    Without names every stage is selected. Unknown names raise ValueError.
+    """
+    if names is None:
+        return ANALYSIS_STAGES
+    sections = set()
+    for name in names:
+        section = STAGE_ALIASES.get(name, name)
+        if section not in STAGES_BY_SECTION:
+            raise ValueError(f"Unknown analysis stage: {name}")
+        sections.add(section)
+    return tuple(stage for stage in ANALYSIS_STAGES if stage.section in sections)
+
 
 class PhoneInfoTool:
     """Main class for the Phone Information Gathering Tool"""
     
-    def __init__(self):
-        """Initialize the PhoneInfoTool"""
+    def __init__(self, quiet=False, online_geocoding=False,
+                 geocode_cache_path=DEFAULT_CACHE_PATH, geocode_cache_ttl=DEFAULT_TTL,
+                 online_providers=None, default_region=DEFAULT_REGION, record_timings=False,
+                 result_cache_path=None, result_cache_ttls=None, stages=None):
+        """Initialize the PhoneInfoTool
+        
+        Args:
+            quiet: Suppress the banner and progress messages (used by bulk mode)
+            online_geocoding: Query Nominatim for locations missing from the
+                bundled offline centroid table
+            geocode_cache_path: SQLite file caching online geocoding results across
+                runs and processes, or None to cache in memory only
+            geocode_cache_ttl: Seconds before a cached geocoding result expires
+            online_providers: OnlineProvider instances queried by search_online_databases;
+                without any, placeholder data is returned
+            default_region: Region code used for numbers given without a country code
+            record_timings: Attach the duration of every step to each result
+            result_cache_path: SQLite file of a persistent result cache keyed by E.164,
+                consulted before running the stages, or None to always analyze
+            result_cache_ttls: Per-section lifetimes in seconds overriding
+                result_cache.DEFAULT_SECTION_TTLS
+            stages: Sections (or STAGE_ALIASES short names) to gather; the other
+                stages are skipped and their sections left out of the results.
+                Validation always runs. Defaults to every stage.
+        """
         self.results = {}
         self.phone_number = None
         self.parsed_number = None
-        self.geolocator = Nominatim(user_agent="phone_info_tool")
-        self.banner()
+        self.quiet = quiet
+        self.default_region = default_region
+        self.online_geocoding = online_geocoding
+        self.centroids = CentroidIndex()
+        self.metadata_cache = MetadataCache()
+        self.clock = ZoneClock()
+        self.metrics = StageMetrics()
+        self.record_timings = record_timings
+        self.stages = select_stages(stages)
+        self.result_cache_path = result_cache_path
+        self.result_cache_ttls = result_cache_ttls
+        self.geocode_cache_path = geocode_cache_path
+        self.geocode_cache_ttl = geocode_cache_ttl
+        self.geolocator = None
+        self.geocode_cache = None
+        self.geocode_limiter = None
+        if online_geocoding:
+            from geopy.geocoders import Nominatim
+            from rate_limit import SharedTokenBucket
+            self.geolocator = Nominatim(user_agent="phone_info_tool")
+            self.geocode_cache = GeocodeCache(geocode_cache_path, geocode_cache_ttl)
+            self.geocode_limiter = SharedTokenBucket(GEOCODE_RATE_LIMIT)
+        self.online_providers = list(online_providers or [])
+        self.online_search = None
+        if self.online_providers:
+            from online_providers import OnlineDatabaseSearch
+            self.online_search = OnlineDatabaseSearch(self.online_providers)
+        self.result_cache = None
+        if result_cache_path:
+            self.result_cache = ResultCache(result_cache_path, result_cache_ttls, self.cache_config())
+        if not quiet:
+            self.banner()
+    
+    def cache_config(self):
+        """Describe the settings cached sections depend on, keying the result cache"""
+        return {
+            'online_geocoding': bool(self.online_geocoding),
+            'online_providers': [[provider.name, provider.base_url] for provider in self.online_providers],
+            'stages': [stage.section for stage in self.stages]
+        }
+    
+    def cacheable_sections(self, computed):
+        """Return the computed sections the result cache should store
+        
+        Placeholder online data (no providers configured) and merged answers in
+        which every provider failed say nothing about the number, so they are
+        left out and looked up again next time.
+        """
+        if self.result_cache is None:
+            return {}
+        sections = {section: data for section, data in computed.items()
+                    if data is not None and section in self.result_cache.cached_sections}
+        online = sections.get('online_databases')
+        if online is not None:
+            sources = online.get('sources') if self.online_search is not None else None
+            if not sources or all('error' in source for source in sources.values()):
+                del sections['online_databases']
+        return sections
+    
+    def log(self, message, color='blue'):
+        """Print a colored status message unless the tool is in quiet mode"""
+        if not self.quiet:
+            print(f"{COLORS[color]}{message}{COLORS['reset']}")
     
     def banner(self):
         """Display the tool banner"""
@@ -65,196 +341,501 @@ class PhoneInfoTool:
     
     def validate_phone_number(self, phone_number):
         """Validate the phone number format"""
+        context = self.validated_context(phone_number)
+        return context.parsed_number if context else None
+    
+    def validated_context(self, phone_number):
+        """Parse and validate a phone number, returning its NumberContext or None if invalid"""
+        start = time.perf_counter()
+        context = self._validated_context(phone_number)
+        # Rejected inputs count as validation errors
+        self.metrics.record('validate', time.perf_counter() - start, error=context is None)
+        return context
+    
+    def _validated_context(self, phone_number):
+        """Parse and validate a phone number without recording metrics"""
         try:
             # Remove any non-digit characters except the + sign
             cleaned_number = re.sub(r'[^\d+]', '', phone_number)
             
-            # If the number doesn't start with +, assume it's missing the country code
+            # If the number doesn't start with +, read it as a national number of the default region
             if not cleaned_number.startswith('+'):
-                print(f"{COLORS['yellow']}[!] No country code provided. Assuming +1 (US/Canada).{COLORS['reset']}")
-                cleaned_number = '+1' + cleaned_number
+                self.log(f"[!] No country code provided. Assuming region {self.default_region}.", 'yellow')
+            
+            context = NumberContext(phonenumbers.parse(cleaned_number, self.default_region), self.metadata_cache)
             
-            parsed_number = phonenumbers.parse(cleaned_number, None)
+            # Numbers dialed with the common "00" international prefix
+            if not context.is_valid and cleaned_number.startswith('00'):
+                context = NumberContext(phonenumbers.parse('+' + cleaned_number[2:], None), self.metadata_cache)
             
-            if not phonenumbers.is_valid_number(parsed_number):
-                print(f"{COLORS['red']}[!] Invalid phone number format.{COLORS['reset']}")
+            if not context.is_valid:
+                self.log("[!] Invalid phone number format.", 'red')
                 return None
             
-            return parsed_number
+            return context
         
         except Exception as e:
-            print(f"{COLORS['red']}[!] Error validating phone number: {str(e)}{COLORS['reset']}")
+            self.log(f"[!] Error validating phone number: {str(e)}", 'red')
             return None
     
-    def get_basic_info(self):
-        """Get basic information about the phone number"""
-        try:
-            country_code = self.parsed_number.country_code
-            national_number = self.parsed_number.national_number
-            country = geocoder.description_for_number(self.parsed_number, 'en')
-            carrier_name = carrier.name_for_number(self.parsed_number, 'en')
-            time_zones = timezone.time_zones_for_number(self.parsed_number)
-            
-            # Format the phone number in international format
-            formatted_number = phonenumbers.format_number(
-                self.parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-            )
-            
-            # Check if the number is valid
-            is_valid = phonenumbers.is_valid_number(self.parsed_number)
-            
-            # Check if the number is possible
-            is_possible = phonenumbers.is_possible_number(self.parsed_number)
-            
-            # Get the number type (mobile, landline, etc.)
-            number_type = phonenumbers.number_type(self.parsed_number)
-            number_type_dict = {
-                0: "FIXED_LINE",
-                1: "MOBILE",
-                2: "FIXED_LINE_OR_MOBILE",
-                3: "TOLL_FREE",
-                4: "PREMIUM_RATE",
-                5: "SHARED_COST",
-                6: "VOIP",
-                7: "PERSONAL_NUMBER",
-                8: "PAGER",
-                9: "UAN",
-                10: "UNKNOWN",
-                27: "EMERGENCY",
-                28: "VOICEMAIL",
-                29: "SHORT_CODE",
-                30: "STANDARD_RATE"
-            }
-            number_type_str = number_type_dict.get(number_type, "UNKNOWN")
-            
-            self.results['basic_info'] = {
-                'formatted_number': formatted_number,
-                'country_code': country_code,
-                'national_number': national_number,
-                'country': country if country else "Unknown",
-                'carrier': carrier_name if carrier_name else "Unknown",
-                'time_zones': list(time_zones) if time_zones else ["Unknown"],
-                'is_valid': is_valid,
-                'is_possible': is_possible,
-                'number_type': number_type_str
+    def normalize_number(self, phone_number):
+        """Return the E.164 form of a phone number, or None if it is invalid"""
+        context = self.validated_context(phone_number)
+        return context.e164 if context else None
+    
+    def basic_info_for(self, context):
+        """Return the basic information section for a NumberContext"""
+        parsed_number = context.parsed_number
+        country_code = parsed_number.country_code
+        national_number = parsed_number.national_number
+        
+        metadata = context.metadata
+        country = metadata['description']
+        carrier_name = metadata['carrier']
+        time_zones = metadata['time_zones']
+        
+        # Format the phone number in international format
+        formatted_number = phonenumbers.format_number(
+            parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+        )
+        
+        # Check if the number is possible
+        is_possible = phonenumbers.is_possible_number(parsed_number)
+        
+        return {
+            'formatted_number': formatted_number,
+            'country_code': country_code,
+            'national_number': national_number,
+            'country': country if country else "Unknown",
+            'carrier': carrier_name if carrier_name else "Unknown",
+            'time_zones': list(time_zones) if time_zones else ["Unknown"],
+            'is_valid': context.is_valid,
+            'is_possible': is_possible,
+            'number_type': NUMBER_TYPE_NAMES.get(context.number_type, "UNKNOWN")
+        }
+    
+    def geolocation_for(self, context):
+        """Return the geolocation section for a NumberContext"""
+        metadata = context.metadata
+        
+        country = metadata['description']
+        if not country:
+            country = "Unknown"
+        
+        # Try to get more detailed location information
+        region = metadata['region_description']
+        if not region:
+            region = "Unknown"
+        
+        coordinates = {"latitude": "Unknown", "longitude": "Unknown"}
+        location = self.locate(country, context.region_code)
+        if location:
+            coordinates = {
+                "latitude": location[0],
+                "longitude": location[1]
             }
-            
-            return True
         
-        except Exception as e:
-            print(f"{COLORS['red']}[!] Error getting basic info: {str(e)}{COLORS['reset']}")
-            return False
+        return {
+            'country': country,
+            'region': region,
+            'coordinates': coordinates
+        }
     
-    def get_geolocation(self):
-        """Get geolocation information for the phone number"""
+    def locate(self, description, region_code):
+        """Resolve a location description to (latitude, longitude), or None if unknown
+        
+        The bundled centroid table is consulted first. Descriptions it does not know
+        (e.g. cities) are geocoded with Nominatim when online geocoding is enabled,
+        otherwise they fall back to the centroid of the number's region.
+        """
+        location = self.centroids.lookup(description)
+        if location is None and self.geolocator is not None and description != "Unknown":
+            location = self.geocode(description)
+        if location is None:
+            location = self.centroids.lookup(region_code=region_code)
+        return location
+    
+    def geocode(self, query):
+        """Geocode a query with Nominatim through the geocode cache
+        
+        Lookup failures are not cached so that they are retried on the next call.
+        Only cache misses wait on ``geocode_limiter``, right before the request.
+        """
+        location = self.geocode_cache.get(query)
+        if location is not MISS:
+            return location
+        if self.geocode_limiter is not None:
+            self.geocode_limiter.acquire()
         try:
-            country = geocoder.description_for_number(self.parsed_number, 'en')
-            if not country:
-                country = "Unknown"
-            
-            # Try to get more detailed location information
-            region = geocoder.description_for_number(self.parsed_number, 'en', region=True)
-            if not region:
-                region = "Unknown"
-            
-            # Get coordinates using geopy if country is known
-            coordinates = {"latitude": "Unknown", "longitude": "Unknown"}
-            if country != "Unknown":
-                try:
-                    location = self.geolocator.geocode(country)
-                    if location:
-                        coordinates = {
-                            "latitude": location.latitude,
-                            "longitude": location.longitude
-                        }
-                except Exception:
-                    pass
-            
-            self.results['geolocation'] = {
-                'country': country,
-                'region': region,
-                'coordinates': coordinates
-            }
-            
-            return True
+            result = self.geolocator.geocode(query)
+        except Exception:
+            return None
+        location = (result.latitude, result.longitude) if result else None
+        self.geocode_cache.set(query, location)
+        return location
+    
+    def timezone_info_for(self, context):
+        """Return the timezone information section for a NumberContext
         
-        except Exception as e:
-            print(f"{COLORS['red']}[!] Error getting geolocation: {str(e)}{COLORS['reset']}")
-            return False
+        Times come from the batch clock of the context when it has one, so all
+        the numbers of a batch share one snapshot and one formatting per zone.
+        """
+        clock = context.clock or self.clock
+        return clock.section(context.metadata['time_zones'])
+    
+    def online_databases_for(self, context):
+        """Return the online database section for a NumberContext"""
+        if self.online_search is not None:
+            return self.online_search.search(context.e164)
+        
+        # Without configured providers, return placeholder data
+        return {
+            'spam_score': "Low",  # This would come from a real spam database
+            'reported_count': 0,   # Number of times reported as spam
+            'last_reported': "Never",
+            'tags': ["Not in database"],
+            'note': "This is a placeholder. In a real implementation, this would connect to actual phone number databases."
+        }
+    
+    def get_basic_info(self):
+        """Get basic information about the phone number"""
+        return self._store_section(STAGES_BY_SECTION['basic_info'])
+    
+    def get_geolocation(self):
+        """Get geolocation information for the phone number"""
+        return self._store_section(STAGES_BY_SECTION['geolocation'])
     
     def get_timezone_info(self):
         """Get timezone information for the phone number"""
-        try:
-            time_zones = timezone.time_zones_for_number(self.parsed_number)
-            
-            tz_info = []
-            for tz in time_zones:
-                tz_info.append({
-                    'name': tz,
-                    'current_time': datetime.now().astimezone(pytz.timezone(tz)).strftime('%Y-%m-%d %H:%M:%S %Z%z')
-                })
-            
-            if not tz_info:
-                tz_info = [{"name": "Unknown", "current_time": "Unknown"}]
-            
-            self.results['timezone_info'] = tz_info
-            
-            return True
-        
-        except Exception as e:
-            print(f"{COLORS['red']}[!] Error getting timezone info: {str(e)}{COLORS['reset']}")
-            return False
+        return self._store_section(STAGES_BY_SECTION['timezone_info'])
     
     def search_online_databases(self):
         """Search online databases for additional information"""
-        try:
-            # This is a placeholder for actual API calls to online databases
-            # In a real implementation, you would integrate with various APIs
-            # that provide phone number lookup services
-            
-            # For demonstration purposes, we'll just add some placeholder data
-            self.results['online_databases'] = {
-                'spam_score': "Low",  # This would come from a real spam database
-                'reported_count': 0,   # Number of times reported as spam
-                'last_reported': "Never",
-                'tags': ["Not in database"],
-                'note': "This is a placeholder. In a real implementation, this would connect to actual phone number databases."
-            }
-            
-            return True
+        return self._store_section(STAGES_BY_SECTION['online_databases'])
+    
+    def _store_section(self, stage):
+        """Run a stage on the current number and store its output in self.results"""
+        data = self.run_stage(stage, NumberContext(self.parsed_number, self.metadata_cache))
+        if data is None:
+            return False
+        self.results[stage.section] = data
+        return True
+    
+    def run_stage(self, stage, context, timings=None):
+        """Run one analysis stage on a NumberContext, returning None if it fails
         
+        The duration is recorded in ``self.metrics`` and, when given, stored in
+        the ``timings`` dictionary under the stage's section name.
+        """
+        start = time.perf_counter()
+        try:
+            context.prepare(stage.requires)
+            data = getattr(self, stage.method)(context)
         except Exception as e:
-            print(f"{COLORS['red']}[!] Error searching online databases: {str(e)}{COLORS['reset']}")
-            return False
+            self.log(f"[!] Error {stage.action}: {str(e)}", 'red')
+            data = None
+        elapsed = time.perf_counter() - start
+        self.metrics.record(stage.section, elapsed, error=data is None)
+        if timings is not None:
+            timings[stage.section] = elapsed
+        return data
+    
+    def uses_network(self, stage):
+        """Return True if running the stage involves network requests with this configuration"""
+        return stage.network_client is not None and getattr(self, stage.network_client) is not None
+    
+    def lookup(self, phone_number, clock=None):
+        """Analyze a phone number and return an immutable AnalysisResult
+        
+        Unlike analyze_number, this keeps no per-request state on the instance, so a
+        single tool can serve lookups from many threads at once. Batches pass their
+        ZoneClock as ``clock`` so all their numbers report the same current times.
+        """
+        return self._analyze(phone_number, clock)[1]
+    
+    def _analyze(self, phone_number, clock=None):
+        """Analyze a phone number, returning (parsed_number, AnalysisResult)"""
+        self.log(f"[*] Analyzing phone number: {phone_number}")
+        start = time.perf_counter()
+        
+        context = self.validated_context(phone_number)
+        if not context:
+            return None, self._invalid_lookup(phone_number, start)
+        context.clock = clock
+        
+        cached = self.result_cache.get(context.e164) if self.result_cache is not None else {}
+        result, fresh = self._run_stages(phone_number, context, cached, start)
+        if fresh:
+            self.result_cache.set(context.e164, fresh)
+        return context.parsed_number, result
+    
+    def lookup_many(self, phone_numbers, clock=None):
+        """Analyze many phone numbers, returning their AnalysisResults in input order
+        
+        With a result cache, the cached sections of all the numbers are read in
+        one query and the new ones written in one transaction, so only numbers
+        that are new or expired cost an analysis.
+        """
+        if self.result_cache is None:
+            return [self.lookup(phone_number, clock) for phone_number in phone_numbers]
+        
+        validated = []
+        for phone_number in phone_numbers:
+            start = time.perf_counter()
+            validated.append((phone_number, self.validated_context(phone_number), start))
+        cached = self.result_cache.get_many(context.e164 for _, context, _ in validated if context)
+        
+        results = []
+        fresh = {}
+        for phone_number, context, start in validated:
+            if not context:
+                results.append(self._invalid_lookup(phone_number, start))
+                continue
+            context.clock = clock
+            sections = cached.setdefault(context.e164, {})
+            result, new_sections = self._run_stages(phone_number, context, sections, start)
+            if new_sections:
+                # Later duplicates of the number in this batch reuse these sections
+                sections.update(new_sections)
+                fresh.setdefault(context.e164, {}).update(new_sections)
+            results.append(result)
+        self.result_cache.set_many(fresh)
+        return results
+    
+    def _run_stages(self, phone_number, context, cached, start):
+        """Run the stages whose section is not in ``cached`` on a validated context
+        
+        Returns the AnalysisResult and the {section: data} computed sections that
+        the result cache stores (empty without a result cache).
+        """
+        computed = {}
+        timings = self._start_timings(start)
+        for stage in self.stages:
+            if stage.section in cached:
+                continue
+            self.log(f"[*] {stage.message}...")
+            computed[stage.section] = self.run_stage(stage, context, timings)
+        if cached:
+            self.log(f"[*] Reused cached {', '.join(sorted(cached))}")
+        return self._finish_lookup(phone_number, cached, computed, start, timings)
+    
+    def _start_timings(self, start):
+        """Return the timings of a lookup started at ``start`` once validated (None unless recorded)"""
+        return {'validate': time.perf_counter() - start} if self.record_timings else None
+    
+    def _finish_lookup(self, phone_number, cached, computed, start, timings):
+        """Record a finished lookup and build its result from the cached and computed sections
+        
+        Shared by lookup(), lookup_many() and the async engine so they report the
+        same metrics. Returns the AnalysisResult and the computed sections that the
+        result cache stores.
+        """
+        elapsed = time.perf_counter() - start
+        self.metrics.record('lookup', elapsed)
+        if timings is not None:
+            timings['total'] = elapsed
+        sections = {stage.section: computed[stage.section] if stage.section in computed else cached[stage.section]
+                    for stage in self.stages}
+        return AnalysisResult.from_sections(phone_number, True, sections, timings), self.cacheable_sections(computed)
+    
+    def _invalid_lookup(self, phone_number, start):
+        """Record a lookup rejected at validation and return its result"""
+        self.metrics.record('lookup', time.perf_counter() - start, error=True)
+        return AnalysisResult.from_sections(phone_number, False, {})
     
     def analyze_number(self, phone_number):
         """Analyze the provided phone number and gather all available information"""
-        print(f"{COLORS['blue']}[*] Analyzing phone number: {phone_number}{COLORS['reset']}")
-        
+        self.parsed_number, result = self._analyze(phone_number)
         self.phone_number = phone_number
-        self.parsed_number = self.validate_phone_number(phone_number)
+        self.results = result.to_dict()
+        return result.valid
+    
+    def iter_batch(self, phone_numbers, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Analyze many phone numbers, yielding (phone_number, results) pairs in input order
         
-        if not self.parsed_number:
-            return False
+        The input is split into chunks of ``chunksize`` numbers which are dispatched
+        to a pool of ``workers`` processes (defaults to the number of CPUs). Only a
+        bounded number of chunks is in flight at once, so arbitrarily long inputs
+        can be streamed. ``results`` is None for numbers that fail validation.
+        """
+        return self._map_chunks(_analyze_chunk, phone_numbers, workers, chunksize)
+    
+    def iter_fast_batch(self, phone_numbers, chunksize=None):
+        """Yield (phone_number, results) pairs holding only basic_info, classified in bulk
         
-        print(f"{COLORS['blue']}[*] Gathering basic information...{COLORS['reset']}")
-        self.get_basic_info()
+        Numbers are read as numbers of the default region and classified a chunk at
+        a time by prefix_classifier.PrefixClassifier, with NumPy lookups instead of
+        a phonenumbers object per number. Numbers it cannot classify exactly are
+        analyzed one by one. The result cache is not used. Requires numpy and a
+        region alone on its country code (ValueError otherwise).
+        """
+        from prefix_classifier import PrefixClassifier, FALLBACK, DEFAULT_FAST_CHUNKSIZE
+        classifier = PrefixClassifier(self.default_region)
+        basic_info = STAGES_BY_SECTION['basic_info']
+        for chunk in _iter_chunks(phone_numbers, chunksize or DEFAULT_FAST_CHUNKSIZE):
+            start = time.perf_counter()
+            entries = classifier.basic_info(chunk, NUMBER_TYPE_NAMES)
+            self.metrics.record('fast_basic_info', time.perf_counter() - start)
+            for phone_number, data in zip(chunk, entries):
+                if data is FALLBACK:
+                    context = self.validated_context(phone_number)
+                    data = self.run_stage(basic_info, context) if context else None
+                yield phone_number, {'basic_info': data} if data is not None else None
+    
+    def normalize_batch(self, phone_numbers, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Return the E.164 forms of many phone numbers (None for invalid ones), in input order"""
+        return [e164 for _, e164 in self._map_chunks(_normalize_chunk, phone_numbers, workers, chunksize)]
+    
+    def _map_chunks(self, function, items, workers, chunksize):
+        """Apply a chunk function to items across worker processes, yielding (item, output) in order"""
+        if workers is None:
+            workers = os.cpu_count() or 1
+        chunks = _iter_chunks(items, chunksize)
+        # One clock snapshot for the whole batch, shared with the worker processes
+        clock = ZoneClock.snapshot()
         
-        print(f"{COLORS['blue']}[*] Gathering geolocation information...{COLORS['reset']}")
-        self.get_geolocation()
+        if workers <= 1:
+            for chunk in chunks:
+                yield from zip(chunk, function(chunk, self, clock))
+            return
         
-        print(f"{COLORS['blue']}[*] Gathering timezone information...{COLORS['reset']}")
-        self.get_timezone_info()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self._worker_options(), clock.now, self.geocode_limiter)) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(_run_in_worker, function, chunk)))
+                if len(pending) >= workers * 2:
+                    done_chunk, future = pending.popleft()
+                    yield from zip(done_chunk, self._worker_outputs(future))
+            while pending:
+                done_chunk, future = pending.popleft()
+                yield from zip(done_chunk, self._worker_outputs(future))
+    
+    def _worker_outputs(self, future):
+        """Return the outputs of a worker task, merging the metrics it recorded into self.metrics"""
+        outputs, steps = future.result()
+        self.metrics.merge(steps)
+        return outputs
+    
+    async def analyze_many_async(self, phone_numbers, concurrency=None, rate_limits=None):
+        """Analyze many phone numbers with their network stages running concurrently
         
-        print(f"{COLORS['blue']}[*] Searching online databases...{COLORS['reset']}")
-        self.search_online_databases()
+        Online geocoding and online database searches run in a thread pool, at most
+        ``concurrency`` at a time and within the per-host ``rate_limits``
+        (requests per second). Returns AnalysisResult objects in input order.
+        """
+        from async_engine import analyze_many_async, DEFAULT_CONCURRENCY
+        return await analyze_many_async(self, phone_numbers, concurrency or DEFAULT_CONCURRENCY, rate_limits)
+    
+    def _worker_options(self):
+        """Constructor arguments that recreate this tool's configuration in a worker process"""
+        return {
+            'online_geocoding': self.online_geocoding,
+            'geocode_cache_path': self.geocode_cache_path,
+            'geocode_cache_ttl': self.geocode_cache_ttl,
+            'online_providers': self.online_providers,
+            'default_region': self.default_region,
+            'record_timings': self.record_timings,
+            'stages': [stage.section for stage in self.stages],
+            'result_cache_path': self.result_cache_path,
+            'result_cache_ttls': self.result_cache_ttls
+        }
+    
+    def analyze_batch(self, phone_numbers, workers=None, chunksize=DEFAULT_CHUNKSIZE, dedupe=False,
+                      compact=False):
+        """Analyze many phone numbers in parallel and return their results in input order
         
-        return True
+        Each entry of the returned list is the results dictionary for the number at
+        the same position in ``phone_numbers``, or None if the number is invalid.
+        With ``dedupe``, numbers are first normalized to E.164 and each distinct
+        number is analyzed once; its results are shared by all of its input rows.
+        With ``compact``, a compact_results.ResultBatch is returned instead of a
+        list: it is indexed and iterated the same way but holds the results in
+        typed arrays, for batches too large to keep as dictionaries.
+        """
+        if not dedupe:
+            pairs = self.iter_batch(phone_numbers, workers, chunksize)
+            return ResultBatch(pairs) if compact else [results for _, results in pairs]
+        
+        phone_numbers = list(phone_numbers)
+        canonical = self.normalize_batch(phone_numbers, workers, chunksize)
+        if not compact:
+            analyzed = dict(self.iter_batch(unique_numbers(canonical), workers, chunksize))
+            return [analyzed.get(e164) for e164 in canonical]
+        analyzed = ResultBatch(self.iter_batch(unique_numbers(canonical), workers, chunksize))
+        return ResultBatch(zip(phone_numbers, _shared_results(analyzed, canonical)))
+    
+    def aggregate_batch(self, phone_numbers, workers=None, chunksize=DEFAULT_CHUNKSIZE, distinct=False):
+        """Analyze many phone numbers and return an aggregation.ResultAggregator of their results
+        
+        Results are counted as they arrive and not kept, so memory does not grow
+        with the number of inputs. ``distinct`` also estimates the number of
+        distinct numbers (HyperLogLog).
+        """
+        return ResultAggregator(distinct=distinct).extend(self.iter_batch(phone_numbers, workers, chunksize))
+    
+    def export_batch(self, phone_numbers, output_file, format_type=None, workers=None,
+                     chunksize=DEFAULT_CHUNKSIZE, fields=None):
+        """Analyze many phone numbers and stream their results to a file as they are produced
+        
+        ``format_type`` is 'json', 'jsonl', 'csv', 'parquet' or 'arrow' (guessed from
+        the file extension when not given). ``fields`` restricts the written columns
+        or sections (see result_writers.select_schema). Returns the writer, whose
+        ``count`` and ``valid_count`` report how many results were written.
+        """
+        return self.write_results(open_writer(output_file, format_type, fields=fields),
+                                  self.iter_batch(phone_numbers, workers, chunksize))
+    
+    def write_results(self, writer, pairs):
+        """Write (phone_number, results) pairs with a result writer and close it
+        
+        The time spent writing (not producing the results) is recorded in
+        ``self.metrics`` as one "export_<format>" run. Returns the writer.
+        """
+        elapsed = 0.0
+        failed = True
+        try:
+            for phone_number, results in pairs:
+                start = time.perf_counter()
+                writer.write(phone_number, results)
+                elapsed += time.perf_counter() - start
+            failed = False
+        finally:
+            start = time.perf_counter()
+            writer.close()
+            elapsed += time.perf_counter() - start
+            self.metrics.record(f"export_{writer.format_type}", elapsed, error=failed)
+        return writer
+    
+    def stats(self):
+        """Return the recorded step metrics and the statistics of the caches
+        
+        Steps are 'validate', 'lookup', each analysis section and each export
+        format. Process-pool batches merge the step metrics of their workers;
+        cache statistics cover this process only.
+        """
+        return {
+            'stages': self.metrics.summary(),
+            'caches': self.cache_stats()
+        }
+    
+    def cache_stats(self):
+        """Return the stats() of every cache of the tool, keyed by cache name"""
+        caches = {'metadata': self.metadata_cache.stats()}
+        if self.geocode_cache is not None:
+            caches['geocode'] = self.geocode_cache.stats()
+        if self.result_cache is not None:
+            caches['result'] = self.result_cache.stats()
+        return caches
+    
+    def prometheus_metrics(self):
+        """Return the step and cache metrics in the Prometheus text exposition format"""
+        return prometheus_text(self.metrics.snapshot(), self.cache_stats())
     
     def display_results(self):
         """Display the gathered information in a formatted way"""
         if not self.results:
-            print(f"{COLORS['red']}[!] No results to display.{COLORS['reset']}")
+            self.log("[!] No results to display.", 'red')
             return
         
         print(f"\n{COLORS['green']}{COLORS['bold']}===== PHONE NUMBER ANALYSIS RESULTS ====={COLORS['reset']}\n")
@@ -288,6 +869,8 @@ class PhoneInfoTool:
             for tz in self.results['timezone_info']:
                 print(f"  Timezone: {tz['name']}")
                 print(f"  Current Time: {tz['current_time']}")
+                if 'utc_offset' in tz:
+                    print(f"  UTC Offset: {tz['utc_offset']}")
             print()
         
         # Display online database results
@@ -300,81 +883,64 @@ class PhoneInfoTool:
             print(f"  Tags: {', '.join(db['tags'])}")
             print(f"  Note: {db['note']}")
             print()
+        
+        # Display step durations when timings are recorded
+        if 'timings' in self.results:
+            print(f"{COLORS['cyan']}{COLORS['bold']}Timings:{COLORS['reset']}")
+            for step, seconds in self.results['timings'].items():
+                print(f"  {step}: {seconds * 1000:.3f} ms")
+            print()
     
-    def export_results(self, format_type='json', filename=None):
-        """Export the results to a file in the specified format"""
-        if not self.results:
-            print(f"{COLORS['red']}[!] No results to export.{COLORS['reset']}")
+    def export_results(self, format_type='json', filename=None, result=None):
+        """Export the results to a file in the specified format
+        
+        Exports ``result`` (an AnalysisResult) when given, otherwise the results of
+        the last analyze_number call. Returns the path of the written file, or False.
+        """
+        start = time.perf_counter()
+        output_file = self._export_results(format_type, filename, result)
+        self.metrics.record(f"export_{format_type.lower()}", time.perf_counter() - start, error=not output_file)
+        return output_file
+    
+    def _export_results(self, format_type, filename, result):
+        """Export results without recording metrics"""
+        if result is not None:
+            results, phone_number = result.to_dict(), result.phone_number
+        else:
+            results, phone_number = self.results, self.phone_number
+        
+        if not results:
+            self.log("[!] No results to export.", 'red')
             return False
         
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            phone_part = re.sub(r'[^\d]', '', self.phone_number)[-4:]
-            filename = f"phone_info_{phone_part}_{timestamp}"
+            filename = default_export_filename(phone_number)
         
         try:
+            if format_type.lower() in ('csv', 'excel', 'html'):
+                # pandas is slow to import and only needed by these formats
+                import pandas as pd
+            
             if format_type.lower() == 'json':
                 with open(f"{filename}.json", 'w', encoding='utf-8') as f:
-                    json.dump(self.results, f, indent=4)
+                    json.dump(results, f, indent=4)
                 output_file = f"{filename}.json"
             
             elif format_type.lower() == 'csv':
-                # Convert nested dict to flat structure for CSV
-                flat_data = {}
-                for category, data in self.results.items():
-                    if isinstance(data, list):
-                        for i, item in enumerate(data):
-                            for key, value in item.items():
-                                flat_data[f"{category}_{i+1}_{key}"] = value
-                    elif isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, dict):
-                                for subkey, subvalue in value.items():
-                                    flat_data[f"{category}_{key}_{subkey}"] = subvalue
-                            else:
-                                flat_data[f"{category}_{key}"] = value
-                
-                df = pd.DataFrame([flat_data])
+                # Flatten the nested dict for CSV
+                df = pd.DataFrame([flatten_results(results)])
                 df.to_csv(f"{filename}.csv", index=False)
                 output_file = f"{filename}.csv"
             
             elif format_type.lower() == 'excel':
                 # Similar to CSV but for Excel
-                flat_data = {}
-                for category, data in self.results.items():
-                    if isinstance(data, list):
-                        for i, item in enumerate(data):
-                            for key, value in item.items():
-                                flat_data[f"{category}_{i+1}_{key}"] = value
-                    elif isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, dict):
-                                for subkey, subvalue in value.items():
-                                    flat_data[f"{category}_{key}_{subkey}"] = subvalue
-                            else:
-                                flat_data[f"{category}_{key}"] = value
-                
-                df = pd.DataFrame([flat_data])
+                df = pd.DataFrame([flatten_results(results)])
                 df.to_excel(f"{filename}.xlsx", index=False)
                 output_file = f"{filename}.xlsx"
             
             elif format_type.lower() == 'html':
                 # Create a simple HTML report
-                flat_data = {}
-                for category, data in self.results.items():
-                    if isinstance(data, list):
-                        for i, item in enumerate(data):
-                            for key, value in item.items():
-                                flat_data[f"{category}_{i+1}_{key}"] = value
-                    elif isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, dict):
-                                for subkey, subvalue in value.items():
-                                    flat_data[f"{category}_{key}_{subkey}"] = subvalue
-                            else:
-                                flat_data[f"{category}_{key}"] = value
-                
-                df = pd.DataFrame([flat_data])
+                df = pd.DataFrame([flatten_results(results)])
                 # Replace build_table with pandas' to_html method with some basic styling
                 html_table = df.to_html(classes='table table-striped table-hover', border=0)
                 
@@ -392,7 +958,7 @@ class PhoneInfoTool:
                 </head>
                 <body>
                     <h1>Phone Information Report</h1>
-                    <p>Phone Number: {self.results.get('basic_info', {}).get('formatted_number', 'Unknown')}</p>
+                    <p>Phone Number: {results.get('basic_info', {}).get('formatted_number', 'Unknown')}</p>
                     <p class="timestamp">Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
                     {html_table}
                     <div class="footer">
@@ -408,24 +974,330 @@ class PhoneInfoTool:
                 output_file = f"{filename}.html"
             
             else:
-                print(f"{COLORS['red']}[!] Unsupported export format: {format_type}{COLORS['reset']}")
+                self.log(f"[!] Unsupported export format: {format_type}", 'red')
                 return False
             
-            print(f"{COLORS['green']}[+] Results exported to {output_file}{COLORS['reset']}")
-            return True
+            self.log(f"[+] Results exported to {output_file}", 'green')
+            return output_file
         
         except Exception as e:
-            print(f"{COLORS['red']}[!] Error exporting results: {str(e)}{COLORS['reset']}")
+            self.log(f"[!] Error exporting results: {str(e)}", 'red')
             return False
 
 
+def default_export_filename(phone_number):
+    """Build the default export file name (without extension) for a phone number"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    phone_part = re.sub(r'[^\d]', '', phone_number)[-4:]
+    return f"phone_info_{phone_part}_{timestamp}"
+
+
+# Tool instance and batch clock owned by each bulk-mode worker process
+_worker_tool = None
+_worker_clock = None
+
+
+def _init_batch_worker(options, now, geocode_limiter=None):
+    """Create the per-process PhoneInfoTool and batch clock used by bulk-mode workers
+    
+    Workers geocode through the parent's SharedTokenBucket, so the whole pool stays
+    within GEOCODE_RATE_LIMIT.
+    """
+    global _worker_tool, _worker_clock
+    _worker_tool = PhoneInfoTool(quiet=True, **options)
+    _worker_clock = ZoneClock(now)
+    if geocode_limiter is not None:
+        _worker_tool.geocode_limiter = geocode_limiter
+
+
+def _run_in_worker(function, chunk):
+    """Run a chunk function in a worker process, returning its outputs and the metrics it recorded"""
+    outputs = function(chunk)
+    return outputs, _worker_tool.metrics.drain()
+
+
+def _analyze_chunk(phone_numbers, tool=None, clock=None):
+    """Analyze a chunk of phone numbers and return their results (None when invalid)"""
+    tool = tool or _worker_tool
+    clock = clock or _worker_clock
+    return [result.to_dict() if result.valid else None for result in tool.lookup_many(phone_numbers, clock)]
+
+
+def _normalize_chunk(phone_numbers, tool=None, clock=None):
+    """Normalize a chunk of phone numbers to E.164 (None when invalid)"""
+    tool = tool or _worker_tool
+    return [tool.normalize_number(phone_number) for phone_number in phone_numbers]
+
+
+def unique_numbers(canonical_numbers):
+    """Return the distinct valid numbers of a normalized batch, in first-seen order"""
+    return list(dict.fromkeys(number for number in canonical_numbers if number))
+
+
+def _iter_chunks(iterable, size):
+    """Split an iterable into lists of at most ``size`` items"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_numbers(path):
+    """Yield the non-empty lines of a phone number list file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def run_batch(tool, input_file, output_file=None, workers=None, chunksize=DEFAULT_CHUNKSIZE,
+              engine='process', concurrency=None, dedupe=False, format_type=None, fields=None, fast_path=False,
+              summary=False, distinct=False, quiet=None):
+    """Analyze every number in ``input_file`` and stream the results to a file
+    
+    ``engine`` selects the process pool ('process') or the asyncio engine ('async'),
+    which suits runs dominated by online geocoding and database lookups. With
+    ``dedupe``, each distinct E.164 number is analyzed once and its results are
+    shared by every input line that normalizes to it. ``format_type`` is one of
+    result_writers.WRITERS, guessed from the output file extension when not given;
+    ``fields`` restricts the written columns or sections. ``fast_path`` gathers
+    basic_info with the vectorized prefix classifier (see iter_fast_batch) once a
+    sample of the input gives the same results as the per-number analysis.
+    With ``summary``, only the aggregates of the batch are written, as JSON or
+    CSV (see result_writers.SummaryWriter); ``distinct`` adds an estimate of the
+    number of distinct numbers. ``quiet`` suppresses the progress messages and
+    defaults to ``tool.quiet`` (bulk mode always analyzes with a quiet tool, so
+    the CLI passes --quiet here).
+    """
+    if quiet is None:
+        quiet = tool.quiet
+    
+    def log(message, color='blue'):
+        if not quiet:
+            print(f"{COLORS[color]}{message}{COLORS['reset']}")
+    
+    format_type = canonical_format(format_type or (format_for_path(output_file) if output_file else 'json'))
+    if not output_file:
+        prefix = 'phone_info_summary' if summary else 'phone_info_batch'
+        output_file = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension_for_format(format_type)}"
+    
+    log(f"[*] Analyzing numbers from {input_file}...")
+    start = time.time()
+    phone_numbers = list(_read_numbers(input_file)) if dedupe else _read_numbers(input_file)
+    if dedupe:
+        canonical = tool.normalize_batch(phone_numbers, workers, chunksize)
+        to_analyze = unique_numbers(canonical)
+    else:
+        to_analyze = phone_numbers
+    if fast_path:
+        fast_path, to_analyze = _check_fast_path(tool, to_analyze)
+    if fast_path:
+        pairs = tool.iter_fast_batch(to_analyze)
+    elif engine == 'async':
+        import asyncio
+        results = asyncio.run(tool.analyze_many_async(to_analyze, concurrency))
+        pairs = ((result.phone_number, result.to_dict() if result.valid else None) for result in results)
+    else:
+        pairs = tool.iter_batch(to_analyze, workers, chunksize)
+    if dedupe:
+        # Distinct results are held compactly until every input line is written
+        pairs = zip(phone_numbers, _shared_results(ResultBatch(pairs), canonical))
+    
+    if summary:
+        writer = SummaryWriter(output_file, format_type, distinct)
+    else:
+        writer = open_writer(output_file, format_type, fields=fields)
+    writer = tool.write_results(writer, pairs)
+    elapsed = time.time() - start
+    
+    if dedupe:
+        log(f"[*] {len(to_analyze)} distinct numbers among {writer.count} inputs")
+    rate = writer.count / elapsed if elapsed else 0
+    log(f"[+] Analyzed {writer.count} numbers ({writer.valid_count} valid) in {elapsed:.2f}s "
+        f"({rate:.0f} numbers/s)", 'green')
+    log(f"[+] {'Summary' if summary else 'Results'} exported to {output_file}", 'green')
+    return output_file
+
+
+def _shared_results(analyzed, canonical):
+    """Yield the results of each E.164 number of ``canonical`` from a ResultBatch of distinct numbers"""
+    rows = {e164: row for row, e164 in enumerate(analyzed.numbers)}
+    for e164 in canonical:
+        row = rows.get(e164)
+        yield analyzed[row] if row is not None else None
+
+
+def _check_fast_path(tool, phone_numbers):
+    """Compare the fast path with the per-number analysis on the first numbers of an input
+    
+    Returns whether the fast path can be used, and the numbers (with the sample
+    put back in front).
+    """
+    iterator = iter(phone_numbers)
+    sample = list(islice(iterator, FAST_PATH_SAMPLE))
+    phone_numbers = chain(sample, iterator)
+    try:
+        from prefix_classifier import mismatches
+        differences = mismatches(tool, sample)
+    except (ImportError, ValueError) as e:
+        print(f"{COLORS['yellow']}[!] Fast path unavailable ({e}); analyzing numbers one by one{COLORS['reset']}")
+        return False, phone_numbers
+    if differences:
+        phone_number, _, _ = differences[0]
+        print(f"{COLORS['yellow']}[!] Fast path disagrees with the full analysis on {len(differences)} sample "
+              f"numbers (e.g. {phone_number}); analyzing numbers one by one{COLORS['reset']}")
+        return False, phone_numbers
+    return True, phone_numbers
+
+
+def parse_args(argv=None):
+    """Parse the command line arguments"""
+    parser = argparse.ArgumentParser(description="Phone Information Gathering Tool")
+    parser.add_argument('phone_number', nargs='?', help="Phone number to analyze (with country code)")
+    parser.add_argument('-i', '--input', help="File with one phone number per line (bulk mode)")
+    parser.add_argument('-o', '--output', help="Output file for bulk mode results")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Print only the results: no banner, progress messages or export prompt")
+    parser.add_argument('-f', '--format', choices=sorted(set(WRITERS) | set(FORMAT_EXTENSIONS)), default=None,
+                        help="Bulk mode output format (default: from the output file extension, else json)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="Number of worker processes for bulk mode (default: CPU count)")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Numbers per worker task in bulk mode (default: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument('--online-provider', action='append', default=[], metavar='URL',
+                        help="JSON API queried as GET URL?number=<E.164> for spam reports (repeatable)")
+    parser.add_argument('--engine', choices=('process', 'async'), default='process',
+                        help="Bulk mode engine: process pool (CPU-bound) or asyncio (network-bound)")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Maximum concurrent network lookups for the async engine")
+    parser.add_argument('--default-region', default=DEFAULT_REGION, type=str.upper,
+                        help=f"Region assumed for numbers without a country code (default: {DEFAULT_REGION})")
+    parser.add_argument('--serve', type=int, metavar='PORT', default=None,
+                        help="Run the HTTP lookup service on PORT (see lookup_server.py)")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Address the HTTP lookup service listens on (default: 127.0.0.1)")
+    parser.add_argument('--request-timeout', type=float, default=10.0,
+                        help="Seconds allowed for an HTTP lookup request before answering 504 (default: 10)")
+    parser.add_argument('--timings', action='store_true',
+                        help="Attach the duration of every analysis step to each result")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Write per-step and cache metrics in the Prometheus text format ('-' for stdout)")
+    parser.add_argument('--dedupe', action='store_true',
+                        help="In bulk mode, analyze each distinct E.164 number only once")
+    parser.add_argument('--online-geocoding', action='store_true',
+                        help="Geocode locations missing from the offline table with Nominatim")
+    parser.add_argument('--geocode-cache', default=DEFAULT_CACHE_PATH,
+                        help=f"SQLite file caching online geocoding results (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument('--geocode-cache-ttl', type=int, default=DEFAULT_TTL,
+                        help=f"Seconds before a cached geocoding result expires (default: {DEFAULT_TTL})")
+    parser.add_argument('--result-cache', nargs='?', const=DEFAULT_RESULT_CACHE_PATH, default=None, metavar='FILE',
+                        help=f"Reuse results stored in a SQLite cache keyed by E.164 (default file: "
+                             f"{DEFAULT_RESULT_CACHE_PATH})")
+    parser.add_argument('--result-cache-ttl', action='append', default=[], metavar='SECTION=SECONDS',
+                        type=_section_ttl, help="Lifetime of a cached section, e.g. online_databases=3600 (repeatable)")
+    parser.add_argument('--stages', type=_name_list, metavar='STAGE,...',
+                        help="Analysis stages to run: basic, geo, timezone, online or section names "
+                             "(default: all, or those needed by --fields)")
+    parser.add_argument('--fields', type=_name_list, metavar='FIELD,...',
+                        help="Export only these columns or sections, e.g. basic_info_is_valid,basic_info_number_type")
+    parser.add_argument('--fast-path', action='store_true',
+                        help="In bulk mode, gather only basic_info with the vectorized classifier for "
+                             "single-country lists of the default region (requires numpy)")
+    parser.add_argument('--summary', action='store_true',
+                        help="In bulk mode, write only counts per country, carrier, number type and time zone "
+                             "(JSON or CSV); runs only the basic stage unless --stages is given")
+    parser.add_argument('--distinct', action='store_true',
+                        help="With --summary, estimate the number of distinct numbers (HyperLogLog)")
+    args = parser.parse_args(argv)
+    try:
+        if args.fields:
+            select_schema(args.fields)
+        stages = select_stages(args.stages)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.fast_path:
+        if args.stages and stages != (STAGES_BY_SECTION['basic_info'],):
+            parser.error("--fast-path only gathers basic_info")
+        args.stages = ['basic_info']
+    if args.summary:
+        if args.fields:
+            parser.error("--fields does not apply to --summary")
+        if args.format and args.format not in SummaryWriter.FORMATS:
+            parser.error(f"--summary writes {' or '.join(SummaryWriter.FORMATS)}")
+        # The aggregates only read basic_info
+        args.stages = args.stages or ['basic_info']
+    elif args.distinct:
+        parser.error("--distinct requires --summary")
+    return args
+
+
+def _name_list(value):
+    """Parse a comma-separated list of names"""
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def _section_ttl(value):
+    """Parse a SECTION=SECONDS result cache lifetime"""
+    section, _, seconds = value.partition('=')
+    if section not in RESULT_SECTIONS or not seconds.isdigit():
+        raise argparse.ArgumentTypeError(f"expected SECTION=SECONDS with a section among {', '.join(RESULT_SECTIONS)}")
+    return section, int(seconds)
+
+
 def main():
     """Main function to run the tool"""
-    tool = PhoneInfoTool()
+    args = parse_args()
+    providers = []
+    if args.online_provider:
+        from online_providers import JsonApiProvider
+        providers = [JsonApiProvider(urlparse(url).netloc or url, url) for url in args.online_provider]
+    tool = PhoneInfoTool(quiet=args.quiet or bool(args.input) or args.serve is not None,
+                         default_region=args.default_region,
+                         online_geocoding=args.online_geocoding,
+                         geocode_cache_path=args.geocode_cache,
+                         geocode_cache_ttl=args.geocode_cache_ttl,
+                         result_cache_path=args.result_cache,
+                         result_cache_ttls=dict(args.result_cache_ttl),
+                         online_providers=providers,
+                         record_timings=args.timings,
+                         stages=args.stages or (schema_sections(select_schema(args.fields)) if args.fields else None))
+    
+    try:
+        run_cli(tool, args)
+    finally:
+        if args.metrics:
+            write_metrics(tool, args.metrics)
+
+
+def write_metrics(tool, path):
+    """Write the tool's metrics in the Prometheus text format to a file ('-' for stdout)"""
+    text = tool.prometheus_metrics()
+    if path == '-':
+        sys.stdout.write(text)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def run_cli(tool, args):
+    """Run the lookup service, bulk mode or the interactive single-number flow for parsed arguments"""
+    if args.serve is not None:
+        from lookup_server import serve
+        serve(tool, args.host, args.serve, args.workers, args.request_timeout)
+        return
+    
+    if args.input:
+        run_batch(tool, args.input, args.output, args.workers, args.chunksize,
+                  args.engine, args.concurrency, args.dedupe, args.format, args.fields, args.fast_path,
+                  args.summary, args.distinct, args.quiet)
+        return
     
-    if len(sys.argv) > 1:
+    if args.phone_number:
         # If phone number is provided as command line argument
-        phone_number = sys.argv[1]
+        phone_number = args.phone_number
     else:
         # Otherwise, prompt the user for input
         phone_number = input(f"{COLORS['yellow']}Enter phone number (with country code, e.g., +1234567890): {COLORS['reset']}")
@@ -433,6 +1305,9 @@ def main():
     if tool.analyze_number(phone_number):
         tool.display_results()
         
+        if args.quiet:
+            return
+        
         # Ask if user wants to export the results
         export_choice = input(f"\n{COLORS['yellow']}Do you want to export the results? (y/n): {COLORS['reset']}")
         if export_choice.lower() in ['y', 'yes']:
@@ -444,6 +1319,10 @@ def main():
             
             tool.export_results(format_choice, custom_filename)
     
+    elif args.quiet:
+        print(f"{COLORS['red']}[!] Invalid phone number: {phone_number}{COLORS['reset']}", file=sys.stderr)
+        sys.exit(1)
+    
     print(f"\n{COLORS['green']}Thank you for using the Phone Information Gathering Tool!{COLORS['reset']}")
 
 
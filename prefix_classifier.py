@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vectorized basic information for single-country bulk lists
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Compiles the phonenumbers metadata of one region (number type patterns,
+formatting rules, carrier, geocoding and timezone prefixes) into sorted NumPy
+interval tables, then classifies whole arrays of numbers with searchsorted
+lookups instead of creating a phonenumbers object per number. The output is
+the basic_info section of PhoneInfoTool.basic_info_for.
+
+Numbers whose parsing the tables cannot reproduce exactly (other country
+codes, ambiguous national prefixes, non-ASCII digits...) are flagged for the
+regular per-number analysis. Requires the optional numpy package.
+"""
+
+import re
+from collections import namedtuple
+
+import phonenumbers
+from phonenumbers import PhoneMetadata, PhoneNumberType, carrier, geocoder, timezone
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre
+
+# Numbers classified per classify() call by PhoneInfoTool.iter_fast_batch
+DEFAULT_FAST_CHUNKSIZE = 65536
+
+# Limits on the national significant number enforced by phonenumbers.parse
+MIN_NSN_LENGTH = 2
+MAX_NSN_LENGTH = 17
+
+# Most digits an input may hold to fit an int64
+_MAX_DIGITS = 18
+
+# Number types tested before fixed line and mobile, in phonenumbers' order
+_SPECIFIC_TYPES = (
+    (PhoneNumberType.PREMIUM_RATE, 'premium_rate'),
+    (PhoneNumberType.TOLL_FREE, 'toll_free'),
+    (PhoneNumberType.SHARED_COST, 'shared_cost'),
+    (PhoneNumberType.VOIP, 'voip'),
+    (PhoneNumberType.PERSONAL_NUMBER, 'personal_number'),
+    (PhoneNumberType.PAGER, 'pager'),
+    (PhoneNumberType.UAN, 'uan'),
+    (PhoneNumberType.VOICEMAIL, 'voicemail'),
+)
+
+# Number types whose carrier is looked up (phonenumbers.carrier._is_mobile)
+_CARRIER_TYPES = (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE_OR_MOBILE, PhoneNumberType.PAGER)
+
+# A literal digit prefix, as most international and national prefixes are
+_LITERAL_DIGITS = re.compile(r'\d+')
+
+
+def _require_numpy():
+    """Import numpy, explaining how to install it when it is missing"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The vectorized prefix classifier requires numpy (pip install numpy)") from None
+    return numpy
+
+
+class DigitPattern:
+    """A phonenumbers digit regex compiled to intervals of the numbers it matches
+
+    Patterns are converted to a small NFA over the digits 0-9 ("$" anchors
+    become transitions only taken at the end of the number). intervals()
+    enumerates, for a given number of digits, the sorted [start, end) ranges
+    of the values the pattern matches entirely (or, with ``prefix``, whose
+    beginning it matches, like re.match).
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self._moves = []
+        self._epsilon = []
+        self._end_epsilon = []
+        self.start, self.accept = self._sequence(_sre_parse.parse(pattern))
+        self._closures = {}
+        self._steps = {}
+        self._intervals = {}
+
+    def _state(self):
+        self._moves.append([])
+        self._epsilon.append([])
+        self._end_epsilon.append([])
+        return len(self._moves) - 1
+
+    def _sequence(self, items):
+        """Compile a sequence of parsed regex items, returning its (start, end) states"""
+        start = end = self._state()
+        for op, av in items:
+            first, last = self._item(op, av)
+            self._epsilon[end].append(first)
+            end = last
+        return start, end
+
+    def _item(self, op, av):
+        """Compile one parsed regex item, returning its (start, end) states"""
+        if op in (_sre.LITERAL, _sre.NOT_LITERAL, _sre.ANY, _sre.IN):
+            start, end = self._state(), self._state()
+            self._moves[start].append((self._digits(op, av), end))
+            return start, end
+        if op is _sre.SUBPATTERN:
+            return self._sequence(av[-1])
+        if op is _sre.BRANCH:
+            start, end = self._state(), self._state()
+            for branch in av[1]:
+                first, last = self._sequence(branch)
+                self._epsilon[start].append(first)
+                self._epsilon[last].append(end)
+            return start, end
+        if op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT):
+            minimum, maximum, items = av
+            start = end = self._state()
+            for _ in range(minimum):
+                first, last = self._sequence(items)
+                self._epsilon[end].append(first)
+                end = last
+            if maximum is _sre.MAXREPEAT:
+                loop = self._state()
+                first, last = self._sequence(items)
+                self._epsilon[end].append(loop)
+                self._epsilon[loop].append(first)
+                self._epsilon[last].append(loop)
+                return start, loop
+            optional_end = self._state()
+            for _ in range(maximum - minimum):
+                first, last = self._sequence(items)
+                self._epsilon[end] += [first, optional_end]
+                end = last
+            self._epsilon[end].append(optional_end)
+            return start, optional_end
+        if op is _sre.AT and av in (_sre.AT_BEGINNING, _sre.AT_BEGINNING_STRING):
+            state = self._state()
+            return state, state
+        if op is _sre.AT and av in (_sre.AT_END, _sre.AT_END_STRING):
+            start, end = self._state(), self._state()
+            self._end_epsilon[start].append(end)
+            return start, end
+        raise ValueError(f"Unsupported construct {op} in pattern {self.pattern!r}")
+
+    def _digits(self, op, av):
+        """Return the frozenset of digits matched by a single-character item"""
+        if op is _sre.ANY:
+            return frozenset(range(10))
+        if op in (_sre.LITERAL, _sre.NOT_LITERAL):
+            digits = {av - 48} if 48 <= av <= 57 else set()
+            return frozenset(set(range(10)) - digits if op is _sre.NOT_LITERAL else digits)
+        digits = set()
+        negate = False
+        for item_op, item_av in av:
+            if item_op is _sre.NEGATE:
+                negate = True
+            elif item_op is _sre.LITERAL:
+                digits.update({item_av - 48} if 48 <= item_av <= 57 else ())
+            elif item_op is _sre.RANGE:
+                digits.update(code - 48 for code in range(max(item_av[0], 48), min(item_av[1], 57) + 1))
+            elif item_op is _sre.CATEGORY and item_av is _sre.CATEGORY_DIGIT:
+                digits.update(range(10))
+            else:
+                raise ValueError(f"Unsupported character class in pattern {self.pattern!r}")
+        return frozenset(set(range(10)) - digits if negate else digits)
+
+    def _closure(self, states, at_end=False):
+        """Return the states reachable from ``states`` without consuming a digit"""
+        closure = self._closures.get((states, at_end))
+        if closure is None:
+            stack = list(states)
+            seen = set(states)
+            while stack:
+                state = stack.pop()
+                for target in self._epsilon[state] + (self._end_epsilon[state] if at_end else []):
+                    if target not in seen:
+                        seen.add(target)
+                        stack.append(target)
+            closure = self._closures[(states, at_end)] = frozenset(seen)
+        return closure
+
+    def _step(self, states, digit):
+        """Return the closed set of states reached from ``states`` by one digit"""
+        key = (states, digit)
+        reached = self._steps.get(key)
+        if reached is None:
+            reached = self._steps[key] = self._closure(frozenset(
+                target for state in states for digits, target in self._moves[state] if digit in digits
+            ))
+        return reached
+
+    def intervals(self, length, prefix=False):
+        """Return the sorted, merged [start, end) ranges of the ``length``-digit values matched
+
+        Values are the digits read as an integer, so leading zeros are
+        accounted for by ``length``. With ``prefix`` a value matches when the
+        pattern matches its beginning (re.match), else it must match entirely.
+        """
+        key = (length, prefix)
+        if key not in self._intervals:
+            memo = {}
+            self._intervals[key] = self._walk(self._closure(frozenset((self.start,))), length, prefix, memo)
+        return self._intervals[key]
+
+    def _walk(self, states, remaining, prefix, memo):
+        key = (states, remaining)
+        result = memo.get(key)
+        if result is not None:
+            return result
+        if prefix and self.accept in states:
+            result = ((0, 10 ** remaining),)
+        elif remaining == 0:
+            result = ((0, 1),) if self.accept in self._closure(states, at_end=True) else ()
+        elif not states:
+            result = ()
+        else:
+            size = 10 ** (remaining - 1)
+            merged = []
+            for digit in range(10):
+                offset = digit * size
+                for start, end in self._walk(self._step(states, digit), remaining - 1, prefix, memo):
+                    if merged and merged[-1][1] == start + offset:
+                        merged[-1] = (merged[-1][0], end + offset)
+                    else:
+                        merged.append((start + offset, end + offset))
+            result = tuple(merged)
+        memo[key] = result
+        return result
+
+
+# Interval tables of one national number length
+_LengthTables = namedtuple('_LengthTables', 'general types fixed_line mobile formats carrier geocode time_zones')
+
+# Classification of an array of numbers; every field is an array aligned with the input.
+# ``fallback`` marks numbers left to the per-number analysis, ``valid`` the valid
+# ones; the other fields are only meaningful for valid numbers. ``carrier``,
+# ``description`` and ``time_zones`` index PrefixClassifier.values, ``format``
+# indexes PrefixClassifier.formats (-1: unformatted).
+ClassifiedNumbers = namedtuple('ClassifiedNumbers', 'fallback valid national_number length number_type '
+                                                    'carrier description time_zones format possible')
+
+
+class PrefixClassifier:
+    """Classifies arrays of numbers of one region with NumPy interval lookups
+
+    Only regions that are alone on their country calling code and have no
+    mobile token are supported (ValueError otherwise). Tables are compiled
+    per national number length on first use.
+    """
+
+    def __init__(self, region_code):
+        """Compile the metadata of ``region_code`` (e.g. "SA")"""
+        np = _require_numpy()
+        self.np = np
+        self.region_code = region_code.upper()
+        metadata = PhoneMetadata.metadata_for_region(self.region_code)
+        if metadata is None:
+            raise ValueError(f"Unknown region: {region_code}")
+        self.metadata = metadata
+        self.country_code = metadata.country_code
+        if len(phonenumbers.COUNTRY_CODE_TO_REGION_CODE.get(self.country_code, ())) != 1:
+            raise ValueError(f"Country code +{self.country_code} is shared by several regions")
+        if geocoder.country_mobile_token(self.country_code):
+            raise ValueError(f"Numbers of +{self.country_code} carry a mobile token")
+
+        self._cc_digits = str(self.country_code)
+        self._patterns = {}
+        self._interval_arrays = {}
+        self._tables = {}
+        self.formats = tuple(metadata.intl_number_format or metadata.number_format)
+        self._format_patterns = [re.compile(number_format.pattern) for number_format in self.formats]
+
+        # Interned output values; index 0 is the empty value
+        self.values = ['']
+        self._value_index = {'': 0}
+        # Per-number-type description and time zones of non-geographical numbers
+        self.geographical_types = frozenset(
+            number_type for number_type in range(11) if phonenumbers.is_number_type_geographical(
+                number_type, self.country_code)
+        )
+        self.country_name = self._intern(geocoder.country_name_for_number(
+            phonenumbers.PhoneNumber(country_code=self.country_code, national_number=0), 'en'))
+        # Same lookup as phonenumbers.timezone for non-geographical numbers
+        self.country_time_zones = self._intern(tuple(timezone._country_level_time_zones_for_number(
+            phonenumbers.PhoneNumber(country_code=self.country_code))))
+        self.unknown_time_zones = self._intern((timezone.UNKNOWN_TIMEZONE,))
+
+        self._prefix_entries = {
+            'carrier': self._prefix_data(carrier.CARRIER_DATA, lambda names: names.get('en')),
+            'geocode': self._prefix_data(geocoder.GEOCODE_DATA, lambda names: names.get('en')),
+            'time_zones': self._prefix_data(timezone.TIMEZONE_DATA, tuple),
+        }
+
+        general = metadata.general_desc
+        self.possible_lengths = frozenset(general.possible_length) | frozenset(general.possible_length_local_only)
+        # International and national prefixes are mostly literal digits, handled
+        # here; numbers matching other prefix patterns are left to phonenumbers
+        self._idd = metadata.international_prefix or None
+        self._idd_literal = bool(self._idd and _LITERAL_DIGITS.fullmatch(self._idd))
+        self._national_prefix = metadata.national_prefix_for_parsing or None
+        self._national_prefix_literal = bool(self._national_prefix and not metadata.national_prefix_transform_rule
+                                             and _LITERAL_DIGITS.fullmatch(self._national_prefix))
+
+    def _intern(self, value):
+        """Return the index of a value in self.values, adding it if needed"""
+        index = self._value_index.get(value)
+        if index is None:
+            index = self._value_index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def _pattern(self, pattern):
+        compiled = self._patterns.get(pattern)
+        if compiled is None:
+            compiled = self._patterns[pattern] = DigitPattern(pattern)
+        return compiled
+
+    def _prefix_data(self, data, value_of):
+        """Return (national prefix, value index) entries of the region in a prefix table
+
+        Entries whose value is None (no English name) are skipped, as phonenumbers
+        then falls back to a shorter prefix. Entries are ordered shortest first.
+        """
+        entries = []
+        for key, value in data.items():
+            if key.startswith(self._cc_digits):
+                value = value_of(value)
+                if value is not None:
+                    entries.append((key[len(self._cc_digits):], self._intern(value)))
+        entries.sort(key=lambda entry: len(entry[0]))
+        return entries
+
+    def _intervals(self, pattern, length, prefix=False):
+        """Return the (starts, ends) arrays of the length-digit values matching a pattern"""
+        key = (pattern, length, prefix)
+        arrays = self._interval_arrays.get(key)
+        if arrays is None:
+            np = self.np
+            intervals = self._pattern(pattern).intervals(length, prefix) if pattern else ()
+            arrays = self._interval_arrays[key] = (
+                np.fromiter((start for start, _ in intervals), dtype=np.int64, count=len(intervals)),
+                np.fromiter((end for _, end in intervals), dtype=np.int64, count=len(intervals)),
+            )
+        return arrays
+
+    def _membership(self, intervals, values):
+        """Return a boolean array: which values fall in the (starts, ends) intervals"""
+        np = self.np
+        starts, ends = intervals
+        if not len(starts):
+            return np.zeros(len(values), dtype=bool)
+        index = np.searchsorted(starts, values, side='right') - 1
+        return (index >= 0) & (values < ends[np.maximum(index, 0)])
+
+    def _desc_intervals(self, desc, length):
+        """Intervals of the length-digit numbers matching a PhoneNumberDesc (_is_number_matching_desc)"""
+        if desc is None or (desc.possible_length and length not in desc.possible_length):
+            return self._intervals(None, length)
+        return self._intervals(desc.national_number_pattern, length)
+
+    def _segments(self, entries, length):
+        """Flatten longest-prefix entries into (bounds, values) arrays for numbers of ``length`` digits"""
+        np = self.np
+        entries = [(prefix, value) for prefix, value in entries if len(prefix) <= length]
+        prefix_lengths = np.array([len(prefix) for prefix, _ in entries], dtype=np.int64)
+        scales = 10 ** (length - prefix_lengths)
+        starts = np.array([int(prefix or 0) for prefix, _ in entries], dtype=np.int64) * scales
+        ends = starts + scales
+        bounds = np.unique(np.concatenate(([0, 10 ** length], starts, ends)).astype(np.int64))
+        values = np.full(len(bounds) - 1, -1, dtype=np.int32)
+        first = np.searchsorted(bounds, starts)
+        last = np.searchsorted(bounds, ends)
+        entry_values = np.array([value for _, value in entries], dtype=np.int32)
+        # Prefixes of one length are disjoint; painting the shorter ones first lets
+        # the longer (more specific) ones overwrite them
+        for prefix_length in np.unique(prefix_lengths).tolist():
+            group = np.flatnonzero(prefix_lengths == prefix_length)
+            counts = last[group] - first[group]
+            offsets = np.repeat(first[group] - (np.cumsum(counts) - counts), counts)
+            values[np.arange(counts.sum()) + offsets] = np.repeat(entry_values[group], counts)
+        return bounds, values
+
+    def _lookup(self, segments, numbers):
+        """Return the value index of the longest prefix of each number (-1 if none)"""
+        bounds, values = segments
+        return values[self.np.searchsorted(bounds, numbers, side='right') - 1]
+
+    def tables(self, length):
+        """Return (compiling on first use) the interval tables of ``length``-digit numbers"""
+        tables = self._tables.get(length)
+        if tables is None:
+            metadata = self.metadata
+            tables = self._tables[length] = _LengthTables(
+                general=self._desc_intervals(metadata.general_desc, length),
+                types=[(number_type, self._desc_intervals(getattr(metadata, name), length))
+                       for number_type, name in _SPECIFIC_TYPES],
+                fixed_line=self._desc_intervals(metadata.fixed_line, length),
+                mobile=self._desc_intervals(metadata.mobile, length),
+                formats=[(self._intervals(number_format.leading_digits_pattern[-1], length, prefix=True)
+                          if number_format.leading_digits_pattern else None,
+                          self._intervals(number_format.pattern, length))
+                         for number_format in self.formats],
+                carrier=self._segments(self._prefix_entries['carrier'], length),
+                geocode=self._segments(self._prefix_entries['geocode'], length),
+                time_zones=self._segments(self._prefix_entries['time_zones'], length),
+            )
+        return tables
+
+    def parse(self, phone_numbers):
+        """Parse numbers the way PhoneInfoTool does, returning (fallback, national_number, length) arrays
+
+        Inputs are cleaned like PhoneInfoTool (every character but digits and "+"
+        dropped), then the "+", international prefix, country code and national
+        prefix are handled as phonenumbers.parse does for the region.
+        """
+        np = self.np
+        strings = np.asarray(phone_numbers, dtype=str)
+        count = len(strings)
+        width = max(strings.dtype.itemsize // 4, 1)
+        codes = strings.view(np.uint32).reshape(count, width) if strings.dtype.itemsize else \
+            np.zeros((count, 1), dtype=np.uint32)
+
+        is_digit = (codes >= 48) & (codes <= 57)
+        is_plus = codes == 43
+        digits = is_digit.sum(axis=1)
+        # Non-ASCII digits, several or misplaced "+" signs and overlong inputs
+        fallback = (codes > 127).any(axis=1) | (digits > _MAX_DIGITS) | (is_plus.sum(axis=1) > 1)
+        first_kept = np.argmax(is_digit | is_plus, axis=1)
+        has_plus = is_plus.any(axis=1)
+        fallback |= has_plus & ~is_plus[np.arange(count), first_kept]
+
+        exponents = np.clip(digits[:, None] - np.cumsum(is_digit, axis=1), 0, _MAX_DIGITS)
+        value = np.where(is_digit, (codes.astype(np.int64) - 48) * (10 ** exponents), 0).sum(axis=1)
+        length = digits.astype(np.int64)
+
+        cc_length = len(self._cc_digits)
+        starts_with_cc = self._starts_with(value, length, self.country_code, cc_length)
+        national = ~has_plus
+        if self._idd_literal:
+            idd = self._starts_with(value, length, int(self._idd), len(self._idd))
+            after_idd = length - len(self._idd)
+            idd_cc = idd & self._starts_with(value % 10 ** np.maximum(after_idd, 0), after_idd, self.country_code,
+                                             cc_length) & (after_idd > cc_length)
+            fallback |= national & idd & ~idd_cc
+            strip = np.where(national & idd_cc, len(self._idd) + cc_length, 0)
+            national &= ~idd
+        else:
+            strip = np.zeros(count, dtype=np.int64)
+            if self._idd:
+                fallback |= national & self._matches(self._idd, value, length, prefix=True)
+        # "00" inputs that stay invalid are retried with a "+" by PhoneInfoTool
+        fallback |= national & self._starts_with(value, length, 0, 2)
+        # National numbers starting with the country code may be read with or without it
+        fallback |= national & starts_with_cc
+        fallback |= has_plus & ~(starts_with_cc & (length > cc_length))
+        strip = np.where(has_plus, cc_length, strip)
+
+        length = length - strip
+        value = value % 10 ** np.clip(length, 0, _MAX_DIGITS)
+        fallback |= (length < MIN_NSN_LENGTH) | (length > MAX_NSN_LENGTH)
+
+        if self._national_prefix_literal:
+            value, length = self._strip_national_prefix(value, length, fallback)
+        elif self._national_prefix:
+            fallback |= self._matches(self._national_prefix, value, length, prefix=True)
+        fallback |= (value == 0) | (length < MIN_NSN_LENGTH)
+        return fallback, value, length
+
+    def _starts_with(self, value, length, prefix, prefix_length):
+        """Whether the length-digit values start with the prefix_length-digit prefix"""
+        np = self.np
+        shift = np.clip(length - prefix_length, 0, _MAX_DIGITS)
+        return (length >= prefix_length) & (value // 10 ** shift == prefix)
+
+    def _matches(self, pattern, value, length, prefix=False):
+        """Whether each value (of its own length) matches a digit pattern"""
+        np = self.np
+        matched = np.zeros(len(value), dtype=bool)
+        for size in np.unique(length).tolist():
+            if MIN_NSN_LENGTH <= size <= _MAX_DIGITS:
+                rows = length == size
+                matched[rows] = self._membership(self._intervals(pattern, size, prefix), value[rows])
+        return matched
+
+    def _strip_national_prefix(self, value, length, fallback):
+        """Strip a literal national prefix where phonenumbers.parse would"""
+        np = self.np
+        prefix_length = len(self._national_prefix)
+        candidate = ~fallback & self._starts_with(value, length, int(self._national_prefix), prefix_length) & \
+            (length > prefix_length)
+        if not candidate.any():
+            return value, length
+        stripped_length = length - prefix_length
+        stripped = value % 10 ** np.clip(stripped_length, 0, _MAX_DIGITS)
+
+        general = self.metadata.general_desc.national_number_pattern
+        viable = self._matches(general, value, length)
+        stripped_viable = self._matches(general, stripped, stripped_length)
+        # The stripped number's length must not be too short, local only or invalid
+        desc = self.metadata.general_desc
+        lengths = sorted(desc.possible_length)
+        length_ok = (np.isin(stripped_length, lengths) & ~np.isin(stripped_length, desc.possible_length_local_only)) | \
+            (stripped_length > lengths[-1])
+        strip = candidate & ~(viable & ~stripped_viable) & length_ok
+        return np.where(strip, stripped, value), np.where(strip, stripped_length, length)
+
+    def classify(self, phone_numbers):
+        """Classify a sequence of phone number strings, returning ClassifiedNumbers arrays"""
+        np = self.np
+        fallback, national_number, length = self.parse(phone_numbers)
+        count = len(national_number)
+        number_type = np.full(count, PhoneNumberType.UNKNOWN, dtype=np.int16)
+        carrier_index = np.zeros(count, dtype=np.int32)
+        description = np.zeros(count, dtype=np.int32)
+        time_zones = np.zeros(count, dtype=np.int32)
+        format_index = np.full(count, -1, dtype=np.int32)
+
+        for size in np.unique(length[~fallback]).tolist():
+            rows = np.flatnonzero(~fallback & (length == size))
+            numbers = national_number[rows]
+            tables = self.tables(size)
+
+            types = np.full(len(rows), PhoneNumberType.UNKNOWN, dtype=np.int16)
+            undecided = self._membership(tables.general, numbers)
+            for type_code, intervals in tables.types:
+                hit = undecided & self._membership(intervals, numbers)
+                types[hit] = type_code
+                undecided &= ~hit
+            fixed_line = undecided & self._membership(tables.fixed_line, numbers)
+            if self.metadata.same_mobile_and_fixed_line_pattern:
+                types[fixed_line] = PhoneNumberType.FIXED_LINE_OR_MOBILE
+            else:
+                mobile = self._membership(tables.mobile, numbers)
+                types[fixed_line & mobile] = PhoneNumberType.FIXED_LINE_OR_MOBILE
+                types[fixed_line & ~mobile] = PhoneNumberType.FIXED_LINE
+                types[undecided & ~fixed_line & mobile] = PhoneNumberType.MOBILE
+            number_type[rows] = types
+
+            geographical = np.isin(types, list(self.geographical_types))
+            area = self._lookup(tables.geocode, numbers)
+            described = geographical & (area > 0)
+            description[rows] = np.where(described, area, self.country_name)
+            names = self._lookup(tables.carrier, numbers)
+            carrier_index[rows] = np.where(np.isin(types, _CARRIER_TYPES) & (names >= 0), names, 0)
+            zones = self._lookup(tables.time_zones, numbers)
+            time_zones[rows] = np.where(geographical, np.where(zones >= 0, zones, self.unknown_time_zones),
+                                        self.country_time_zones)
+
+            chosen = np.full(len(rows), -1, dtype=np.int32)
+            for index, (leading_digits, pattern) in enumerate(tables.formats):
+                match = (chosen < 0) & self._membership(pattern, numbers)
+                if leading_digits is not None:
+                    match &= self._membership(leading_digits, numbers)
+                chosen[match] = index
+            format_index[rows] = chosen
+
+        valid = ~fallback & (number_type != PhoneNumberType.UNKNOWN)
+        possible = np.isin(length, list(self.possible_lengths))
+        return ClassifiedNumbers(fallback, valid, national_number, length, number_type, carrier_index,
+                                 description, time_zones, format_index, possible)
+
+    def basic_info(self, phone_numbers, type_names):
+        """Return the basic_info section of each number, in input order
+
+        Entries are a dictionary like PhoneInfoTool.basic_info_for, None for
+        invalid numbers, or FALLBACK for numbers needing the per-number
+        analysis. ``type_names`` maps number types to their reported names.
+        """
+        classified = self.classify(phone_numbers)
+        values = self.values
+        prefix = f"+{self.country_code} "
+        entries = []
+        for fallback, valid, national_number, length, number_type, carrier_index, description, time_zones, \
+                format_index, possible in zip(*(column.tolist() for column in classified)):
+            if fallback:
+                entries.append(FALLBACK)
+                continue
+            if not valid:
+                entries.append(None)
+                continue
+            national = f"{national_number:0{length}d}"
+            if format_index >= 0:
+                national = self._format_patterns[format_index].sub(self.formats[format_index].format, national)
+            entries.append({
+                'formatted_number': prefix + national,
+                'country_code': self.country_code,
+                'national_number': national_number,
+                'country': values[description] or "Unknown",
+                'carrier': values[carrier_index] or "Unknown",
+                'time_zones': list(values[time_zones]) or ["Unknown"],
+                'is_valid': True,
+                'is_possible': possible,
+                'number_type': type_names.get(number_type, "UNKNOWN")
+            })
+        return entries
+
+
+class _Fallback:
+    """Marks numbers the classifier leaves to the per-number analysis"""
+
+    def __repr__(self):
+        return 'FALLBACK'
+
+
+FALLBACK = _Fallback()
+
+
+def mismatches(tool, phone_numbers, classifier=None):
+    """Compare the classifier's basic_info with the per-number analysis of the same numbers
+
+    Returns a list of (phone_number, fast, expected) triples for every number
+    where they differ; numbers left to the per-number analysis are skipped.
+    """
+    from phone_info_tool import NUMBER_TYPE_NAMES
+    classifier = classifier or PrefixClassifier(tool.default_region)
+    phone_numbers = list(phone_numbers)
+    differences = []
+    for phone_number, fast in zip(phone_numbers, classifier.basic_info(phone_numbers, NUMBER_TYPE_NAMES)):
+        if fast is FALLBACK:
+            continue
+        context = tool.validated_context(phone_number)
+        expected = tool.basic_info_for(context) if context else None
+        if fast != expected:
+            differences.append((phone_number, fast, expected))
+    return differences
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rate limiting for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Token bucket used to keep requests to external services within their limits,
+usable from both threads and asyncio coroutines, and a variant shared by
+several processes.
+"""
+
+import time
+import asyncio
+import threading
+import multiprocessing
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` operations per second
+
+    Up to ``capacity`` operations may run back to back after an idle period.
+    Callers that find the bucket empty reserve the next free slot and wait for
+    it, so waiters are served in the order they arrive.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """Create a bucket refilled with ``rate`` tokens per second"""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the number of seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block the calling thread until a token is available"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a token is available"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class SharedTokenBucket(TokenBucket):
+    """TokenBucket kept in shared memory, so the processes of a pool draw from one bucket
+
+    The bucket must reach the other processes when they start, e.g. through a
+    pool initializer's arguments.
+    """
+
+    def __init__(self, rate, capacity=None):
+        super().__init__(rate, capacity)
+        # Tokens left and time of the last refill, guarded by the array's process-shared lock
+        self._state = multiprocessing.Array('d', [self._tokens, self._updated])
+        self._lock = self._state.get_lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._state
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1
+            self._state[0], self._state[1] = tokens, now
+            if tokens >= 0:
+                return 0.0
+            return -tokens / self.rate
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Persistent result cache for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Stores the analysis sections of every number in SQLite, keyed by its E.164
+form, so re-screening overlapping lists only analyzes numbers that are new or
+whose sections have expired. Each section has its own lifetime: static
+metadata is kept for months, online reputation data for a day, and the
+timezone section (which holds the current time) is never stored. Sections are
+also keyed by a fingerprint of the settings they depend on (geocoding mode,
+online providers, stages), so a run with other settings does not reuse them.
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+
+# Default location of the result cache
+DEFAULT_RESULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".phone_info_tool", "result_cache.sqlite3")
+
+# Default lifetime in seconds of each cached section; sections with a lifetime
+# of 0 (or missing from the mapping) are never cached
+DEFAULT_SECTION_TTLS = {
+    'basic_info': 90 * 24 * 60 * 60,
+    'geolocation': 90 * 24 * 60 * 60,
+    'timezone_info': 0,
+    'online_databases': 24 * 60 * 60,
+}
+
+# Maximum number of parameters bound to one SQLite statement
+_QUERY_BATCH = 500
+
+
+def config_fingerprint(config):
+    """Return a short stable hash of a JSON-serializable settings description"""
+    text = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class ResultCache:
+    """Cache of analysis sections keyed by (E.164 number, settings fingerprint, section)"""
+
+    def __init__(self, path=DEFAULT_RESULT_CACHE_PATH, ttls=None, config=None):
+        """Open (and create if needed) the cache
+
+        Args:
+            path: SQLite file of the cache (":memory:" for a private in-memory cache)
+            ttls: Mapping of section name to lifetime in seconds, overriding
+                DEFAULT_SECTION_TTLS for the sections it names
+            config: JSON-serializable description of the settings the sections
+                depend on; only sections stored under the same settings are read
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_SECTION_TTLS)
+        self.ttls.update(ttls or {})
+        self.config = config_fingerprint(config)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path) if path != ':memory:' else ''
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(results)")]
+        if columns and 'config' not in columns:
+            # Sections cached before the settings fingerprint existed cannot be told apart
+            self._conn.execute("DROP TABLE results")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "e164 TEXT NOT NULL, config TEXT NOT NULL, section TEXT NOT NULL, data TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, PRIMARY KEY (e164, config, section)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    @property
+    def cached_sections(self):
+        """Names of the sections this cache stores"""
+        return frozenset(section for section, ttl in self.ttls.items() if ttl > 0)
+
+    def get(self, e164):
+        """Return the fresh cached sections of a number as a {section: data} dictionary"""
+        return self.get_many([e164]).get(e164, {})
+
+    def get_many(self, numbers):
+        """Return the fresh cached sections of many numbers as {e164: {section: data}}
+
+        Numbers without any fresh section are absent from the result.
+        """
+        numbers = list(dict.fromkeys(numbers))
+        now = time.time()
+        found = {}
+        with self._lock:
+            for start in range(0, len(numbers), _QUERY_BATCH):
+                batch = numbers[start:start + _QUERY_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT e164, section, data, stored_at FROM results "
+                    f"WHERE config = ? AND e164 IN ({','.join('?' * len(batch))})", [self.config] + batch
+                ).fetchall()
+                for e164, section, data, stored_at in rows:
+                    if stored_at + self.ttls.get(section, 0) > now:
+                        found.setdefault(e164, {})[section] = json.loads(data)
+            wanted = len(numbers) * len(self.cached_sections)
+            hits = sum(len(sections) for sections in found.values())
+            self.hits += hits
+            self.misses += wanted - hits
+        return found
+
+    def set(self, e164, sections):
+        """Store the cacheable sections of one number"""
+        self.set_many({e164: sections})
+
+    def set_many(self, entries):
+        """Store the cacheable sections of many numbers ({e164: {section: data}}) in one transaction"""
+        now = time.time()
+        cached_sections = self.cached_sections
+        rows = [
+            (e164, self.config, section, json.dumps(data, separators=(',', ':')), now)
+            for e164, sections in entries.items()
+            for section, data in sections.items()
+            if section in cached_sections and data is not None
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (e164, config, section, data, stored_at) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def purge(self):
+        """Delete the expired sections, returning how many were removed"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for section, ttl in self.ttls.items():
+                removed += self._conn.execute(
+                    "DELETE FROM results WHERE section = ? AND stored_at + ? <= ?", (section, ttl, now)
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self):
+        """Return section hit/miss counters and the number of stored sections"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': size
+        }
+
+    def clear(self):
+        """Remove every cached section"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Table model of batch results for the Phone Information Gathering Tool GUI
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Holds the CSV_COLUMNS cells of every analyzed number column by column, as ids
+into one table of interned display strings, and keeps the visible row order
+(filter and sort) as a list of row indices. Views read only the rows they
+show, so a table of 100k numbers is displayed a screenful at a time.
+"""
+
+import csv
+import json
+from array import array
+from bisect import bisect
+
+from result_writers import CSV_COLUMNS, csv_row
+
+
+def display_value(cell):
+    """Return the text shown for a cell value"""
+    return '' if cell is None else str(cell)
+
+
+def sort_key(text):
+    """Order numbers numerically, before any text, and text case-insensitively"""
+    try:
+        return (0, float(text), '')
+    except ValueError:
+        return (1, 0.0, text.casefold())
+
+
+class ResultTable:
+    """Sortable, filterable table of batch results"""
+
+    def __init__(self, columns=CSV_COLUMNS):
+        self.columns = tuple(columns)
+        self.strings = []
+        self._string_ids = {}
+        self._cells = [array('L') for _ in self.columns]
+        self._keys = {}
+        self.filter_text = ''
+        self.filter_column = None
+        self.sort_column = None
+        self.descending = False
+        # Row indices shown, in ascending sort order (None while every row is shown unsorted)
+        self._view = None
+        # Sort keys of the rows of _view while sorted, for inserting new rows in order
+        self._view_keys = None
+
+    def __len__(self):
+        """Number of rows shown"""
+        return len(self._cells[0]) if self._view is None else len(self._view)
+
+    @property
+    def total(self):
+        """Number of rows held, shown or not"""
+        return len(self._cells[0])
+
+    def _intern(self, text):
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def append(self, phone_number, results):
+        """Add the results of one number (None if it is invalid)"""
+        self.append_row(csv_row(phone_number, results))
+
+    def extend(self, pairs):
+        """Add every (phone_number, results) pair of an iterable"""
+        for phone_number, results in pairs:
+            self.append(phone_number, results)
+        return self
+
+    def append_row(self, cells):
+        """Add one row of cells, in column order"""
+        row = self.total
+        for column, cell in zip(self._cells, cells):
+            column.append(self._intern(display_value(cell)))
+        if self._view is not None and self._matches(row):
+            if self.sort_column is None:
+                self._view.append(row)
+            else:
+                key = self._row_key(row)
+                position = bisect(self._view_keys, key)
+                self._view_keys.insert(position, key)
+                self._view.insert(position, row)
+
+    def row(self, index):
+        """Return the display strings of the index-th shown row"""
+        row = self._row_at(index)
+        return tuple(self.strings[column[row]] for column in self._cells)
+
+    def rows(self, start, stop):
+        """Return the display strings of the shown rows start..stop-1"""
+        return [self.row(index) for index in range(max(0, start), min(stop, len(self)))]
+
+    def _row_at(self, index):
+        index = range(len(self))[index]
+        if self._view is None:
+            return index
+        if self.descending:
+            index = len(self._view) - 1 - index
+        return self._view[index]
+
+    def sort(self, column=None, descending=False):
+        """Order the shown rows by a column (None restores the input order)"""
+        self.sort_column = None if column is None else self.columns.index(column)
+        self.descending = descending and column is not None
+        self._refresh()
+
+    def filter(self, text='', column=None):
+        """Show only the rows containing ``text`` (case-insensitively) in a column or in any column"""
+        self.filter_text = text.casefold()
+        self.filter_column = None if column is None else self.columns.index(column)
+        self._refresh()
+
+    def _refresh(self):
+        self._view_keys = None
+        if not self.filter_text and self.sort_column is None:
+            self._view = None
+            return
+        rows = range(self.total)
+        if self.filter_text:
+            matching = {string_id for string_id, text in enumerate(self.strings)
+                        if self.filter_text in text.casefold()}
+            columns = self._cells if self.filter_column is None else [self._cells[self.filter_column]]
+            rows = [row for row in rows if any(column[row] in matching for column in columns)]
+        if self.sort_column is None:
+            self._view = list(rows)
+            return
+        self._view_keys = sorted(self._row_key(row) for row in rows)
+        self._view = [row for _, row in self._view_keys]
+
+    def _matches(self, row):
+        if not self.filter_text:
+            return True
+        columns = self._cells if self.filter_column is None else [self._cells[self.filter_column]]
+        return any(self.filter_text in self.strings[column[row]].casefold() for column in columns)
+
+    def _row_key(self, row):
+        string_id = self._cells[self.sort_column][row]
+        key = self._keys.get(string_id)
+        if key is None:
+            key = self._keys[string_id] = sort_key(self.strings[string_id])
+        return key, row
+
+
+def read_results(path):
+    """Yield (phone_number, results) pairs from a JSON or JSON Lines batch export"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith('.json'):
+            entries = json.load(f)
+        else:
+            entries = (json.loads(line) for line in f if line.strip())
+        for entry in entries:
+            yield entry['number'], entry['results']
+
+
+def load_table(path):
+    """Load a batch export (JSON, JSON Lines or CSV) into a ResultTable"""
+    if not path.lower().endswith('.csv'):
+        return ResultTable().extend(read_results(path))
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        table = ResultTable(next(reader, CSV_COLUMNS))
+        for cells in reader:
+            table.append_row(cells)
+    return table
@@ -0,0 +1,729 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming result writers for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Writes analysis results to JSON, JSON Lines, CSV, Excel files or paginated
+HTML reports one result at a time, so exporting a batch needs constant memory
+however many numbers it holds. Parquet and Arrow IPC exports accumulate typed
+columns and write them at once; they require the optional pyarrow package.
+"""
+
+import os
+import csv
+import html
+import json
+from datetime import datetime
+
+from aggregation import ResultAggregator
+
+# Size of the write buffer of an output file
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Separator between the items of list values in CSV cells
+LIST_SEPARATOR = '; '
+
+# Fixed CSV schema: column name and the path to its value in a results dictionary.
+# The timezone_info columns hold the names and times of every zone of the number.
+CSV_SCHEMA = (
+    ('basic_info_formatted_number', ('basic_info', 'formatted_number')),
+    ('basic_info_country_code', ('basic_info', 'country_code')),
+    ('basic_info_national_number', ('basic_info', 'national_number')),
+    ('basic_info_country', ('basic_info', 'country')),
+    ('basic_info_carrier', ('basic_info', 'carrier')),
+    ('basic_info_time_zones', ('basic_info', 'time_zones')),
+    ('basic_info_is_valid', ('basic_info', 'is_valid')),
+    ('basic_info_is_possible', ('basic_info', 'is_possible')),
+    ('basic_info_number_type', ('basic_info', 'number_type')),
+    ('geolocation_country', ('geolocation', 'country')),
+    ('geolocation_region', ('geolocation', 'region')),
+    ('geolocation_coordinates_latitude', ('geolocation', 'coordinates', 'latitude')),
+    ('geolocation_coordinates_longitude', ('geolocation', 'coordinates', 'longitude')),
+    ('timezone_info_name', ('timezone_info', 'name')),
+    ('timezone_info_current_time', ('timezone_info', 'current_time')),
+    ('timezone_info_utc_offset', ('timezone_info', 'utc_offset')),
+    ('online_databases_spam_score', ('online_databases', 'spam_score')),
+    ('online_databases_reported_count', ('online_databases', 'reported_count')),
+    ('online_databases_last_reported', ('online_databases', 'last_reported')),
+    ('online_databases_tags', ('online_databases', 'tags')),
+    ('online_databases_note', ('online_databases', 'note')),
+)
+
+CSV_COLUMNS = ('number', 'valid') + tuple(column for column, _ in CSV_SCHEMA)
+
+
+def select_schema(fields=None):
+    """Return the CSV_SCHEMA entries of the requested export fields, in schema order
+
+    A field is a column name ("basic_info_number_type") or a section name
+    ("basic_info") selecting every column of the section. Without fields the
+    whole schema is returned.
+    """
+    if fields is None:
+        return CSV_SCHEMA
+    selected = set()
+    for field in fields:
+        columns = [column for column, path in CSV_SCHEMA if field in (column, path[0])]
+        if not columns:
+            raise ValueError(f"Unknown export field: {field}")
+        selected.update(columns)
+    return tuple((column, path) for column, path in CSV_SCHEMA if column in selected)
+
+
+def schema_sections(schema):
+    """Return the results sections a schema reads, in schema order"""
+    return tuple(dict.fromkeys(path[0] for _, path in schema))
+
+
+def project_results(results, schema):
+    """Return a copy of a results dictionary holding only the values of the schema columns
+
+    Sections and values the schema does not name are dropped; recorded
+    timings are kept. None (an invalid number) is returned unchanged.
+    """
+    if results is None:
+        return None
+    projected = {}
+    for _, path in schema:
+        section = results.get(path[0])
+        if isinstance(section, list):
+            items = projected.setdefault(path[0], [{} for _ in section])
+            for item, source in zip(items, section):
+                if path[1] in source:
+                    item[path[1]] = source[path[1]]
+            continue
+        if not isinstance(section, dict):
+            continue
+        source, target = section, projected.setdefault(path[0], {})
+        for key in path[1:-1]:
+            source = source.get(key)
+            if not isinstance(source, dict):
+                break
+            target = target.setdefault(key, {})
+        else:
+            if path[-1] in source:
+                target[path[-1]] = source[path[-1]]
+    if 'timings' in results:
+        projected['timings'] = results['timings']
+    return projected
+
+
+def flatten_results(results):
+    """Flatten a nested results dictionary into one level of column names
+
+    List sections get one group of columns per item ("timezone_info_1_name"),
+    nested dictionaries are joined to their parent key ("geolocation_coordinates_latitude").
+    """
+    flat_data = {}
+    for category, data in results.items():
+        if isinstance(data, list):
+            for i, item in enumerate(data):
+                for key, value in item.items():
+                    flat_data[f"{category}_{i+1}_{key}"] = value
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, dict):
+                    for subkey, subvalue in value.items():
+                        flat_data[f"{category}_{key}_{subkey}"] = subvalue
+                else:
+                    flat_data[f"{category}_{key}"] = value
+    return flat_data
+
+
+def _cell(value):
+    """Render a value for a CSV cell, joining list items"""
+    if isinstance(value, (list, tuple)):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+
+def column_value(results, path):
+    """Follow a CSV_SCHEMA path through a results dictionary ('' if absent)"""
+    section = results.get(path[0])
+    if isinstance(section, list):
+        return [item.get(path[1], '') for item in section]
+    for key in path[1:]:
+        if not isinstance(section, dict):
+            return ''
+        section = section.get(key)
+    return '' if section is None else section
+
+
+def csv_row(phone_number, results, schema=CSV_SCHEMA):
+    """Return the CSV row of one analysis (results is None for invalid numbers)
+
+    The row holds the number, its validity and one cell per ``schema`` column.
+    """
+    row = [phone_number, results is not None]
+    if results is None:
+        return row + [''] * len(schema)
+    return row + [_cell(column_value(results, path)) for _, path in schema]
+
+
+class ResultWriter:
+    """Base class of the streaming writers
+
+    Use as a context manager, or call close() once every result is written.
+    ``count`` and ``valid_count`` track the results written so far.
+    """
+
+    format_type = None
+
+    # File extension of the format when it differs from format_type
+    extension = None
+
+    # Whether results are streamed as text to ``path`` through ``_file``; writers
+    # of other files leave ``_file`` None and write ``path`` themselves in finish()
+    text_output = True
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, fields=None):
+        """Open ``path`` for writing with a ``buffer_size`` bytes write buffer
+
+        ``fields`` restricts the output to some columns or sections (see
+        select_schema); by default every column is written.
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self.count = 0
+        self.valid_count = 0
+        self.schema = select_schema(fields)
+        self.projected = fields is not None
+        self._closed = False
+        self._file = None
+        if self.text_output:
+            self._file = open(path, 'w', encoding='utf-8', newline='', buffering=buffer_size)
+        self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """Write whatever precedes the first result"""
+
+    def finish(self):
+        """Write whatever follows the last result"""
+
+    def write(self, phone_number, results):
+        """Write the results dictionary of one number (None if it is invalid)"""
+        self.write_entry(phone_number, results)
+        self.count += 1
+        if results is not None:
+            self.valid_count += 1
+
+    def write_entry(self, phone_number, results):
+        """Serialize one result to the file"""
+        raise NotImplementedError
+
+    def project(self, results):
+        """Return the results restricted to the selected fields"""
+        return project_results(results, self.schema) if self.projected else results
+
+    def write_all(self, pairs):
+        """Write every (phone_number, results) pair of an iterable"""
+        for phone_number, results in pairs:
+            self.write(phone_number, results)
+        return self
+
+    def close(self):
+        """Finish the file and close it"""
+        if not self._closed:
+            self._closed = True
+            self.finish()
+            if self._file is not None:
+                self._file.close()
+
+
+class JsonWriter(ResultWriter):
+    """Writes a JSON array of {"number", "results"} objects"""
+
+    format_type = 'json'
+
+    def start(self):
+        self._file.write('[')
+
+    def write_entry(self, phone_number, results):
+        entry = json.dumps({'number': phone_number, 'results': self.project(results)}, indent=4)
+        separator = ',\n' if self.count else '\n'
+        self._file.write(separator + '\n'.join('    ' + line for line in entry.splitlines()))
+
+    def finish(self):
+        self._file.write('\n]\n' if self.count else ']\n')
+
+
+class JsonLinesWriter(ResultWriter):
+    """Writes one compact {"number", "results"} JSON object per line"""
+
+    format_type = 'jsonl'
+
+    def write_entry(self, phone_number, results):
+        self._file.write(json.dumps({'number': phone_number, 'results': self.project(results)},
+                                    separators=(',', ':')))
+        self._file.write('\n')
+
+
+class CsvWriter(ResultWriter):
+    """Writes one CSV row per number with the fixed CSV_COLUMNS header (or the selected columns)"""
+
+    format_type = 'csv'
+
+    def start(self):
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(('number', 'valid') + tuple(column for column, _ in self.schema))
+
+    def write_entry(self, phone_number, results):
+        self._writer.writerow(csv_row(phone_number, results, self.schema))
+
+
+# Arrow type of each columnar export column; "category" columns hold few distinct
+# values and are dictionary encoded, "list" columns hold lists of strings
+COLUMN_TYPES = {
+    'number': 'string',
+    'valid': 'bool',
+    'basic_info_formatted_number': 'string',
+    'basic_info_country_code': 'int32',
+    'basic_info_national_number': 'uint64',
+    'basic_info_country': 'category',
+    'basic_info_carrier': 'category',
+    'basic_info_time_zones': 'list',
+    'basic_info_is_valid': 'bool',
+    'basic_info_is_possible': 'bool',
+    'basic_info_number_type': 'category',
+    'geolocation_country': 'category',
+    'geolocation_region': 'category',
+    'geolocation_coordinates_latitude': 'float64',
+    'geolocation_coordinates_longitude': 'float64',
+    'timezone_info_name': 'list',
+    'timezone_info_current_time': 'list',
+    'timezone_info_utc_offset': 'list',
+    'online_databases_spam_score': 'category',
+    'online_databases_reported_count': 'int64',
+    'online_databases_last_reported': 'string',
+    'online_databases_tags': 'list',
+    'online_databases_note': 'category',
+}
+
+# Python types accepted in the columns of each Arrow type (anything else is null)
+_COLUMN_PYTHON_TYPES = {
+    'string': str,
+    'category': str,
+    'bool': bool,
+    'int32': int,
+    'int64': int,
+    'uint64': int,
+    'float64': (int, float),
+    'list': (list, tuple),
+}
+
+
+def _require_pyarrow():
+    """Import pyarrow, explaining how to install it when it is missing"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow exports require pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+class ColumnarResultBuilder:
+    """Accumulates batch results into typed columns for Parquet and Arrow exports
+
+    Each result appends one value per column (CSV_COLUMNS), so a batch costs a
+    few Python lists rather than a dictionary per number. to_table() converts
+    the columns to Arrow arrays in one pass, dictionary encoding the
+    low-cardinality ones (country, carrier, number type...). A ``schema`` from
+    select_schema() restricts the columns that are built.
+    """
+
+    def __init__(self, schema=CSV_SCHEMA):
+        self.schema = schema
+        self.columns = {column: [] for column in ('number', 'valid') + tuple(column for column, _ in schema)}
+
+    def __len__(self):
+        return len(self.columns['number'])
+
+    def append(self, phone_number, results):
+        """Add the results dictionary of one number (None if it is invalid)"""
+        columns = self.columns
+        columns['number'].append(phone_number)
+        columns['valid'].append(results is not None)
+        for column, path in self.schema:
+            value = None
+            if results is not None:
+                value = column_value(results, path)
+                # Placeholders such as "Unknown" coordinates become nulls
+                if not isinstance(value, _COLUMN_PYTHON_TYPES[COLUMN_TYPES[column]]):
+                    value = None
+            columns[column].append(value)
+
+    def extend(self, pairs):
+        """Add every (phone_number, results) pair of an iterable"""
+        for phone_number, results in pairs:
+            self.append(phone_number, results)
+        return self
+
+    def to_table(self):
+        """Return the accumulated results as a pyarrow.Table"""
+        pa = _require_pyarrow()
+        arrow_types = {
+            'string': pa.string(),
+            'category': pa.string(),
+            'bool': pa.bool_(),
+            'int32': pa.int32(),
+            'int64': pa.int64(),
+            'uint64': pa.uint64(),
+            'float64': pa.float64(),
+            'list': pa.list_(pa.string()),
+        }
+        arrays = []
+        for column, values in self.columns.items():
+            kind = COLUMN_TYPES[column]
+            array = pa.array(values, type=arrow_types[kind])
+            arrays.append(array.dictionary_encode() if kind == 'category' else array)
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+    def to_pandas(self):
+        """Return the accumulated results as a pandas DataFrame with categorical columns"""
+        return self.to_table().to_pandas()
+
+    def write(self, path, format_type='parquet'):
+        """Write the accumulated results to a Parquet ('parquet') or Arrow IPC ('arrow') file"""
+        table = self.to_table()
+        if format_type == 'parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(table, path, compression='zstd')
+        elif format_type == 'arrow':
+            import pyarrow.feather as feather
+            feather.write_feather(table, path, compression='zstd')
+        else:
+            raise ValueError(f"Unsupported columnar format: {format_type}")
+        return path
+
+
+class ColumnarWriter(ResultWriter):
+    """Collects results in a ColumnarResultBuilder and writes the file when closed"""
+
+    text_output = False
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, fields=None):
+        _require_pyarrow()
+        super().__init__(path, buffer_size, fields)
+        self.builder = ColumnarResultBuilder(self.schema)
+
+    def write_entry(self, phone_number, results):
+        self.builder.append(phone_number, results)
+
+    def finish(self):
+        self.builder.write(self.path, self.format_type)
+
+
+class ParquetWriter(ColumnarWriter):
+    """Writes a Parquet file with typed, dictionary encoded columns"""
+
+    format_type = 'parquet'
+
+
+class ArrowWriter(ColumnarWriter):
+    """Writes an Arrow IPC (Feather v2) file with typed, dictionary encoded columns"""
+
+    format_type = 'arrow'
+
+
+# Rows of an Excel worksheet; longer sections continue on another sheet
+MAX_SHEET_ROWS = 1048576
+
+
+def _require_openpyxl():
+    """Import openpyxl, explaining how to install it when it is missing"""
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("Excel exports require openpyxl (pip install openpyxl)") from None
+    return openpyxl
+
+
+class ExcelWriter(ResultWriter):
+    """Writes an Excel workbook with one sheet per section, streaming rows to disk
+
+    The workbook is opened in openpyxl's write-only mode, which writes each row
+    out as it is appended instead of keeping the cells in memory. Every sheet
+    starts with the number; the first one also says whether it is valid and
+    lists invalid numbers, the others hold only valid ones. timezone_info has
+    one row per time zone. A section longer than an Excel sheet continues on
+    "<section> (2)", "<section> (3)"...
+    """
+
+    format_type = 'excel'
+    extension = 'xlsx'
+    text_output = False
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, fields=None):
+        _require_openpyxl()
+        super().__init__(path, buffer_size, fields)
+
+    def start(self):
+        import openpyxl
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        self._illegal_characters = ILLEGAL_CHARACTERS_RE
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._sections = []
+        for index, section in enumerate(schema_sections(self.schema)):
+            columns = [(column, path) for column, path in self.schema if path[0] == section]
+            header = ['number'] + (['valid'] if index == 0 else []) + [column for column, _ in columns]
+            self._sections.append({'name': section, 'columns': columns, 'header': header, 'sheets': 0})
+            self._new_sheet(self._sections[-1])
+
+    def _new_sheet(self, section):
+        """Start the next sheet of a section with its header row"""
+        section['sheets'] += 1
+        title = section['name'] if section['sheets'] == 1 else f"{section['name']} ({section['sheets']})"
+        section['sheet'] = self._workbook.create_sheet(title)
+        section['sheet'].append(section['header'])
+        section['rows'] = 1
+
+    def _append(self, section, row):
+        """Append a row to the current sheet of a section, starting a new sheet when it is full"""
+        if section['rows'] >= MAX_SHEET_ROWS:
+            self._new_sheet(section)
+        section['sheet'].append([self._value(value) for value in row])
+        section['rows'] += 1
+
+    def _value(self, value):
+        """Render a value for a cell: lists are joined and characters Excel rejects removed"""
+        value = _cell(value)
+        if isinstance(value, str):
+            return self._illegal_characters.sub('', value) or None
+        return value
+
+    def write_entry(self, phone_number, results):
+        for index, section in enumerate(self._sections):
+            if index == 0 and results is None:
+                self._append(section, [phone_number, False] + [None] * len(section['columns']))
+                continue
+            data = results.get(section['name']) if results is not None else None
+            if data is None:
+                continue
+            prefix = [phone_number] + ([True] if index == 0 else [])
+            items = data if isinstance(data, list) else [data]
+            for item in items:
+                self._append(section, prefix + [column_value({section['name']: item}, path)
+                                                for _, path in section['columns']])
+
+    def finish(self):
+        self._workbook.save(self.path)
+
+
+# Rows on each page of an HTML report
+DEFAULT_PAGE_SIZE = 1000
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; }}
+h1 {{ color: #2c3e50; }}
+table {{ border-collapse: collapse; margin-bottom: 20px; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; font-size: 0.9em; text-align: left; }}
+th {{ background: #2c3e50; color: white; }}
+tr:nth-child(even) {{ background: #f5f5f5; }}
+.summary {{ display: inline-block; vertical-align: top; margin-right: 30px; }}
+.nav a {{ margin-right: 15px; }}
+.footer {{ margin-top: 30px; font-size: 0.8em; color: #7f8c8d; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+
+_HTML_FOOT = """<div class="footer">
+<p>Generated by Phone Information Gathering Tool on {generated}</p>
+<p>Developed by: Saudi Linux | Email: SaudiLinuxy7@gmail.com</p>
+</div>
+</body>
+</html>
+"""
+
+
+class HtmlReportWriter(ResultWriter):
+    """Writes a paginated HTML report: an index page of summary counts and pages of result rows
+
+    Rows are streamed to "<report>_pages/page_00001.html"... next to the index
+    file, ``page_size`` rows per page, and only the summary counts (an
+    aggregation.ResultAggregator) are kept in memory. The index page (``path``)
+    is written when the writer is closed.
+    """
+
+    format_type = 'html'
+    text_output = False
+
+    # Title of each summary table of the index page and the aggregator counts it shows
+    SUMMARY_TABLES = (('Country', 'country'), ('Carrier', 'carrier'), ('Number type', 'number_type'))
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, fields=None, page_size=DEFAULT_PAGE_SIZE):
+        super().__init__(path, buffer_size, fields)
+        self.page_size = page_size
+        self.pages_dir = os.path.splitext(path)[0] + '_pages'
+        self.pages = []
+        self._page = None
+
+    def start(self):
+        self.aggregates = ResultAggregator()
+
+    def _page_name(self, number):
+        return f"page_{number:05d}.html"
+
+    def _start_page(self):
+        if self._page is not None:
+            self._finish_page(has_next=True)
+        number = len(self.pages) + 1
+        if number == 1:
+            os.makedirs(self.pages_dir, exist_ok=True)
+        self.pages.append([self.count + 1, self.count])
+        self._page = open(os.path.join(self.pages_dir, self._page_name(number)), 'w', encoding='utf-8',
+                          buffering=self.buffer_size)
+        self._page.write(_HTML_HEAD.format(title=f"Phone Information Report - page {number}"))
+        self._page.write(self._navigation(number, has_next=False, top=True))
+        header = ('number', 'valid') + tuple(column for column, _ in self.schema)
+        self._page.write('<table>\n<tr>' + ''.join(f'<th>{html.escape(column)}</th>' for column in header)
+                         + '</tr>\n')
+
+    def _navigation(self, number, has_next, top=False):
+        links = [f'<a href="../{html.escape(os.path.basename(self.path))}">Index</a>']
+        if number > 1:
+            links.append(f'<a href="{self._page_name(number - 1)}">Previous</a>')
+        if has_next:
+            links.append(f'<a href="{self._page_name(number + 1)}">Next</a>')
+        first, last = self.pages[number - 1]
+        rows = f'<span>Rows {first}-{last}</span>' if not top else ''
+        return f'<p class="nav">{"".join(links)}{rows}</p>\n'
+
+    def _finish_page(self, has_next):
+        self._page.write('</table>\n')
+        self._page.write(self._navigation(len(self.pages), has_next))
+        self._page.write(_HTML_FOOT.format(generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        self._page.close()
+        self._page = None
+
+    def write_entry(self, phone_number, results):
+        if self._page is None or self.count % self.page_size == 0:
+            self._start_page()
+        self.aggregates.add(phone_number, results)
+        cells = csv_row(phone_number, results, self.schema)
+        self._page.write('<tr>' + ''.join(f'<td>{html.escape(str(cell))}</td>' for cell in cells) + '</tr>\n')
+        self.pages[-1][1] = self.count + 1
+
+    def _write_index(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(_HTML_HEAD.format(title="Phone Information Batch Report"))
+            f.write(f'<p>{self.count} numbers, {self.valid_count} valid, {len(self.pages)} pages</p>\n')
+            tables = [('Validity', {'Valid': self.aggregates.valid, 'Invalid': self.aggregates.invalid})]
+            tables += [(title, dict(self.aggregates.counts[name].most_common())) for title, name in self.SUMMARY_TABLES]
+            for title, counts in tables:
+                f.write(f'<div class="summary">\n<h2>{html.escape(title)}</h2>\n<table>\n'
+                        f'<tr><th>{html.escape(title)}</th><th>Numbers</th><th>Share</th></tr>\n')
+                for value, count in counts.items():
+                    share = f'{count / self.count:.1%}' if self.count else '\u2014'
+                    f.write(f'<tr><td>{html.escape(value)}</td><td>{count}</td><td>{share}</td></tr>\n')
+                f.write('</table>\n</div>\n')
+            f.write('<h2>Pages</h2>\n<ul>\n')
+            pages_dir = html.escape(os.path.basename(self.pages_dir))
+            for number, (first, last) in enumerate(self.pages, 1):
+                f.write(f'<li><a href="{pages_dir}/{self._page_name(number)}">Page {number}</a> '
+                        f'(rows {first}-{last})</li>\n')
+            f.write('</ul>\n')
+            f.write(_HTML_FOOT.format(generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+    def finish(self):
+        if self._page is not None:
+            self._finish_page(has_next=False)
+        self._write_index()
+
+
+class SummaryWriter(ResultWriter):
+    """Writes only the aggregates of a batch (see aggregation.ResultAggregator), as JSON or CSV
+
+    Results are counted as they are written and dropped; the summary is written
+    when the writer is closed.
+    """
+
+    format_type = 'summary'
+
+    # Formats of the summary file
+    FORMATS = ('json', 'csv')
+
+    def __init__(self, path, summary_format='json', distinct=False, buffer_size=DEFAULT_BUFFER_SIZE):
+        """``distinct`` also estimates the number of distinct numbers"""
+        if summary_format not in self.FORMATS:
+            raise ValueError(f"Unsupported summary format: {summary_format}")
+        self.summary_format = summary_format
+        self.aggregator = ResultAggregator(distinct=distinct)
+        super().__init__(path, buffer_size)
+
+    def write_entry(self, phone_number, results):
+        self.aggregator.add(phone_number, results)
+
+    def finish(self):
+        if self.summary_format == 'json':
+            json.dump(self.aggregator.summary(), self._file, indent=4, ensure_ascii=False)
+            self._file.write('\n')
+        else:
+            writer = csv.writer(self._file)
+            writer.writerow(('metric', 'value', 'count', 'share'))
+            writer.writerows(self.aggregator.rows())
+
+
+# Writer class for each output format
+WRITERS = {
+    'json': JsonWriter,
+    'jsonl': JsonLinesWriter,
+    'csv': CsvWriter,
+    'parquet': ParquetWriter,
+    'arrow': ArrowWriter,
+    'excel': ExcelWriter,
+    'html': HtmlReportWriter,
+}
+
+# Output formats of file extensions that differ from the format name (also accepted as format names)
+FORMAT_EXTENSIONS = {
+    'xlsx': 'excel',
+    'ndjson': 'jsonl',
+    'htm': 'html',
+    'feather': 'arrow',
+    'ipc': 'arrow',
+}
+
+
+def canonical_format(format_type):
+    """Return the WRITERS name of a format given by name or by file extension (e.g. 'xlsx')"""
+    format_type = format_type.lower()
+    return FORMAT_EXTENSIONS.get(format_type, format_type)
+
+
+def extension_for_format(format_type):
+    """Return the file extension of an output format"""
+    writer = WRITERS.get(format_type)
+    return (writer.extension if writer is not None else None) or format_type
+
+
+def format_for_path(path, default='json'):
+    """Guess the output format of a file from its extension"""
+    extension = canonical_format(path.rsplit('.', 1)[-1]) if '.' in path else ''
+    return extension if extension in WRITERS else default
+
+
+def open_writer(path, format_type=None, buffer_size=DEFAULT_BUFFER_SIZE, fields=None):
+    """Open a result writer for ``path`` (format guessed from the extension if not given)
+
+    ``fields`` restricts the written columns or sections (see select_schema).
+    """
+    format_type = canonical_format(format_type or format_for_path(path))
+    if format_type not in WRITERS:
+        raise ValueError(f"Unsupported output format: {format_type}")
+    return WRITERS[format_type](path, buffer_size, fields)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Stage instrumentation for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Records how long each step of an analysis (validation, every stage, exports)
+takes and how often it fails, and renders the totals as a dictionary or in
+the Prometheus text exposition format for scraping.
+"""
+
+import threading
+
+# Upper bounds (seconds) of the duration histogram buckets
+DURATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                    0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prefix of every exported Prometheus metric
+METRIC_PREFIX = 'phone_info'
+
+
+class StageMetrics:
+    """Thread-safe per-step counters, error counts and duration histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps = {}
+
+    def record(self, step, seconds, error=False):
+        """Record one run of a step that took ``seconds`` (and failed if ``error``)"""
+        bucket = len(DURATION_BUCKETS)
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                bucket = index
+                break
+        with self._lock:
+            entry = self._steps.get(step)
+            if entry is None:
+                entry = self._steps[step] = _new_entry()
+            entry['count'] += 1
+            entry['errors'] += bool(error)
+            entry['seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['buckets'][bucket] += 1
+
+    def snapshot(self):
+        """Return a copy of the recorded totals, keyed by step name"""
+        with self._lock:
+            return {step: dict(entry, buckets=list(entry['buckets'])) for step, entry in self._steps.items()}
+
+    def drain(self):
+        """Return the recorded totals and reset them (used to ship worker metrics to the parent)"""
+        with self._lock:
+            steps, self._steps = self._steps, {}
+        return steps
+
+    def merge(self, steps):
+        """Add totals returned by snapshot() or drain() of another instance"""
+        with self._lock:
+            for step, other in steps.items():
+                entry = self._steps.get(step)
+                if entry is None:
+                    entry = self._steps[step] = _new_entry()
+                entry['count'] += other['count']
+                entry['errors'] += other['errors']
+                entry['seconds'] += other['seconds']
+                entry['max_seconds'] = max(entry['max_seconds'], other['max_seconds'])
+                entry['buckets'] = [a + b for a, b in zip(entry['buckets'], other['buckets'])]
+
+    def summary(self):
+        """Return per-step counts, error counts, total and mean durations"""
+        return {
+            step: {
+                'count': entry['count'],
+                'errors': entry['errors'],
+                'total_seconds': entry['seconds'],
+                'mean_seconds': entry['seconds'] / entry['count'] if entry['count'] else 0.0,
+                'max_seconds': entry['max_seconds']
+            }
+            for step, entry in self.snapshot().items()
+        }
+
+    def reset(self):
+        """Drop every recorded total"""
+        with self._lock:
+            self._steps = {}
+
+
+def _new_entry():
+    """Empty totals of one step"""
+    return {'count': 0, 'errors': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+            'buckets': [0] * (len(DURATION_BUCKETS) + 1)}
+
+
+def _label(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(steps, caches=None):
+    """Render step totals (and cache statistics) in the Prometheus text format
+
+    Args:
+        steps: Totals as returned by StageMetrics.snapshot()
+        caches: Optional mapping of cache name to its stats() dictionary
+    """
+    name = f'{METRIC_PREFIX}_stage_duration_seconds'
+    lines = [f'# HELP {name} Time spent in each analysis step.', f'# TYPE {name} histogram']
+    for step, entry in sorted(steps.items()):
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS + ('+Inf',), entry['buckets']):
+            cumulative += count
+            lines.append(f'{name}_bucket{{stage="{_label(step)}",le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{stage="{_label(step)}"}} {entry["seconds"]!r}')
+        lines.append(f'{name}_count{{stage="{_label(step)}"}} {entry["count"]}')
+
+    name = f'{METRIC_PREFIX}_stage_errors_total'
+    lines += [f'# HELP {name} Failed runs of each analysis step.', f'# TYPE {name} counter']
+    for step, entry in sorted(steps.items()):
+        lines.append(f'{name}{{stage="{_label(step)}"}} {entry["errors"]}')
+
+    if caches:
+        for metric, key, kind, text in (('cache_hits_total', 'hits', 'counter', "Cache lookups answered."),
+                                        ('cache_misses_total', 'misses', 'counter', "Cache lookups missed."),
+                                        ('cache_entries', 'size', 'gauge', "Entries held by the cache.")):
+            name = f'{METRIC_PREFIX}_{metric}'
+            lines += [f'# HELP {name} {text}', f'# TYPE {name} {kind}']
+            for cache, stats in sorted(caches.items()):
+                lines.append(f'{name}{{cache="{_label(cache)}"}} {stats[key]}')
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the streaming aggregation of analysis results
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import csv
+import json
+
+import pytest
+
+from aggregation import HyperLogLog, ResultAggregator
+from phone_info_tool import PhoneInfoTool, parse_args, run_batch
+from result_writers import SummaryWriter
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+1 800 555 0199", "+966501234567", "0501234567"]
+
+
+def test_hyperloglog_estimates_distinct_values():
+    """Estimates stay within a few percent and merged sketches count the union"""
+    first, second = HyperLogLog(), HyperLogLog()
+    for value in range(60000):
+        first.add(f"+9665{value:08d}")
+    for value in range(30000, 100000):
+        second.add(f"+9665{value:08d}")
+    assert abs(first.estimate() - 60000) < 0.03 * 60000
+
+    first.merge(second)
+    assert abs(first.estimate() - 100000) < 0.03 * 100000
+    small = HyperLogLog()
+    for value in ["a", "b", "a", "c"]:
+        small.add(value)
+    assert small.estimate() == 3
+
+
+def test_aggregator_counts_results():
+    """Counts, histograms and distinct estimates follow the analyzed results"""
+    tool = PhoneInfoTool(quiet=True, default_region='SA', stages=['basic'])
+    aggregator = tool.aggregate_batch(NUMBERS, workers=1, distinct=True)
+    summary = aggregator.summary()
+
+    assert (summary['total'], summary['valid'], summary['invalid']) == (6, 5, 1)
+    assert summary['invalid_rate'] == round(1 / 6, 6)
+    # Three spellings of one Saudi number are counted once
+    assert summary['distinct_numbers_estimate'] == 4
+    assert summary['counts']['country_code'] == {'966': 3, '44': 1, '1': 1}
+    assert list(summary['counts']['number_type'])[0] == 'MOBILE'
+    assert summary['counts']['time_zone']['Asia/Riyadh'] == 3
+    assert summary['histograms']['national_number_length'] == {'9': 3, '10': 2}
+
+    halves = ResultAggregator(distinct=True).extend(tool.iter_batch(NUMBERS[:3], workers=1))
+    halves.merge(ResultAggregator(distinct=True).extend(tool.iter_batch(NUMBERS[3:], workers=1)))
+    assert halves.summary() == summary
+
+
+def test_summary_mode_writes_json_and_csv(tmp_path, capsys):
+    """Bulk mode with --summary writes the aggregates instead of per-number rows"""
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text('\n'.join(NUMBERS), encoding='utf-8')
+    args = parse_args(['-i', str(input_file), '--summary', '--distinct'])
+    assert args.stages == ['basic_info']
+    tool = PhoneInfoTool(quiet=True, default_region='SA', stages=args.stages)
+
+    json_file = run_batch(tool, str(input_file), str(tmp_path / "summary.json"), workers=1, summary=True)
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding='utf-8'))
+    assert json_file.endswith("summary.json") and summary['total'] == 6
+    assert 'distinct_numbers_estimate' not in summary
+    assert capsys.readouterr().out == ''  # A quiet tool runs the batch silently
+
+    run_batch(tool, str(input_file), str(tmp_path / "summary.csv"), workers=1, summary=True, distinct=True)
+    with open(tmp_path / "summary.csv", newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['metric', 'value', 'count', 'share']
+    assert ['invalid', '', '1', str(round(1 / 6, 6))] in rows
+    assert ['distinct_numbers_estimate', '', '4', ''] in rows
+    assert ['country_code', '966', '3', '0.6'] in rows
+
+    with pytest.raises(ValueError):
+        SummaryWriter(str(tmp_path / "summary.xlsx"), 'xlsx')
+    for argv in (['--summary', '--fields', 'basic_info'], ['--summary', '-f', 'parquet'], ['--distinct']):
+        with pytest.raises(SystemExit):
+            parse_args(['-i', str(input_file)] + argv)
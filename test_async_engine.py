@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the asynchronous analysis engine
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import time
+import asyncio
+import threading
+
+from online_providers import JsonApiProvider
+import phone_info_tool
+from phone_info_tool import PhoneInfoTool
+from rate_limit import TokenBucket
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+81 3-1234-5678"] * 5
+
+
+class SlowOnlineStage:
+    """Online database stage that sleeps and records its peak concurrency"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, context):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return {'spam_score': "Low"}
+
+
+def test_async_engine_orders_results_and_bounds_concurrency():
+    """Results come back in input order with at most `concurrency` network stages in flight"""
+    tool = PhoneInfoTool(quiet=True)
+    stage = SlowOnlineStage()
+    tool.online_databases_for = stage
+    tool.online_search = object()  # Mark the online stage as network-bound
+
+    start = time.monotonic()
+    results = asyncio.run(tool.analyze_many_async(NUMBERS, concurrency=4))
+    elapsed = time.monotonic() - start
+
+    assert [result.phone_number for result in results] == NUMBERS
+    assert [result.valid for result in results] == [number != "12345" for number in NUMBERS]
+    assert results[0].online_databases == {'spam_score': "Low"}
+    assert results[0].basic_info == tool.lookup(NUMBERS[0]).basic_info
+    assert 1 < stage.peak <= 4
+    assert elapsed < 15 * stage.delay
+
+
+def test_token_bucket_spaces_requests():
+    """Requests beyond the burst capacity wait for the bucket to refill"""
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    async def take(count):
+        for _ in range(count):
+            await bucket.acquire_async()
+
+    start = time.monotonic()
+    asyncio.run(take(5))
+    assert time.monotonic() - start >= 4 / 20 * 0.9
+
+
+class CountingGeocoder:
+    """Stand-in for Nominatim that counts the limiter tokens and requests it sees"""
+
+    domain = 'nominatim.openstreetmap.org'
+
+    def __init__(self):
+        self.tokens = 0
+        self.queries = []
+
+    def acquire(self):
+        self.tokens += 1
+
+    def geocode(self, query):
+        self.queries.append(query)
+        return None
+
+
+def test_offline_geolocation_does_not_wait_on_the_rate_limit(tmp_path):
+    """Centroid and geocode cache hits never take a Nominatim token; only requests do"""
+    tool = PhoneInfoTool(quiet=True, online_geocoding=True, geocode_cache_path=str(tmp_path / "geocode.db"))
+    geocoder = tool.geolocator = tool.geocode_limiter = CountingGeocoder()
+
+    results = asyncio.run(tool.analyze_many_async(NUMBERS))
+    assert all(result.geolocation for result in results if result.valid)
+    # Saudi Arabia resolves from a centroid; each city is requested once, then cached
+    assert geocoder.tokens == 2 and geocoder.queries == ["London", "Tokyo"]
+
+    start = time.monotonic()
+    asyncio.run(tool.analyze_many_async(NUMBERS))
+    assert time.monotonic() - start < 1
+    assert geocoder.tokens == 2 and len(geocoder.queries) == 2
+
+
+class StandInSession:
+    """requests.Session stand-in answering every lookup with a clean report"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(time.monotonic())
+        return StandInResponse()
+
+
+class StandInResponse:
+    status_code = 200
+
+    def json(self):
+        return {'spam_score': "Low", 'reported_count': 0, 'last_reported': "Never", 'tags': []}
+
+
+def test_rate_limits_apply_to_provider_hosts_for_one_run():
+    """A host's rate limit spaces its provider's requests during the run, then the tool's limiters return"""
+    tool = PhoneInfoTool(quiet=True, online_providers=[JsonApiProvider('spam', "https://spam.example/lookup")])
+    session = tool.online_search.sessions['spam'] = StandInSession()
+    valid = [number for number in NUMBERS if number != "12345"][:5]
+
+    asyncio.run(tool.analyze_many_async(valid, rate_limits={'spam.example': 4}))
+    assert len(session.calls) == 5
+    # Four requests fit the bucket's burst, the fifth waits for a token
+    assert session.calls[-1] - session.calls[0] >= 0.25 * 0.9
+    assert tool.online_search.limiters == {}
+
+
+def take_geocode_tokens(chunk):
+    """Bulk-mode chunk function taking one geocode token per item, returning when each was granted"""
+    times = []
+    for _ in chunk:
+        phone_info_tool._worker_tool.geocode_limiter.acquire()
+        times.append(time.monotonic())
+    return times
+
+
+def test_worker_processes_share_the_geocode_rate_limit(tmp_path, monkeypatch):
+    """Every bulk-mode worker geocodes through the parent's bucket, so the pool keeps one rate"""
+    monkeypatch.setattr(phone_info_tool, 'GEOCODE_RATE_LIMIT', 5)
+    tool = PhoneInfoTool(quiet=True, online_geocoding=True, geocode_cache_path=str(tmp_path / "geocode.db"))
+
+    times = sorted(granted for _, granted in tool._map_chunks(take_geocode_tokens, range(8), 2, 1))
+    # Five tokens fit the burst; the other three are spaced 0.2s apart across both processes
+    assert times[-1] - times[0] >= 3 * 0.2 * 0.9
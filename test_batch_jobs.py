@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the GUI background job manager
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import json
+import time
+
+import batch_jobs
+from batch_jobs import JobManager, DONE, CANCELLED, PAUSED, RUNNING
+from phone_info_tool import PhoneInfoTool
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+1 800 555 0199"] * 25
+
+
+def collect(manager, job, timeout=30):
+    """Drain events until the job finishes, returning the posted pairs and event kinds"""
+    pairs, kinds = [], []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for event in manager.poll():
+            kinds.append(event.kind)
+            pairs.extend(event.pairs)
+            if event.kind == 'finished':
+                return pairs, kinds
+        time.sleep(0.01)
+    raise AssertionError(f"{job} did not finish")
+
+
+def test_job_streams_results_in_order(tmp_path, monkeypatch):
+    """A file job posts its results in small groups and writes them to its output file"""
+    monkeypatch.setattr(batch_jobs, 'EVENT_BATCH_SIZE', 30)
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text('\n'.join(NUMBERS), encoding='utf-8')
+    tool = PhoneInfoTool(quiet=True)
+    manager = JobManager(tool, workers=1, chunksize=16)
+
+    job = manager.submit_file(str(input_file), str(tmp_path / "out.jsonl"))
+    pairs, kinds = collect(manager, job)
+    manager.shutdown()
+
+    assert job.state == DONE and (job.done, job.total, job.valid) == (100, 100, 75)
+    # timezone_info holds the current time, so only the stable sections are compared
+    expected = list(tool.iter_batch(NUMBERS, workers=1))
+    assert [number for number, _ in pairs] == NUMBERS
+    assert [results and results['basic_info'] for _, results in pairs] == \
+        [results and results['basic_info'] for _, results in expected]
+    assert kinds[0] == 'started' and kinds.count('results') >= 4
+    assert job.throughput > 0 and job.eta == 0
+    lines = (tmp_path / "out.jsonl").read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['number'] for line in lines] == NUMBERS
+
+
+def test_pause_resume_and_cancel(tmp_path):
+    """A paused job makes no progress until resumed; a cancelled job stops early"""
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text('\n'.join(NUMBERS * 10), encoding='utf-8')
+    manager = JobManager(PhoneInfoTool(quiet=True), workers=1, chunksize=16)
+
+    job = manager.submit_file(str(input_file))
+    try:
+        job.pause()
+        assert job.state == PAUSED
+        time.sleep(0.1)
+        done = job.done
+        time.sleep(0.2)
+        assert job.done == done and job.state == PAUSED
+        before = [pair for event in manager.poll() for pair in event.pairs]
+        job.resume()
+
+        deadline = time.monotonic() + 30
+        while job.done <= done and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert job.state == RUNNING
+        job.cancel()
+        pairs, kinds = collect(manager, job)
+    finally:
+        manager.shutdown()
+
+    assert job.state == CANCELLED and done <= job.done < 1000
+    assert len(before) + len(pairs) == job.done
+    assert kinds[-1] == 'finished'
+
+
+def test_background_tasks_post_their_result():
+    """Lookups and other tasks post their result, or the exception they raised"""
+    manager = JobManager(PhoneInfoTool(quiet=True))
+    manager.submit_lookup("+966 50 123 4567")
+    manager.submit_task('table', 'missing.json', open, 'missing.json')
+
+    events = []
+    deadline = time.monotonic() + 10
+    while len(events) < 2 and time.monotonic() < deadline:
+        events.extend(manager.poll())
+        time.sleep(0.01)
+    manager.shutdown()
+
+    (number, result), = events[0].pairs
+    assert events[0].kind == 'lookup' and number == "+966 50 123 4567" and result.valid
+    assert events[1].kind == 'table' and isinstance(events[1].pairs[0][1], FileNotFoundError)
+
+
+def wait_for(job, timeout=30):
+    """Wait until a job finishes"""
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.finished, f"{job} did not finish"
+
+
+def test_paused_queued_job_does_not_block_the_queue(tmp_path):
+    """Jobs queued after a paused one still run; the paused job runs once resumed, or finishes once cancelled"""
+    big, small = tmp_path / "big.txt", tmp_path / "small.txt"
+    big.write_text('\n'.join(NUMBERS * 10), encoding='utf-8')
+    small.write_text('\n'.join(NUMBERS[:4]), encoding='utf-8')
+    manager = JobManager(PhoneInfoTool(quiet=True), workers=1)
+
+    try:
+        manager.submit_file(str(big))
+        paused = manager.submit_file(str(small))
+        paused.pause()
+        cancelled = manager.submit_file(str(small))
+        cancelled.pause()
+        later = manager.submit_file(str(small))
+        wait_for(later)
+        assert later.state == DONE
+        assert paused.state == PAUSED and paused.done == 0
+
+        paused.resume()
+        cancelled.cancel()
+        wait_for(paused)
+        wait_for(cancelled)
+    finally:
+        manager.shutdown()
+
+    assert paused.state == DONE and paused.done == 4
+    assert cancelled.state == CANCELLED and cancelled.done == 0
+    finished = [event.job for event in manager.poll() if event.kind == 'finished']
+    assert paused in finished and cancelled in finished
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the benchmarks of the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+from phone_info_tool import PhoneInfoTool
+from benchmark_tool import benchmark_suite, build_corpus, compare, measure_import
+
+
+def test_import_loads_no_heavy_modules():
+    """Importing the tool leaves pandas, geopy, requests and friends unloaded"""
+    result = measure_import('phone_info_tool', runs=1)
+    assert result['heavy_modules'] == []
+    assert result['median'] > 0
+
+
+def test_corpus_is_reproducible_and_mixed():
+    """The same seed gives the same corpus with the requested share of invalid inputs"""
+    corpus = build_corpus(400, invalid_ratio=0.25, seed=7)
+    assert corpus == build_corpus(400, invalid_ratio=0.25, seed=7)
+    assert corpus != build_corpus(400, invalid_ratio=0.25, seed=8)
+
+    tool = PhoneInfoTool(quiet=True)
+    valid = sum(1 for number in corpus if tool.normalize_number(number))
+    assert valid == 300
+
+
+def test_suite_reports_every_benchmark(tmp_path):
+    """The suite times every stage and export format and compares against a baseline"""
+    results = benchmark_suite(build_corpus(60, seed=1), export_dir=str(tmp_path))
+
+    for name in ('stage.validate_phone_number', 'stage.get_basic_info', 'stage.get_geolocation',
+                 'stage.get_timezone_info', 'lookup', 'batch', 'export.json', 'export.jsonl', 'export.csv',
+                 'export_results.csv', 'export_results.excel', 'export_results.html'):
+        assert results[name]['throughput'] > 0
+    assert results['stage.validate_phone_number']['items'] == 60
+    assert results['stage.get_basic_info']['items'] == 54
+    assert all(change == 0 for _, _, change in compare(results, results).values())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the compact result storage
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import json
+import tracemalloc
+
+from phone_info_tool import PhoneInfoTool
+from compact_results import ResultBatch, INTERN_SAMPLE
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+1 800 555 0199", "+81 3-1234-5678"]
+
+
+def test_batch_round_trips_analysis_results():
+    """A ResultBatch gives back exactly the results it was built from"""
+    tool = PhoneInfoTool(quiet=True, record_timings=True)
+    pairs = list(tool.iter_batch(NUMBERS, workers=1))
+    batch = ResultBatch(pairs)
+
+    assert len(batch) == len(NUMBERS)
+    assert list(batch.pairs()) == pairs
+    assert list(batch) == [results for _, results in pairs]
+    assert batch[-1] == pairs[-1][1] and batch[1] is None
+    assert batch.numbers == NUMBERS
+    assert tool.analyze_batch(NUMBERS, workers=1, compact=True)[0]['basic_info'] == pairs[0][1]['basic_info']
+
+
+def test_values_keep_their_types():
+    """Nested lists, tuples, booleans, big integers and None survive the round trip"""
+    results = {'a': {'flag': True, 'count': 0, 'big': 10 ** 30, 'ratio': 0.5, 'none': None, 'text': "Unknown"},
+               'b': [{'name': "Asia/Riyadh"}, ("x", 1), []], 'c': {}}
+    batch = ResultBatch([("1", results), ("2", None), ("3", results)])
+
+    assert batch[0] == results and batch[2] == results and batch[1] is None
+    assert type(batch[0]['a']['flag']) is bool and isinstance(batch[0]['b'][1], tuple)
+    assert len(batch.shapes) == 2
+
+
+
+def test_unique_strings_are_not_interned():
+    """Mostly unique string leaves stop being interned once sampled, repeated ones stay interned"""
+    rows = [(f"+9665{index:08d}", {'basic_info': {'e164': f"+9665{index:08d}", 'country': "Saudi Arabia"}})
+            for index in range(INTERN_SAMPLE * 4)]
+    batch = ResultBatch(rows)
+
+    assert list(batch.pairs()) == rows
+    assert "Saudi Arabia" in batch.strings
+    assert len(batch.strings) <= INTERN_SAMPLE + 1
+    assert not any(number in batch.strings for number, _ in rows[INTERN_SAMPLE:])
+
+
+def test_batch_is_smaller_than_dictionaries():
+    """Many results held in a ResultBatch take a fraction of the memory of the dictionaries"""
+    tool = PhoneInfoTool(quiet=True, default_region='SA')
+    numbers = [f"05{index:08d}" for index in range(2000)]
+    pairs = list(tool.iter_batch(numbers, workers=1))
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    batch = ResultBatch(pairs)
+    compact_size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    serialized = json.dumps(pairs)
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    copy = json.loads(serialized)
+    dict_size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    assert [list(pair) for pair in batch.pairs()] == copy
+    assert compact_size * 3 < dict_size
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the geocoding cache
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+from collections import namedtuple
+
+from geocode_cache import GeocodeCache, MISS
+from phone_info_tool import PhoneInfoTool
+
+Location = namedtuple('Location', 'latitude longitude')
+
+
+class CountingGeolocator:
+    """Stand-in for Nominatim that counts the queries it receives"""
+
+    def __init__(self):
+        self.queries = []
+
+    def geocode(self, query):
+        self.queries.append(query)
+        return Location(37.39, -122.08)
+
+
+def test_cache_is_shared_through_disk(tmp_path):
+    """A second cache on the same file sees entries written by the first"""
+    path = str(tmp_path / "geocode.sqlite3")
+    GeocodeCache(path).set("Riyadh", (24.7, 46.7))
+    GeocodeCache(path).set("Atlantis", None)
+
+    cache = GeocodeCache(path)
+    assert cache.get("Riyadh") == (24.7, 46.7)
+    assert cache.get("Atlantis") is None
+    assert cache.get("Jeddah") is MISS
+
+
+def test_cache_expiry_and_eviction(tmp_path):
+    """Expired entries are misses and the LRU keeps at most maxsize entries"""
+    expired = GeocodeCache(str(tmp_path / "expired.sqlite3"), ttl=-1)
+    expired.set("Riyadh", (24.7, 46.7))
+    assert expired.get("Riyadh") is MISS
+
+    cache = GeocodeCache(None, maxsize=2)
+    cache.set("a", (1, 1))
+    cache.set("b", (2, 2))
+    cache.get("a")
+    cache.set("c", (3, 3))
+    assert cache.get("b") is MISS
+    assert cache.get("a") == (1, 1)
+
+
+def test_tool_queries_each_description_once(tmp_path):
+    """Repeated analyses of the same area only geocode it once"""
+    tool = PhoneInfoTool(quiet=True, online_geocoding=True,
+                         geocode_cache_path=str(tmp_path / "geocode.sqlite3"))
+    tool.geolocator = CountingGeolocator()
+
+    for _ in range(3):
+        assert tool.analyze_number("+1 650-253-0000")
+
+    assert tool.geolocator.queries == ["Mountain View, CA"]
+    assert tool.results['geolocation']['coordinates'] == {"latitude": 37.39, "longitude": -122.08}
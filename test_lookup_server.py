@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the HTTP lookup service
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import json
+import time
+import threading
+import http.client
+
+import pytest
+
+from phone_info_tool import PhoneInfoTool
+from lookup_server import LookupServer, start_in_thread
+
+
+@pytest.fixture
+def server():
+    httpd = start_in_thread(PhoneInfoTool(quiet=True), workers=4, request_timeout=2.0, max_batch=5)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(server, method, path, body=None):
+    """Send a request and return (status, decoded JSON or text body)"""
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    headers = {'Content-Type': 'application/json'} if body is not None else {}
+    connection.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+    response = connection.getresponse()
+    data = response.read().decode('utf-8')
+    connection.close()
+    if response.getheader('Content-Type') == 'application/json':
+        data = json.loads(data)
+    return response.status, data
+
+
+def test_lookup_endpoint(server):
+    """/lookup answers with the same sections as PhoneInfoTool.lookup"""
+    status, entry = request(server, 'GET', '/lookup?number=%2B966501234567')
+    assert status == 200
+    assert entry['valid'] is True
+    assert entry['results']['basic_info'] == PhoneInfoTool(quiet=True).lookup("+966501234567").basic_info
+
+    assert request(server, 'GET', '/lookup?number=12345')[1] == {'number': "12345", 'valid': False, 'results': None}
+    assert request(server, 'GET', '/lookup')[0] == 400
+    assert request(server, 'GET', '/nowhere')[0] == 404
+
+
+def test_batch_endpoint(server):
+    """/batch keeps input order and enforces the batch size limit"""
+    numbers = ["+44 20 7946 0958", "12345", "+966 50 123 4567"]
+    status, body = request(server, 'POST', '/batch', {'numbers': numbers})
+    assert status == 200
+    assert [entry['number'] for entry in body['results']] == numbers
+    assert [entry['valid'] for entry in body['results']] == [True, False, True]
+
+    assert request(server, 'POST', '/batch', ["+966501234567"] * 6)[0] == 413
+    assert request(server, 'POST', '/batch', {'numbers': [1, 2]})[0] == 400
+    for length in ('abc', '-1'):
+        connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+        connection.putrequest('POST', '/batch')
+        connection.putheader('Content-Length', length)
+        connection.endheaders()
+        assert connection.getresponse().status == 400
+        connection.close()
+
+
+def test_request_timeout(server):
+    """Lookups slower than the request timeout are answered with 504"""
+    server.request_timeout = 0.1
+    server.tool.timezone_info_for = lambda context: time.sleep(0.5)
+    assert request(server, 'GET', '/lookup?number=%2B966501234567')[0] == 504
+
+
+def test_stats_and_metrics(server):
+    """/stats and /metrics expose the tool's instrumentation"""
+    request(server, 'GET', '/lookup?number=%2B966501234567')
+    status, stats = request(server, 'GET', '/stats')
+    assert status == 200 and stats['stages']['lookup']['count'] >= 1
+    status, text = request(server, 'GET', '/metrics')
+    assert status == 200 and 'phone_info_stage_duration_seconds_count{stage="lookup"}' in text
+
+
+def test_closing_cancels_queued_lookups():
+    """server_close() cancels the lookups still waiting for a worker"""
+    httpd = LookupServer(PhoneInfoTool(quiet=True), port=0, workers=1)
+    release = threading.Event()
+    running = httpd.submit(release.wait, 5)
+    queued = httpd.submit(time.sleep, 0)
+
+    httpd.server_close()
+    release.set()
+    assert queued.cancelled() and running.result(5)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the prefix-keyed metadata cache
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import phonenumbers
+from phonenumbers import PhoneNumberType
+
+from metadata_cache import MetadataCache
+
+
+def example_numbers():
+    """Example mobile and fixed-line numbers for every supported region"""
+    for region in sorted(phonenumbers.SUPPORTED_REGIONS):
+        for number_type in (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE):
+            number = phonenumbers.example_number_for_type(region, number_type)
+            if number is not None:
+                yield number
+
+
+def test_cached_metadata_matches_phonenumbers():
+    """Cache hits return exactly what the uncached lookups return"""
+    cache = MetadataCache()
+    numbers = list(example_numbers())
+
+    for _ in range(2):
+        for number in numbers:
+            assert cache.lookup(number) == MetadataCache._compute(number)
+
+    stats = cache.stats()
+    assert stats['hits'] >= len(numbers) - 2
+    assert stats['hits'] + stats['misses'] == 2 * len(numbers)
+
+
+def test_numbers_sharing_a_prefix_share_an_entry():
+    """Different subscribers behind the same carrier prefix hit the same entry"""
+    cache = MetadataCache()
+
+    cache.lookup(phonenumbers.parse("+966501234567"))
+    cache.lookup(phonenumbers.parse("+966507654321"))
+
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['size'] == 1
+
+
+def test_concurrent_lookups_keep_consistent_counters():
+    """Threads sharing a small cache count every lookup once and never overfill it"""
+    cache = MetadataCache(maxsize=50)
+    numbers = list(example_numbers())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: [cache.lookup(number) for number in numbers], range(8)))
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * len(numbers)
+    assert stats['size'] <= 50
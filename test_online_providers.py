@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the online database providers, run against a local stand-in HTTP server
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from online_providers import JsonApiProvider, OnlineDatabaseSearch, ProviderError
+from phone_info_tool import PhoneInfoTool
+
+
+# Malformed answers of /broken, picked by the last digit of the number
+BROKEN_ANSWERS = [
+    {'spam_score': "High", 'reported_count': None},
+    {'spam_score': "High", 'reported_count': "many"},
+    {'last_reported': 20240102},
+    {'last_reported': None},
+    {'tags': "Telemarketing"},
+    {'reported_count': True},
+    ["not", "an", "object"],
+]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers /spam, /flaky and /broken lookups; /flaky fails every other request with 503"""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        number = parse_qs(url.query)['number'][0]
+        server = self.server
+        with server.lock:
+            server.requests.append((url.path, number))
+            server.flaky_calls += url.path == '/flaky'
+            fail = url.path == '/flaky' and server.flaky_calls % 2 == 1
+
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+        if url.path == '/spam':
+            body = {'spam_score': "High", 'reported_count': 3, 'last_reported': "2024-01-02", 'tags': ["Telemarketing"]}
+        elif url.path == '/broken':
+            body = BROKEN_ANSWERS[int(number[-1]) % len(BROKEN_ANSWERS)]
+        else:
+            body = {'spam_score': "Low", 'reported_count': 1, 'last_reported': "2023-05-06", 'tags': ["Survey"]}
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.flaky_calls = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_providers_are_merged_and_retried(server):
+    """Answers from every provider are merged; transient 503s are retried"""
+    search = OnlineDatabaseSearch([
+        JsonApiProvider('spam', base_url(server, '/spam')),
+        JsonApiProvider('flaky', base_url(server, '/flaky'), backoff=0.01),
+        JsonApiProvider('down', "http://127.0.0.1:1/", timeout=0.5, retries=1, backoff=0.01),
+    ])
+
+    section = search.search("+966501234567")
+    search.close()
+
+    assert section['spam_score'] == "High"
+    assert section['reported_count'] == 4
+    assert section['last_reported'] == "2024-01-02"
+    assert section['tags'] == ["Telemarketing", "Survey"]
+    assert 'error' in section['sources']['down']
+    assert server.flaky_calls == 2
+
+
+def test_tool_queries_providers_with_e164_number(server):
+    """The tool sends the E.164 form of the analyzed number to its providers"""
+    tool = PhoneInfoTool(quiet=True, online_providers=[JsonApiProvider('spam', base_url(server, '/spam'))])
+
+    result = tool.lookup("+966 50 123 4567")
+
+    assert result.online_databases['spam_score'] == "High"
+    assert server.requests == [('/spam', "+966501234567")]
+
+
+def test_malformed_answers_are_provider_errors(server):
+    """Answers with missing or mistyped values are reported as a failed provider, not raised"""
+    provider = JsonApiProvider('broken', base_url(server, '/broken'))
+    search = OnlineDatabaseSearch([JsonApiProvider('spam', base_url(server, '/spam')), provider])
+
+    section = search.search("+966501234567")
+    for last_digit in range(len(BROKEN_ANSWERS)):
+        with pytest.raises(ProviderError, match="Invalid response"):
+            search.query(provider, f"+96650123456{last_digit}")
+    search.close()
+
+    assert section['reported_count'] == 3
+    assert section['sources']['broken']['error'].startswith("Invalid response")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the vectorized prefix classifier
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import re
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import phonenumbers
+
+from phone_info_tool import PhoneInfoTool
+from prefix_classifier import DigitPattern, PrefixClassifier, FALLBACK, mismatches
+
+
+def mutated_numbers(region, count, seed):
+    """Example numbers of a region with random digit changes, in assorted spellings"""
+    rng = random.Random(seed)
+    metadata = phonenumbers.PhoneMetadata.metadata_for_region(region)
+    examples = [desc.example_number for desc in (metadata.fixed_line, metadata.mobile, metadata.toll_free,
+                                                 metadata.premium_rate, metadata.uan) if desc and desc.example_number]
+    numbers = []
+    for _ in range(count):
+        digits = list(rng.choice(examples))
+        for _ in range(rng.randint(0, 3)):
+            digits[rng.randrange(len(digits))] = str(rng.randrange(10))
+        national = ''.join(digits[:rng.randint(1, len(digits))] if rng.random() < 0.1 else digits)
+        spelling = rng.choice(("+{cc} {n}", "00{cc}{n}", "{p}{n}", "({p}{n2}) {n3}-{n4}", "{cc}{n}", "{n}"))
+        numbers.append(spelling.format(cc=metadata.country_code, p=metadata.national_prefix or '', n=national,
+                                       n2=national[:2], n3=national[2:5], n4=national[5:]))
+    return numbers + ["", "+", "abc", "+44 20 7946 0958", "٠٥٠١٢٣٤٥٦٧", "+966 50 123 4567 ext. 9"]
+
+
+def test_digit_patterns_match_like_re():
+    """Compiled intervals hold exactly the values re.fullmatch (or re.match) accepts"""
+    for pattern in (r"(?:[15]\d|800|92)\d{2}", r"5(?:0[1-9]|[2-9]\d?)\d", r"(000[2569]\d)$|0", r"[^3]\d{1,2}"):
+        compiled = re.compile(pattern)
+        for length in (3, 4):
+            for prefix in (False, True):
+                ranges = DigitPattern(pattern).intervals(length, prefix)
+                matched = {value for start, end in ranges for value in range(start, end)}
+                test = compiled.match if prefix else compiled.fullmatch
+                assert matched == {value for value in range(10 ** length) if test(f"{value:0{length}d}")}
+
+
+@pytest.mark.parametrize('region', ['SA', 'DE', 'JP'])
+def test_classifier_matches_per_number_analysis(region):
+    """Every number the classifier handles gets the same basic_info as the per-number analysis"""
+    tool = PhoneInfoTool(quiet=True, default_region=region)
+    classifier = PrefixClassifier(region)
+    numbers = mutated_numbers(region, 1500, seed=3)
+
+    assert mismatches(tool, numbers, classifier) == []
+    entries = classifier.basic_info(numbers, {})
+    assert sum(entry is FALLBACK for entry in entries) < len(numbers)
+    assert any(isinstance(entry, dict) for entry in entries) and None in entries
+    # Empty, foreign and non-ASCII inputs are left to phonenumbers
+    assert all(entry is FALLBACK for entry in entries[-6:-1])
+
+
+def test_fast_batch_matches_regular_batch():
+    """iter_fast_batch yields the basic_info results of a basic-only batch"""
+    tool = PhoneInfoTool(quiet=True, default_region='SA', stages=['basic'])
+    numbers = mutated_numbers('SA', 300, seed=4)
+
+    assert list(tool.iter_fast_batch(numbers, chunksize=64)) == list(tool.iter_batch(numbers, workers=1))
+    assert tool.stats()['stages']['fast_basic_info']['count'] == 5
+
+
+def test_shared_country_codes_are_rejected():
+    """Regions sharing their country code or using a mobile token are not supported"""
+    for region in ('US', 'GB', 'AR'):
+        with pytest.raises(ValueError):
+            PrefixClassifier(region)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the persistent result cache
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import time
+import asyncio
+
+from phone_info_tool import PhoneInfoTool
+from online_providers import OnlineProvider, ProviderError
+from result_cache import ResultCache
+
+NUMBERS = ["+966 50 123 4567", "12345", "00966501234567", "+44 20 7946 0958"]
+
+
+def test_sections_expire_by_their_own_ttl(tmp_path, monkeypatch):
+    """Each section is fresh for its own lifetime; uncached sections are never stored"""
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), ttls={'online_databases': 60})
+    cache.set("+966501234567", {'basic_info': {'country': "Saudi Arabia"}, 'online_databases': {'spam_score': "Low"},
+                                'timezone_info': [{'name': "Asia/Riyadh"}]})
+
+    assert set(cache.get("+966501234567")) == {'basic_info', 'online_databases'}
+
+    later = time.time() + 120
+    monkeypatch.setattr(time, 'time', lambda: later)
+    assert cache.get("+966501234567") == {'basic_info': {'country': "Saudi Arabia"}}
+    assert cache.purge() == 1
+    assert cache.get_many(["+966501234567", "+12025550143"]) == {"+966501234567": {'basic_info': {'country': "Saudi Arabia"}}}
+
+
+def test_repeated_batches_only_analyze_new_numbers(tmp_path):
+    """A second run over the same numbers reuses every cacheable section"""
+    path = str(tmp_path / "results.sqlite3")
+    first = PhoneInfoTool(quiet=True, result_cache_path=path).analyze_batch(NUMBERS, workers=1)
+
+    tool = PhoneInfoTool(quiet=True, result_cache_path=path)
+    second = tool.analyze_batch(NUMBERS + ["+81 3-1234-5678"], workers=2, chunksize=2)
+
+    assert [results and results['basic_info'] for results in second[:4]] == \
+        [results and results['basic_info'] for results in first]
+    assert second[4]['basic_info']['country_code'] == 81
+    assert tool.stats()['stages']['basic_info']['count'] == 1  # Only the new number
+    assert tool.stats()['stages']['timezone_info']['count'] == 4  # Never cached
+
+
+def test_lookup_and_async_engine_use_the_cache(tmp_path):
+    """Single lookups and the async engine read and fill the same cache"""
+    tool = PhoneInfoTool(quiet=True, result_cache_path=str(tmp_path / "results.sqlite3"))
+    expected = tool.lookup(NUMBERS[0])
+
+    results = asyncio.run(tool.analyze_many_async(NUMBERS, concurrency=2))
+
+    assert results[0].basic_info == expected.basic_info
+    assert results[2].online_databases == expected.online_databases
+    assert tool.stats()['stages']['basic_info']['count'] == 2  # The lookup, then the UK number
+    assert tool.result_cache.stats()['hits'] > 0
+
+
+class FailingProvider(OnlineProvider):
+    """Provider whose every query fails without touching the network"""
+
+    def build_request(self, e164_number):
+        raise ProviderError("unreachable")
+
+
+def test_settings_key_the_cache_and_non_answers_are_not_stored(tmp_path):
+    """Other settings do not reuse cached sections; placeholder and failed online data are never stored"""
+    path = str(tmp_path / "results.sqlite3")
+    offline = PhoneInfoTool(quiet=True, result_cache_path=path)
+    offline.lookup(NUMBERS[0])
+    assert set(offline.result_cache.get("+966501234567")) == {'basic_info', 'geolocation'}
+
+    online = PhoneInfoTool(quiet=True, result_cache_path=path, online_geocoding=True,
+                           online_providers=[FailingProvider("down", "https://example.invalid/lookup")])
+    online.geolocator.geocode = lambda query: None
+    assert online.result_cache.get("+966501234567") == {}
+    result = online.lookup(NUMBERS[0])
+    assert result.online_databases['sources'] == {'down': {'error': "unreachable"}}
+    assert set(online.result_cache.get("+966501234567")) == {'basic_info', 'geolocation'}
+
+    basic = PhoneInfoTool(quiet=True, result_cache_path=path, stages=['basic'])
+    basic.lookup(NUMBERS[0])
+    assert basic.stats()['stages']['basic_info']['count'] == 1
+    offline.lookup(NUMBERS[0])
+    assert offline.stats()['stages']['online_databases']['count'] == 2
+    assert offline.stats()['stages']['basic_info']['count'] == 1
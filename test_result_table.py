@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the GUI batch results table model
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+from phone_info_tool import PhoneInfoTool
+from result_table import ResultTable, load_table
+from result_writers import CSV_COLUMNS
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+1 800 555 0199", "+966 11 234 5678"]
+
+
+def test_sort_and_filter_the_model():
+    """Sorting and filtering reorder row indices; rows are read only for the requested range"""
+    tool = PhoneInfoTool(quiet=True)
+    table = ResultTable().extend(tool.iter_batch(NUMBERS, workers=1))
+    assert len(table) == table.total == 5
+    assert [row[0] for row in table.rows(0, 10)] == NUMBERS
+
+    table.sort('basic_info_country_code')
+    assert [row[3] for row in table.rows(0, 5)] == ['1', '44', '966', '966', '']
+    table.sort('basic_info_country_code', descending=True)
+    assert table.row(0)[3] == '' and table.row(-1)[3] == '1'
+
+    table.filter('saudi')
+    assert len(table) == 2 and table.total == 5
+    table.filter('saudi', column='number')
+    assert len(table) == 0
+    table.filter('')
+    table.sort(None)
+    assert [row[0] for row in table.rows(0, 5)] == NUMBERS
+
+
+def test_appended_rows_keep_the_view_order():
+    """Rows added while sorted and filtered land in their place in the view"""
+    table = ResultTable(('number', 'score'))
+    for number, score in (("a", "5"), ("b", "10"), ("c", "x")):
+        table.append_row((number, score))
+    table.sort('score')
+    assert [row[0] for row in table.rows(0, 3)] == ["a", "b", "c"]
+
+    table.append_row(("d", "7"))
+    table.filter('d')
+    table.append_row(("dd", "1"))
+    table.append_row(("e", "2"))
+    assert [row[0] for row in table.rows(0, 10)] == ["dd", "d"]
+
+
+def test_load_exports(tmp_path):
+    """JSON Lines and CSV batch exports load into the same table"""
+    tool = PhoneInfoTool(quiet=True)
+    tables = []
+    for format_type in ('jsonl', 'csv'):
+        path = str(tmp_path / f"results.{format_type}")
+        tool.export_batch(NUMBERS, path, workers=1)
+        tables.append(load_table(path))
+
+    assert tables[0].columns == tables[1].columns == CSV_COLUMNS
+    assert tables[0].rows(0, 5) == tables[1].rows(0, 5)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the streaming result writers
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import csv
+import json
+
+import pytest
+
+from phone_info_tool import PhoneInfoTool
+from result_writers import (CSV_COLUMNS, ColumnarResultBuilder, ExcelWriter, HtmlReportWriter, flatten_results,
+                            format_for_path, open_writer, project_results, select_schema)
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+1 800 555 0199"]
+
+
+def test_writers_stream_every_format(tmp_path):
+    """JSON, JSON Lines and CSV outputs hold one entry per number in input order"""
+    tool = PhoneInfoTool(quiet=True)
+    expected = list(tool.iter_batch(NUMBERS, workers=1))
+
+    for format_type in ('json', 'jsonl', 'csv'):
+        path = tmp_path / f"results.{format_type}"
+        writer = tool.export_batch(NUMBERS, str(path), workers=1)
+        assert (writer.count, writer.valid_count) == (4, 3)
+
+        if format_type == 'json':
+            entries = json.loads(path.read_text(encoding='utf-8'))
+        elif format_type == 'jsonl':
+            entries = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        else:
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+            assert tuple(rows[0]) == CSV_COLUMNS
+            assert all(len(row) == len(CSV_COLUMNS) for row in rows)
+            assert [row[0] for row in rows[1:]] == NUMBERS
+            assert [row[1] for row in rows[1:]] == ["True", "False", "True", "True"]
+            assert rows[1][CSV_COLUMNS.index('basic_info_carrier')] == expected[0][1]['basic_info']['carrier']
+            continue
+
+        assert [entry['number'] for entry in entries] == NUMBERS
+        assert [entry['results'] and entry['results']['basic_info'] for entry in entries] == \
+            json.loads(json.dumps([results and results['basic_info'] for _, results in expected]))
+
+
+def test_fields_restrict_every_format(tmp_path):
+    """Selected columns and sections are the only ones written"""
+    tool = PhoneInfoTool(quiet=True)
+    fields = ['basic_info_is_valid', 'basic_info_number_type', 'timezone_info_name', 'geolocation']
+
+    csv_path = tmp_path / "results.csv"
+    tool.export_batch(NUMBERS, str(csv_path), workers=1, fields=fields)
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['number', 'valid', 'basic_info_is_valid', 'basic_info_number_type', 'geolocation_country',
+                       'geolocation_region', 'geolocation_coordinates_latitude',
+                       'geolocation_coordinates_longitude', 'timezone_info_name']
+    assert rows[1][:4] == ["+966 50 123 4567", "True", "True", "MOBILE"]
+
+    jsonl_path = tmp_path / "results.jsonl"
+    tool.export_batch(NUMBERS, str(jsonl_path), workers=1, fields=fields)
+    entries = [json.loads(line) for line in jsonl_path.read_text(encoding='utf-8').splitlines()]
+    first = entries[0]['results']
+    assert set(first) == {'basic_info', 'geolocation', 'timezone_info'}
+    assert first['basic_info'] == {'is_valid': True, 'number_type': "MOBILE"}
+    assert first['geolocation'] == tool.lookup(NUMBERS[0]).geolocation
+    assert first['timezone_info'] == [{'name': "Asia/Riyadh"}]
+    assert entries[1]['results'] is None
+
+    assert project_results({'basic_info': {'country': "Japan"}}, select_schema(['geolocation'])) == {}
+    with pytest.raises(ValueError):
+        select_schema(['basic_info_colour'])
+
+
+def test_empty_json_output_is_valid(tmp_path):
+    """A JSON writer closed without results still produces a valid document"""
+    path = tmp_path / "empty.json"
+    open_writer(str(path)).close()
+    assert json.loads(path.read_text(encoding='utf-8')) == []
+
+
+def test_flatten_results():
+    """Nested sections and list items become single-level columns"""
+    flat = flatten_results({
+        'geolocation': {'country': "Saudi Arabia", 'coordinates': {'latitude': 25.0, 'longitude': 45.0}},
+        'timezone_info': [{'name': "Asia/Riyadh", 'current_time': "now"}]
+    })
+    assert flat == {
+        'geolocation_country': "Saudi Arabia",
+        'geolocation_coordinates_latitude': 25.0,
+        'geolocation_coordinates_longitude': 45.0,
+        'timezone_info_1_name': "Asia/Riyadh",
+        'timezone_info_1_current_time': "now"
+    }
+
+
+def test_columnar_export_is_typed(tmp_path):
+    """Parquet and Arrow exports keep numeric types and dictionary encode categories"""
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    tool = PhoneInfoTool(quiet=True)
+    builder = ColumnarResultBuilder().extend(tool.iter_batch(NUMBERS, workers=1))
+    table = builder.to_table()
+
+    assert table.num_rows == len(NUMBERS)
+    assert table.column_names == list(CSV_COLUMNS)
+    assert pa.types.is_dictionary(table.schema.field('basic_info_country').type)
+    assert table.schema.field('geolocation_coordinates_latitude').type == pa.float64()
+    assert table.column('basic_info_country_code').to_pylist() == [966, None, 44, 1]
+    assert table.column('basic_info_time_zones').to_pylist()[0] == ["Asia/Riyadh"]
+
+    for format_type, read in (('parquet', pq.read_table), ('arrow', feather.read_table)):
+        path = tmp_path / f"results.{format_type}"
+        writer = tool.export_batch(NUMBERS, str(path), workers=1)
+        assert writer.valid_count == 3
+        assert read(str(path)).column('basic_info_number_type').to_pylist() == \
+            table.column('basic_info_number_type').to_pylist()
+
+
+def test_excel_export_has_a_sheet_per_section(tmp_path, monkeypatch):
+    """The Excel export splits sections into sheets and continues full sheets on new ones"""
+    openpyxl = pytest.importorskip('openpyxl')
+    import result_writers
+    monkeypatch.setattr(result_writers, 'MAX_SHEET_ROWS', 4)
+
+    tool = PhoneInfoTool(quiet=True)
+    path = tmp_path / "results.xlsx"
+    writer = tool.export_batch(NUMBERS, str(path), workers=1, fields=['basic_info', 'timezone_info_name'])
+    assert (writer.count, writer.valid_count) == (4, 3)
+
+    workbook = openpyxl.load_workbook(str(path), read_only=True)
+    sheets = {sheet.title: list(sheet.iter_rows(values_only=True)) for sheet in workbook.worksheets}
+    assert list(sheets)[:2] == ['basic_info', 'timezone_info']
+    assert 'basic_info (2)' in sheets and all(len(rows) <= 4 for rows in sheets.values())
+    basic_rows = sheets['basic_info'][1:] + sheets['basic_info (2)'][1:]
+    zone_rows = [row for title, rows in sheets.items() if title.startswith('timezone_info') for row in rows[1:]]
+    assert [row[:2] for row in basic_rows] == [(number, number != "12345") for number in NUMBERS]
+    assert sheets['basic_info'][0][:3] == ('number', 'valid', 'basic_info_formatted_number')
+    assert basic_rows[0][3] == 966 and not any(basic_rows[1][2:])
+    assert zone_rows[0] == ("+966 50 123 4567", "Asia/Riyadh")
+    assert len(zone_rows) == 2 + len(tool.lookup("+1 800 555 0199").timezone_info)
+    assert format_for_path("results.xlsx") == 'excel'
+    with open_writer(str(tmp_path / "other.out"), 'xlsx') as writer:
+        assert isinstance(writer, ExcelWriter)
+
+
+def test_html_report_is_paginated(tmp_path):
+    """The HTML report streams rows into pages and summarizes the batch on its index page"""
+    tool = PhoneInfoTool(quiet=True)
+    path = tmp_path / "report.html"
+    writer = tool.write_results(HtmlReportWriter(str(path), page_size=3), tool.iter_batch(NUMBERS * 2, workers=1))
+
+    assert writer.pages == [[1, 3], [4, 6], [7, 8]]
+    assert (writer.aggregates.valid, writer.aggregates.invalid) == (6, 2)
+    assert writer.aggregates.counts['number_type']['TOLL_FREE'] == 2
+    index = path.read_text(encoding='utf-8')
+    assert '8 numbers, 6 valid, 3 pages' in index and 'report_pages/page_00003.html' in index
+    pages = sorted((tmp_path / "report_pages").iterdir())
+    assert [page.name for page in pages] == ['page_00001.html', 'page_00002.html', 'page_00003.html']
+    assert all(page.read_text(encoding='utf-8').count('<tr>') == 4 for page in pages[:2])
+    assert 'page_00002.html">Next' in pages[0].read_text(encoding='utf-8')
+    assert 'Next' not in pages[2].read_text(encoding='utf-8')
+    assert format_for_path("report.htm") == 'html'
+
+
+def test_html_report_of_an_empty_batch(tmp_path):
+    """An empty batch writes an index without shares and no pages"""
+    path = tmp_path / "empty.html"
+    writer = PhoneInfoTool(quiet=True).write_results(HtmlReportWriter(str(path)), [])
+
+    assert writer.pages == [] and not (tmp_path / "empty_pages").exists()
+    index = path.read_text(encoding='utf-8')
+    assert '0 numbers, 0 valid, 0 pages' in index
+    assert '<td>Valid</td><td>0</td><td>\u2014</td>' in index
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the stage instrumentation
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+import asyncio
+
+from phone_info_tool import PhoneInfoTool, RESULT_SECTIONS
+from stage_metrics import DURATION_BUCKETS, StageMetrics, prometheus_text
+
+NUMBERS = ["+966 50 123 4567", "12345", "+44 20 7946 0958", "+81 3-1234-5678"]
+
+
+def test_metrics_count_durations_and_errors():
+    """Recorded runs add up and merge across instances"""
+    metrics = StageMetrics()
+    metrics.record('basic_info', 0.002)
+    metrics.record('basic_info', 0.004, error=True)
+
+    other = StageMetrics()
+    other.record('basic_info', 20.0)
+    metrics.merge(other.drain())
+
+    summary = metrics.summary()['basic_info']
+    assert (summary['count'], summary['errors'], summary['max_seconds']) == (3, 1, 20.0)
+    assert abs(summary['total_seconds'] - 20.006) < 1e-9
+    assert other.snapshot() == {}
+    assert metrics.snapshot()['basic_info']['buckets'][-1] == 1  # Beyond the last bound
+
+
+def test_prometheus_text_format():
+    """Histograms are cumulative and end with +Inf, _sum and _count samples"""
+    metrics = StageMetrics()
+    for seconds in (0.00005, 0.003, 0.003):
+        metrics.record('validate', seconds)
+    text = prometheus_text(metrics.snapshot(), {'metadata': {'hits': 5, 'misses': 2, 'size': 2}})
+    lines = text.splitlines()
+
+    assert '# TYPE phone_info_stage_duration_seconds histogram' in lines
+    assert f'phone_info_stage_duration_seconds_bucket{{stage="validate",le="{DURATION_BUCKETS[0]}"}} 1' in lines
+    assert 'phone_info_stage_duration_seconds_bucket{stage="validate",le="+Inf"} 3' in lines
+    assert 'phone_info_stage_duration_seconds_count{stage="validate"} 3' in lines
+    assert 'phone_info_cache_hits_total{cache="metadata"} 5' in lines
+    assert text.endswith('\n')
+
+
+def test_tool_stats_and_timings():
+    """Lookups feed tool.stats(), and results carry timings when requested"""
+    tool = PhoneInfoTool(quiet=True, record_timings=True)
+    results = [tool.lookup(number) for number in NUMBERS]
+
+    stats = tool.stats()
+    assert stats['stages']['validate']['count'] == 4
+    assert stats['stages']['validate']['errors'] == 1
+    assert stats['stages']['basic_info']['count'] == 3
+    assert stats['caches']['metadata']['misses'] >= 1
+    assert set(results[0].timings) == {'validate', 'total'} | set(RESULT_SECTIONS)
+    assert 'timings' in results[0].to_dict()
+    assert PhoneInfoTool(quiet=True).lookup(NUMBERS[0]).timings is None
+
+
+def test_worker_metrics_are_merged():
+    """Process-pool batches report the steps run in their workers"""
+    tool = PhoneInfoTool(quiet=True)
+    tool.analyze_batch(NUMBERS * 5, workers=2, chunksize=4)
+    assert tool.stats()['stages']['lookup']['count'] == 20
+
+
+def test_async_engine_records_lookups_like_lookup():
+    """Async runs report the same steps and per-result timings as lookup()"""
+    tool = PhoneInfoTool(quiet=True, record_timings=True)
+    results = asyncio.run(tool.analyze_many_async(NUMBERS))
+
+    stats = tool.stats()
+    assert stats['stages']['lookup']['count'] == 4
+    assert stats['stages']['lookup']['errors'] == 1
+    assert set(results[0].timings) == {'validate', 'total'} | set(RESULT_SECTIONS)
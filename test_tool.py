@@ -8,7 +8,13 @@ Email: SaudiLinuxy7@gmail.com
 """
 
 import sys
-from phone_info_tool import PhoneInfoTool
+from concurrent.futures import ThreadPoolExecutor
+import phonenumbers
+import pytest
+from phonenumbers import PhoneNumberType
+import phone_info_tool
+from phone_info_tool import PhoneInfoTool, NumberContext
+from geo_centroids import REGION_CENTROIDS, CentroidIndex
 
 # Test phone numbers from different countries
 TEST_NUMBERS = [
@@ -41,6 +47,122 @@ def test_phone_info_tool():
     
     print("\n===== TESTING COMPLETED =====\n")
 
+def test_analyze_batch_preserves_order():
+    """Bulk analysis returns the same results as single lookups, in input order"""
+    tool = PhoneInfoTool(quiet=True)
+
+    batch = tool.analyze_batch(TEST_NUMBERS, workers=2, chunksize=2)
+
+    assert len(batch) == len(TEST_NUMBERS)
+    for number, results in zip(TEST_NUMBERS, batch):
+        if tool.analyze_number(number):
+            assert results['basic_info'] == tool.results['basic_info']
+        else:
+            assert results is None
+
+def test_offline_geolocation_covers_all_regions():
+    """Every region supported by phonenumbers resolves without network geocoding"""
+    assert set(phonenumbers.SUPPORTED_REGIONS) <= set(REGION_CENTROIDS)
+
+    tool = PhoneInfoTool(quiet=True)
+    assert tool.geolocator is None
+    assert tool.analyze_number("+966 50 123 4567")
+    assert tool.results['geolocation']['coordinates'] == {"latitude": 25.0, "longitude": 45.0}
+
+    # Names come from the public geocoder API, including regions sharing a numbering plan
+    centroids = CentroidIndex()
+    assert centroids.lookup("Saudi Arabia") == REGION_CENTROIDS['SA']
+    assert centroids.lookup("Western Sahara") == REGION_CENTROIDS['EH']
+
+def test_lookup_is_reentrant():
+    """One tool serves concurrent lookups without sharing per-request state"""
+    tool = PhoneInfoTool(quiet=True)
+    numbers = TEST_NUMBERS * 20
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(tool.lookup, numbers))
+
+    assert tool.results == {} and tool.phone_number is None
+    for number, result in zip(numbers, results):
+        expected = tool.lookup(number)
+        assert result.phone_number == number
+        assert result.valid == expected.valid
+        assert result.basic_info == expected.basic_info
+
+    try:
+        results[0].valid = False
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("AnalysisResult should be immutable")
+
+def test_number_context_matches_phonenumbers():
+    """Shared intermediates agree with the phonenumbers functions they replace"""
+    tool = PhoneInfoTool(quiet=True)
+    for region in sorted(phonenumbers.SUPPORTED_REGIONS):
+        for number_type in (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE, PhoneNumberType.TOLL_FREE):
+            number = phonenumbers.example_number_for_type(region, number_type)
+            if number is None:
+                continue
+            for candidate in (number, phonenumbers.parse(f"+{number.country_code}{number.national_number}9")):
+                context = NumberContext(candidate, tool.metadata_cache)
+                assert context.number_type == phonenumbers.number_type(candidate)
+                assert context.is_valid == phonenumbers.is_valid_number(candidate)
+                assert context.region_code == phonenumbers.region_code_for_number(candidate)
+
+def test_analysis_classifies_number_once(monkeypatch):
+    """A full analysis determines the number type a single time"""
+    tool = PhoneInfoTool(quiet=True)
+    tool.lookup("+966 50 123 4567")
+
+    calls = []
+    original = phone_info_tool._number_type_helper
+    monkeypatch.setattr(phone_info_tool, '_number_type_helper', lambda *args: calls.append(args) or original(*args))
+    monkeypatch.setattr(phonenumbers, 'number_type', None)
+    monkeypatch.setattr(phonenumbers, 'is_valid_number', None)
+
+    result = tool.lookup("+966 50 765 4321")
+
+    assert result.basic_info['number_type'] == "MOBILE"
+    assert len(calls) == 1
+
+def test_normalize_number_variants():
+    """National, "00"-prefixed and international spellings share one E.164 form"""
+    tool = PhoneInfoTool(quiet=True, default_region='SA')
+    variants = ["+966 50 123 4567", "00966501234567", "050 123 4567", "(050) 123-4567"]
+
+    assert {tool.normalize_number(number) for number in variants} == {"+966501234567"}
+    assert tool.normalize_number("12345") is None
+    assert PhoneInfoTool(quiet=True).normalize_number("202-555-0143") == "+12025550143"
+
+def test_analyze_batch_dedupes_numbers():
+    """Duplicate spellings are analyzed once and share their results"""
+    tool = PhoneInfoTool(quiet=True, default_region='SA')
+    numbers = ["+966 50 123 4567", "12345", "0501234567", "+44 20 7946 0958", "00966501234567"]
+
+    results = tool.analyze_batch(numbers, workers=1, dedupe=True)
+
+    assert results[1] is None
+    assert results[0] is results[2] is results[4]
+    assert results[0]['basic_info'] == tool.lookup(numbers[0]).basic_info
+    assert results[3]['basic_info']['country_code'] == 44
+
+def test_selected_stages_skip_the_others():
+    """Only the selected stages run, in pipeline order, in workers too"""
+    tool = PhoneInfoTool(quiet=True, stages=['timezone', 'basic_info'])
+    assert [stage.section for stage in tool.stages] == ['basic_info', 'timezone_info']
+
+    result = tool.lookup("+966 50 123 4567")
+    assert result.basic_info['number_type'] == "MOBILE"
+    assert result.geolocation is None and result.online_databases is None
+    assert set(result.to_dict()) == {'basic_info', 'timezone_info'}
+    assert 'geolocation' not in tool.stats()['stages']
+
+    results = tool.analyze_batch(["+44 20 7946 0958", "12345"], workers=2, chunksize=1)
+    assert set(results[0]) == {'basic_info', 'timezone_info'} and results[1] is None
+    with pytest.raises(ValueError):
+        PhoneInfoTool(quiet=True, stages=['carrier'])
+
 if __name__ == "__main__":
     try:
         test_phone_info_tool()
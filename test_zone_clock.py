@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the timezone clock
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+"""
+
+from datetime import datetime, timezone
+
+import pytz
+
+import zone_clock
+from phone_info_tool import PhoneInfoTool
+from zone_clock import ZoneClock
+
+# 2024-01-15 12:00:00 UTC
+NOW = 1705320000
+
+
+def test_section_matches_pytz_formatting():
+    """Entries hold the local time and UTC offset of each zone at the snapshot"""
+    clock = ZoneClock(NOW)
+    section = clock.section(("Asia/Riyadh", "America/New_York"))
+    expected = datetime.fromtimestamp(NOW, timezone.utc).astimezone(pytz.timezone("America/New_York"))
+
+    assert section[0] == {'name': "Asia/Riyadh", 'current_time': "2024-01-15 15:00:00 +03+0300",
+                          'utc_offset': "+03:00"}
+    assert section[1]['current_time'] == expected.strftime('%Y-%m-%d %H:%M:%S %Z%z')
+    assert section[1]['utc_offset'] == "-05:00"
+    assert clock.section(())[0]['current_time'] == "Unknown"
+    assert clock.section(("Etc/Unknown",))[0]['utc_offset'] == "Unknown"
+
+
+def test_zones_are_formatted_once_per_snapshot(monkeypatch):
+    """Repeated zone sets reuse their formatted entries; returned sections are copies"""
+    clock = ZoneClock(NOW)
+    calls = []
+    original = ZoneClock._entry
+    monkeypatch.setattr(ZoneClock, '_entry', staticmethod(lambda now, name: calls.append(name) or original(now, name)))
+
+    first = clock.section(["Asia/Riyadh"])
+    first[0]['name'] = "changed"
+    assert clock.section(["Asia/Riyadh"])[0]['name'] == "Asia/Riyadh"
+    assert calls == ["Asia/Riyadh"]
+    assert zone_clock.zone("Asia/Riyadh") is zone_clock.zone("Asia/Riyadh")
+
+
+def test_batch_shares_one_snapshot():
+    """Every number of a batch reports the same instant"""
+    tool = PhoneInfoTool(quiet=True)
+    numbers = ["+966 50 123 4567", "+966 11 234 5678"] * 50
+
+    times = {results['timezone_info'][0]['current_time']
+             for results in tool.analyze_batch(numbers, workers=2, chunksize=10)}
+    assert len(times) == 1
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Timezone clock for the Phone Information Gathering Tool
+Developed by: Saudi Linux
+Email: SaudiLinuxy7@gmail.com
+
+Formats the current time of timezones from a single clock snapshot, so every
+number of a batch reports the same instant and each distinct zone (or set of
+zones) is looked up and formatted once instead of once per number.
+"""
+
+import time
+import threading
+from datetime import datetime, timezone
+
+import pytz
+
+# Format of the current local time of a zone
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S %Z%z'
+
+# Section reported for numbers without any known timezone
+UNKNOWN_TIME_ZONES = ({"name": "Unknown", "current_time": "Unknown", "utc_offset": "Unknown"},)
+
+# pytz zone objects by name, shared by every clock
+_zones = {}
+_zones_lock = threading.Lock()
+
+
+def zone(name):
+    """Return the cached pytz timezone of a zone name"""
+    tz = _zones.get(name)
+    if tz is None:
+        with _zones_lock:
+            tz = _zones.setdefault(name, pytz.timezone(name))
+    return tz
+
+
+def format_utc_offset(local_time):
+    """Format the UTC offset of an aware datetime as "+03:00\""""
+    minutes = int(local_time.utcoffset().total_seconds()) // 60
+    sign = '-' if minutes < 0 else '+'
+    return f"{sign}{abs(minutes) // 60:02d}:{abs(minutes) % 60:02d}"
+
+
+class ZoneClock:
+    """Current local times of timezones, formatted once per clock snapshot
+
+    A frozen clock keeps the instant it was created with (or ``now``), which
+    batches use so all their results share one snapshot. An unfrozen clock
+    takes a new snapshot whenever the wall-clock second changes, which keeps
+    single lookups current while reusing formatted values within a second.
+    """
+
+    def __init__(self, now=None, frozen=False):
+        """Create a clock, frozen at ``now`` (default: the current time) if ``frozen``"""
+        self.frozen = frozen or now is not None
+        # (second, snapshot datetime, formatted sections), replaced as a whole
+        # so threads sharing the clock always see a consistent snapshot
+        self._state = (None, None, {})
+        if self.frozen:
+            self._snapshot(now if now is not None else time.time())
+
+    @classmethod
+    def snapshot(cls):
+        """Return a clock frozen at the current time"""
+        return cls(frozen=True)
+
+    @property
+    def now(self):
+        """The snapshot instant as a POSIX timestamp"""
+        return self._refresh()[1].timestamp()
+
+    def _snapshot(self, timestamp):
+        """Move the snapshot to ``timestamp``, discarding the formatted values"""
+        self._state = (int(timestamp), datetime.fromtimestamp(timestamp, timezone.utc), {})
+        return self._state
+
+    def _refresh(self):
+        """Return the current state, taking a new snapshot if a running clock's second has changed"""
+        state = self._state
+        if not self.frozen:
+            second = int(time.time())
+            if second != state[0]:
+                state = self._snapshot(second)
+        return state
+
+    def section(self, time_zones):
+        """Return the timezone_info section of a number with the given zone names
+
+        Numbers sharing a set of zones share one formatting; the returned list
+        and its entries are copies, so callers may modify them.
+        """
+        _, now, sections = self._refresh()
+        key = tuple(time_zones)
+        entries = sections.get(key)
+        if entries is None:
+            entries = tuple(self._entry(now, name) for name in key) or UNKNOWN_TIME_ZONES
+            sections[key] = entries
+        return [dict(entry) for entry in entries]
+
+    @staticmethod
+    def _entry(now, name):
+        """Format the timezone_info entry of one zone at the instant ``now``"""
+        try:
+            local_time = now.astimezone(zone(name))
+        except pytz.UnknownTimeZoneError:
+            # e.g. phonenumbers' "Etc/Unknown" placeholder
+            return {'name': name, 'current_time': "Unknown", 'utc_offset': "Unknown"}
+        return {
+            'name': name,
+            'current_time': local_time.strftime(TIME_FORMAT),
+            'utc_offset': format_utc_offset(local_time)
+        }